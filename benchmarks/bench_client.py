@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the per-call latency of requests sent without a connection pool (the behaviour before
+`pycamunda.client.Client` existed) with requests sent over a pooled keep-alive client.
+
+Run with `python -m benchmarks.bench_client`.
+"""
+
+import time
+import unittest.mock
+
+import requests
+
+import pycamunda.client
+import pycamunda.processinst
+from benchmarks import stub_engine
+
+N_CALLS = 1000
+
+
+def _unpooled_request(self, method, url, auth=None, **kwargs):
+    return requests.request(method=method, url=url, auth=auth, **kwargs)
+
+
+def measure(engine_url: str, client: pycamunda.client.Client) -> float:
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    get_instances.client = client
+    get_instances()  # warm up
+    start = time.perf_counter()
+    for _ in range(N_CALLS):
+        get_instances()
+    return (time.perf_counter() - start) / N_CALLS
+
+
+def main():
+    with stub_engine.running() as engine:
+        client = pycamunda.client.Client()
+        with unittest.mock.patch.object(pycamunda.client.Client, 'request', _unpooled_request):
+            unpooled = measure(engine.url, client)
+        pooled = measure(engine.url, client)
+
+    print(f'new connection per call: {unpooled * 1e6:8.1f} us/call')
+    print(f'pooled keep-alive client: {pooled * 1e6:8.1f} us/call')
+    print(f'speedup: {unpooled / pooled:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Compare building columns from a list of tasks by loading the tasks and taking them apart
+with decoding the list into columns directly, and parsing a datetime column one value at a time
+with parsing it in bulk.
+
+Run with `python -m benchmarks.bench_columnar`.
+"""
+
+import dataclasses
+import datetime as dt
+import time
+
+import numpy
+
+import pycamunda.base
+import pycamunda.columnar
+import pycamunda.task
+from benchmarks import sample_data
+
+N_TASKS = 50000
+
+
+def via_dataclasses(rows):
+    tasks = [pycamunda.task.Task.load(row) for row in rows]
+    return {
+        field.name: [getattr(task, field.name) for task in tasks]
+        for field in dataclasses.fields(pycamunda.task.Task)
+    }
+
+
+def via_columns(rows):
+    return pycamunda.columnar.load_columns(pycamunda.task._TaskView, rows)
+
+
+def one_by_one(values):
+    return [pycamunda.base.from_isoformat(value) for value in values]
+
+
+def one_by_one_numpy(values):
+    return numpy.array([
+        datetime_.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        for datetime_ in one_by_one(values)
+    ], dtype='datetime64[ms]')
+
+
+def measure(rows, function) -> float:
+    start = time.perf_counter()
+    function(rows)
+    return time.perf_counter() - start
+
+
+def main():
+    rows = sample_data.tasks(N_TASKS)
+    assert via_dataclasses(rows) == via_columns(rows)
+    dataclass_time = min(measure(rows, via_dataclasses) for _ in range(3))
+    columns_time = min(measure(rows, via_columns) for _ in range(3))
+
+    print(f'columns of {N_TASKS} tasks via data classes: {dataclass_time * 1e3:8.1f} ms')
+    print(f'columns of {N_TASKS} tasks decoded directly: {columns_time * 1e3:8.1f} ms')
+    print(f'speedup: {dataclass_time / columns_time:.2f}x')
+
+    values = [row['created'] for row in rows]
+    for label, single, bulk in (
+        ('datetimes', one_by_one, pycamunda.columnar.from_isoformat_many),
+        ('datetime64', one_by_one_numpy, pycamunda.columnar._datetime64_many)
+    ):
+        single_time = min(measure(values, single) for _ in range(3))
+        bulk_time = min(measure(values, bulk) for _ in range(3))
+        print(
+            f'{N_TASKS} {label:10} one by one: {single_time * 1e3:8.1f} ms, '
+            f'in bulk: {bulk_time * 1e3:8.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
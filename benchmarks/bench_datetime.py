@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Compare loading a list of tasks using the datetime codec of `pycamunda.base` with loading it
+using `strptime`, which was used before.
+
+Run with `python -m benchmarks.bench_datetime`.
+"""
+
+import datetime as dt
+import time
+import unittest.mock
+
+import pycamunda.base
+import pycamunda.task
+from benchmarks import sample_data
+
+N_TASKS = 10000
+
+
+def strptime_from_isoformat(datetime_str):
+    return dt.datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+def measure(rows) -> float:
+    start = time.perf_counter()
+    tuple(pycamunda.task.Task.load(row) for row in rows)
+    return time.perf_counter() - start
+
+
+def main():
+    rows = sample_data.tasks(N_TASKS)
+    with unittest.mock.patch('pycamunda.base.from_isoformat', strptime_from_isoformat):
+        strptime_time = min(measure(rows) for _ in range(5))
+    codec_time = min(measure(rows) for _ in range(5))
+
+    print(f'load {N_TASKS} tasks with strptime: {strptime_time * 1e3:8.1f} ms')
+    print(f'load {N_TASKS} tasks with codec:    {codec_time * 1e3:8.1f} ms')
+    print(f'speedup: {strptime_time / codec_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the peak memory of reading a large binary variable into memory with streaming it to a
+file.
+
+Run with `python -m benchmarks.bench_download`.
+"""
+
+import contextlib
+import http.server
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import pycamunda.processinst
+
+SIZE_MB = 200
+_CHUNK = b'\0' * 1024 * 1024
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(SIZE_MB * len(_CHUNK)))
+        self.end_headers()
+        for _ in range(SIZE_MB):
+            self.wfile.write(_CHUNK)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serving():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/engine-rest'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def measure(load) -> tuple:
+    """Return the peak of traced memory in MB and the elapsed seconds of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2 ** 20, elapsed
+
+
+def main():
+    with serving() as url, tempfile.TemporaryDirectory() as directory:
+        get = pycamunda.processinst.VariablesGet(url, 'anId', 'aDocument', binary=True)
+        path = os.path.join(directory, 'aDocument')
+        buffered = measure(get)
+        streamed = measure(lambda: get.download(path))
+
+    print(f'{SIZE_MB} MB binary variable')
+    print(f'read into memory:  peak {buffered[0]:8.1f} MB  {buffered[1]:6.2f} s')
+    print(f'streamed to file:  peak {streamed[0]:8.1f} MB  {streamed[1]:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
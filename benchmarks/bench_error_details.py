@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""Compare listing failing external tasks with their error details requested one after another
+(the behaviour before error details were requested concurrently and cached) with the current
+`pycamunda.externaltask.GetList`.
+
+Run with `python -m benchmarks.bench_error_details`.
+"""
+
+import time
+
+import pycamunda.base
+import pycamunda.client
+import pycamunda.externaltask
+from benchmarks import sample_data, stub_engine
+
+N_TASKS = 500
+N_FAILED = 400
+# Simulated processing time of the engine for an error details request.
+DETAILS_SECONDS = 0.002
+
+
+def tasks_json():
+    tasks = sample_data.external_tasks(N_TASKS)
+    for task in tasks[:N_FAILED]:
+        task['retries'] = 2
+        task['errorMessage'] = 'Connection refused'
+    return tasks
+
+
+def error_details(body):
+    time.sleep(DETAILS_SECONDS)
+    return 'Traceback (most recent call last): ...'
+
+
+def sequential(url: str, client: pycamunda.client.Client) -> None:
+    get_tasks = pycamunda.externaltask.GetList(url, request_error_details=False)
+    get_tasks.client = client
+    for external_task in get_tasks():
+        external_task.error_details = get_tasks._send(
+            method=pycamunda.base.RequestMethod.GET.value,
+            url=get_tasks.url + f'/{external_task.id_}/errorDetails'
+        ).text
+
+
+def concurrent(url: str, client: pycamunda.client.Client) -> None:
+    get_tasks = pycamunda.externaltask.GetList(url)
+    get_tasks.client = client
+    get_tasks()
+
+
+def measure(run, url: str, client: pycamunda.client.Client) -> float:
+    start = time.perf_counter()
+    run(url, client)
+    return time.perf_counter() - start
+
+
+def main():
+    routes = {
+        '/engine-rest/external-task': tasks_json(),
+        '/engine-rest/external-task/*/errorDetails': error_details
+    }
+    with stub_engine.running(routes) as engine:
+        client = pycamunda.client.Client(pool_maxsize=10)
+        before = measure(sequential, engine.url, client)
+        cold = measure(concurrent, engine.url, client)
+        warm = measure(concurrent, engine.url, client)
+
+    print(f'{N_TASKS} external tasks, {N_FAILED} failed')
+    print(f'sequential error details:     {before * 1000:8.1f} ms')
+    print(f'concurrent error details:     {cold * 1000:8.1f} ms ({before / cold:.2f}x)')
+    print(f'cached error details:         {warm * 1000:8.1f} ms ({before / warm:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
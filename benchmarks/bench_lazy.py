@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Compare loading a list of tasks fully with loading it as lazy views when only two
+attributes of each task are read.
+
+The memory is measured from decoding the body of the response on, so it includes the decoded
+json rows. Peak memory is the maximum while the tasks are loaded and read. Retained memory is
+what is still allocated when only the tasks are kept: loaded tasks no longer need the rows,
+but each view keeps its row alive.
+
+Run with `python -m benchmarks.bench_lazy`.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+
+import pycamunda.task
+from benchmarks import sample_data
+
+N_TASKS = 10000
+
+
+def touch(tasks) -> None:
+    for task in tasks:
+        task.id_, task.created
+
+
+def load_all(body, load):
+    return tuple(load(row) for row in json.loads(body))
+
+
+def measure(body, load) -> float:
+    start = time.perf_counter()
+    touch(load_all(body, load))
+    return time.perf_counter() - start
+
+
+def memory(body, load):
+    gc.collect()
+    tracemalloc.start()
+    tasks = load_all(body, load)
+    touch(tasks)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, retained
+
+
+def main():
+    body = json.dumps(sample_data.tasks(N_TASKS)).encode()
+    for label, load in (
+        ('eagerly', pycamunda.task.Task.load), ('lazily', pycamunda.task._TaskView)
+    ):
+        seconds = min(measure(body, load) for _ in range(5))
+        peak, retained = memory(body, load)
+        print(
+            f'load {N_TASKS} tasks {label:8} {seconds * 1e3:8.1f} ms, '
+            f'peak {peak / 2**20:6.2f} MiB, retained {retained / 2**20:6.2f} MiB'
+        )
+
+
+if __name__ == '__main__':
+    main()
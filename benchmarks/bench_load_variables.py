@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""Compare loading the variables of many process instances with a request per process instance
+and with `variable.load_variables`.
+
+Run with `python -m benchmarks.bench_load_variables`.
+"""
+
+import contextlib
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+
+import pycamunda.client
+import pycamunda.processinst
+import pycamunda.variable
+
+N_INSTANCES = 5000
+N_VARIABLES = 5
+
+
+def variable_json(instance_id, index):
+    return {
+        'id': f'{instance_id}-{index}', 'name': f'var{index}', 'type': 'String',
+        'value': 'aValue', 'valueInfo': {}, 'processInstanceId': instance_id,
+        'executionId': instance_id, 'caseInstanceId': None, 'caseExecutionId': None,
+        'taskId': None, 'activityInstanceId': instance_id, 'tenantId': None, 'errorMessage': None
+    }
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        path, _, query = self.path.partition('?')
+        if path.endswith('/variable-instance'):
+            params = urllib.parse.parse_qs(query)
+            ids = params['executionIdIn'][0].split(',')
+            first = int(params['firstResult'][0])
+            payload = [variable_json(id_, i) for id_ in ids for i in range(N_VARIABLES)]
+            payload = payload[first:first + int(params['maxResults'][0])]
+        else:
+            payload = {
+                f'var{i}': {'value': 'aValue', 'type': 'String', 'valueInfo': {}}
+                for i in range(N_VARIABLES)
+            }
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serving():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/engine-rest'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def per_instance(url, ids, client):
+    variables = {}
+    for id_ in ids:
+        get_variables = pycamunda.processinst.VariablesGetList(url, process_instance_id=id_)
+        get_variables.client = client
+        variables[id_] = get_variables()
+    return variables
+
+
+def bulk(url, ids, client):
+    return pycamunda.variable.load_variables(url, ids, client=client)
+
+
+def main():
+    ids = [f'{i:08x}-0000-0000-0000-000000000000' for i in range(N_INSTANCES)]
+    with serving() as url, pycamunda.client.Client() as client:
+        for name, load in (('request per instance', per_instance), ('load_variables', bulk)):
+            start = time.perf_counter()
+            variables = load(url, ids, client)
+            elapsed = time.perf_counter() - start
+            assert len(variables) == N_INSTANCES
+            assert all(len(instance) == N_VARIABLES for instance in variables.values())
+            print(f'{name:22} {elapsed * 1000:8.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Report the memory held per loaded result for the data classes without slots, which were used
+before, with slots and with slots and string interning.
+
+Run with `python -m benchmarks.bench_memory`.
+"""
+
+import dataclasses
+import gc
+import json
+import tracemalloc
+
+import pycamunda.base
+import pycamunda.externaltask
+import pycamunda.processinst
+import pycamunda.task
+from benchmarks import sample_data
+
+N_RECORDS = 20000
+
+
+def without_slots(cls):
+    """Create the equivalent data class with a `__dict__` and a loader for it."""
+    legacy = dataclasses.make_dataclass(
+        cls.__name__,
+        [(field.name, field.type, dataclasses.field(default=None)) for field in
+         dataclasses.fields(cls)]
+    )
+    names = [field.name for field in dataclasses.fields(cls)]
+
+    def load(data):
+        result = cls.load(data)
+        return legacy(**{name: getattr(result, name) for name in names})
+
+    return load
+
+
+def bytes_per_record(payload: str, load) -> float:
+    gc.collect()
+    tracemalloc.start()
+    results = [load(data) for data in json.loads(payload)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(results)
+
+
+def main():
+    samples = [
+        (pycamunda.task.Task, sample_data.tasks(N_RECORDS)),
+        (pycamunda.processinst.ProcessInstance, sample_data.process_instances(N_RECORDS)),
+        (pycamunda.externaltask.ExternalTask, sample_data.external_tasks(N_RECORDS)),
+    ]
+    print(f'{"bytes per record":20} {"before":>8} {"slots":>8} {"interned":>8}')
+    for cls, rows in samples:
+        payload = json.dumps(rows)
+        before = bytes_per_record(payload, without_slots(cls))
+        slots = bytes_per_record(payload, cls.load)
+        pycamunda.base.set_string_interning(True)
+        try:
+            interned = bytes_per_record(payload, cls.load)
+        finally:
+            pycamunda.base.set_string_interning(False)
+        print(f'{cls.__name__:20} {before:8.0f} {slots:8.0f} {interned:8.0f}')
+
+
+if __name__ == '__main__':
+    main()
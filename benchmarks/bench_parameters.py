@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the serialization of request parameters using the plans compiled by
+`pycamunda.request.RequestMeta` with the previous implementation that scanned all parameters of
+a request class on each call.
+
+Run with `python -m benchmarks.bench_parameters`.
+"""
+
+import timeit
+
+import pycamunda.base
+import pycamunda.filter
+import pycamunda.request
+import pycamunda.task
+from pycamunda.request import QueryParameter, BodyParameter, BodyParameterContainer
+
+N_CALLS = 20000
+
+
+def legacy_query_parameters(request, apply=pycamunda.base.query_prepare):
+    query = {}
+    for name, attribute in request._parameters.items():
+        if isinstance(attribute, QueryParameter):
+            try:
+                value = getattr(request, attribute.name)
+            except KeyError:
+                pass
+            else:
+                if value is not None:
+                    query[attribute.key] = value
+    return {key: apply(value) for key, value in query.items()}
+
+
+def legacy_traverse(request, container):
+    query = {}
+    for key, val in container.parameters.items():
+        if isinstance(val, BodyParameterContainer):
+            query[key] = legacy_traverse(request, val)
+        else:
+            try:
+                value = getattr(request, val.name)
+            except KeyError:
+                pass
+            except AttributeError:
+                if val is not None:
+                    query[key] = val
+            else:
+                if value is not None:
+                    query[key] = value
+    return query
+
+
+def legacy_body_parameters(request, apply=pycamunda.base.prepare):
+    query = {}
+    for name, attribute in request._containers.items():
+        if isinstance(attribute, BodyParameterContainer):
+            query[attribute.key] = legacy_traverse(request, attribute)
+    for name, attribute in request._parameters.items():
+        if isinstance(attribute, BodyParameter) and not attribute.hidden:
+            try:
+                value = getattr(request, attribute.name)
+            except KeyError:
+                pass
+            else:
+                if value is not None:
+                    query[attribute.key] = value
+    return {key: apply(value) for key, value in query.items()}
+
+
+def compare(label, legacy, compiled):
+    assert legacy() == compiled()
+    legacy_time = timeit.timeit(legacy, number=N_CALLS) / N_CALLS
+    compiled_time = timeit.timeit(compiled, number=N_CALLS) / N_CALLS
+    print(
+        f'{label:<32} legacy {legacy_time * 1e6:7.2f} us  compiled {compiled_time * 1e6:7.2f} us'
+        f'  speedup {legacy_time / compiled_time:.2f}x'
+    )
+
+
+def main():
+    url = 'http://localhost/engine-rest'
+
+    get_tasks = pycamunda.task.GetList(
+        url, process_instance_id='anId', assignee='aUser', active=True, sort_by='name'
+    )
+    compare(
+        'task.GetList.query_parameters',
+        lambda: legacy_query_parameters(get_tasks),
+        get_tasks.query_parameters
+    )
+
+    create_filter = pycamunda.filter.Create(url, name='aFilter', owner='aUser')
+    create_filter.add_process_instance_criteria(id_='anId')
+    create_filter.add_user_criteria(assignee='aUser')
+    compare(
+        'filter.Create.body_parameters',
+        lambda: legacy_body_parameters(create_filter),
+        create_filter.body_parameters
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the body of a variable modification that sends all loaded variables back with the
+body of one built by `variable.TrackedVariables` when a handler changes a few variables.
+
+Run with `python -m benchmarks.bench_tracked_variables`.
+"""
+
+import json
+import time
+
+import pycamunda.processinst
+import pycamunda.variable
+
+URL = 'http://localhost:8080/engine-rest'
+N_VARIABLES = 50
+N_CHANGED = 3
+N_ROUNDS = 200
+
+
+def loaded_variables():
+    document = json.dumps({
+        'items': [{'sku': f'sku{i}', 'quantity': i, 'price': i * 1.5} for i in range(200)]
+    })
+    return {
+        f'var{i}': pycamunda.variable.Variable(value=document, type_='Json', value_info={})
+        for i in range(N_VARIABLES)
+    }
+
+
+def handle(variables):
+    for i in range(N_CHANGED):
+        variables[f'var{i}'].value = json.dumps({'changed': i})
+
+
+def send_all():
+    variables = loaded_variables()
+    handle(variables)
+    modify = pycamunda.processinst.VariablesModify(URL, 'anId')
+    for name, variable in variables.items():
+        modify.add_variable(name, variable.value, variable.type_, variable.value_info)
+    return json.dumps(modify.body_parameters())
+
+
+def send_changed():
+    variables = pycamunda.variable.TrackedVariables(loaded_variables())
+    handle(variables)
+    modify = variables.apply_to(pycamunda.processinst.VariablesModify(URL, 'anId'))
+    return json.dumps(modify.body_parameters())
+
+
+def measure(function):
+    start = time.perf_counter()
+    for _ in range(N_ROUNDS):
+        body = function()
+    return (time.perf_counter() - start) / N_ROUNDS, len(body)
+
+
+def main():
+    for label, function in (('all variables', send_all), ('changed only', send_changed)):
+        seconds, size = measure(function)
+        print(f'{label:14} {size / 1024:9.1f} KiB body, {seconds * 1e3:6.2f} ms per request')
+
+
+if __name__ == '__main__':
+    main()
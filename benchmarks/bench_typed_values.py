@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""Compare decoding all Json, Object and Date variables of wide variable maps up front with
+decoding them on first access when a handler reads only a few of them, and the json module with
+orjson as the json backend.
+
+Run with `python -m benchmarks.bench_typed_values`.
+"""
+
+import json
+import time
+import unittest.mock
+
+import pycamunda.base
+import pycamunda.variable
+
+N_MAPS = 1000
+N_VARIABLES = 50
+N_READ = 3
+
+
+def variable_map():
+    document = json.dumps({
+        'customer': {'id': 12345, 'name': 'aName', 'tags': ['a', 'b', 'c']},
+        'items': [{'sku': f'sku{i}', 'quantity': i, 'price': i * 1.5} for i in range(20)]
+    })
+    variables = {}
+    for i in range(N_VARIABLES):
+        if i % 3 == 0:
+            variables[f'var{i}'] = {'value': document, 'type': 'Json', 'valueInfo': {}}
+        elif i % 3 == 1:
+            variables[f'var{i}'] = {
+                'value': document, 'type': 'Object',
+                'valueInfo': {
+                    'objectTypeName': 'java.util.HashMap',
+                    'serializationDataFormat': 'application/json'
+                }
+            }
+        else:
+            variables[f'var{i}'] = {
+                'value': '2021-01-01T10:00:00.000+0100', 'type': 'Date', 'valueInfo': {}
+            }
+    return variables
+
+
+def eager(maps):
+    for variables in maps:
+        decoded = {
+            name: pycamunda.variable._decode(
+                data['value'], data['type'], data['valueInfo']
+            )
+            for name, data in variables.items()
+        }
+        for i in range(N_READ):
+            decoded[f'var{i}']
+
+
+def lazy(maps):
+    for variables in maps:
+        loaded = {
+            name: pycamunda.variable.Variable.load(data) for name, data in variables.items()
+        }
+        for i in range(N_READ):
+            loaded[f'var{i}'].typed_value
+
+
+def measure(function, maps) -> float:
+    start = time.perf_counter()
+    function(maps)
+    return time.perf_counter() - start
+
+
+def main():
+    maps = [variable_map() for _ in range(N_MAPS)]
+    backends = [('json', None)]
+    if pycamunda.variable.orjson is not None:
+        backends.append(('orjson', pycamunda.variable.orjson))
+    for backend, module in backends:
+        with unittest.mock.patch('pycamunda.variable.orjson', module):
+            eager_time = min(measure(eager, maps) for _ in range(3))
+            lazy_time = min(measure(lazy, maps) for _ in range(3))
+        print(
+            f'{backend:6} decode all {N_VARIABLES} variables: {eager_time * 1e3:8.1f} ms, '
+            f'decode {N_READ} on access: {lazy_time * 1e3:8.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the peak RSS of uploading binary variables of growing size after reading the file
+into memory, like it had to be done before, with streaming a path, a file object or a memory
+map of the file. Each upload runs in a new process, so the peaks do not influence each other.
+
+Run with `python -m benchmarks.bench_upload`.
+"""
+
+import contextlib
+import http.server
+import mmap
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+
+import requests
+
+import pycamunda.processinst
+
+SIZES_MB = (64, 128, 256)
+MODES = ('read into memory', 'path', 'file object', 'mmap')
+_READ_SIZE = 64 * 1024
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                size = int(self.rfile.readline(), 16)
+                self._discard(size + 2)
+                if not size:
+                    break
+        else:
+            self._discard(int(self.headers['Content-Length']))
+        self.send_response(204)
+        self.end_headers()
+
+    def _discard(self, size):
+        while size:
+            size -= len(self.rfile.read(min(size, _READ_SIZE)))
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serving():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/engine-rest'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def upload(mode: str, size_mb: int) -> None:
+    with tempfile.TemporaryDirectory() as directory, serving() as url:
+        path = pathlib.Path(directory) / 'document.pdf'
+        with open(path, 'wb') as file:
+            for _ in range(size_mb):
+                file.write(b'\0' * 2 ** 20)
+        if mode == 'read into memory':
+            content = path.read_bytes()
+            response = requests.post(
+                url + '/process-instance/anId/variables/aVar/data', files={'data': content}
+            )
+            response.raise_for_status()
+            return
+
+        def update(value):
+            pycamunda.processinst.VariablesUpdate(url, 'anId', 'aVar', value, type_='File')()
+
+        if mode == 'path':
+            update(path)
+        elif mode == 'file object':
+            with open(path, 'rb') as file:
+                update(file)
+        else:
+            with open(path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                update(mapped)
+
+
+def peak_rss_mb(mode: str, size_mb: int) -> float:
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_upload', mode, str(size_mb)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return float(output)
+
+
+def main():
+    if len(sys.argv) == 3:
+        upload(sys.argv[1], int(sys.argv[2]))
+        print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+        return
+    print('peak RSS in MB by file size')
+    print(f'{"":18}' + ''.join(f'{size:>8} MB' for size in SIZES_MB))
+    for mode in MODES:
+        peaks = [peak_rss_mb(mode, size) for size in SIZES_MB]
+        print(f'{mode:18}' + ''.join(f'{peak:11.1f}' for peak in peaks))
+
+
+if __name__ == '__main__':
+    main()
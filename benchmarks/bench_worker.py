@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the throughput of a hand written single threaded polling loop with the worker
+runtimes for handlers that wait on I/O.
+
+Run with `python -m benchmarks.bench_worker`.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import pycamunda.client
+import pycamunda.externaltask
+import pycamunda.worker
+from benchmarks import sample_data, stub_engine
+
+N_TASKS = 400
+HANDLER_SECONDS = 0.005
+# Simulated network round trip of a completion for a remote engine.
+COMPLETE_SECONDS = 0.01
+
+
+class Tasks:
+    """Serves `N_TASKS` external tasks to fetch requests and counts completions."""
+
+    def __init__(self, complete_seconds: float = 0.0):
+        self.rows = iter(sample_data.external_tasks(N_TASKS))
+        self.complete_seconds = complete_seconds
+        self.completed = 0
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def fetch(self, body):
+        with self.lock:
+            return list(itertools.islice(self.rows, body['maxTasks']))
+
+    def complete(self, body):
+        time.sleep(self.complete_seconds)
+        with self.lock:
+            self.completed += 1
+            if self.completed == N_TASKS:
+                self.done.set()
+        return None
+
+    def routes(self):
+        return {
+            '/engine-rest/external-task/fetchAndLock': self.fetch,
+            '/engine-rest/external-task/*/complete': self.complete
+        }
+
+
+def handler(task):
+    time.sleep(HANDLER_SECONDS)
+    return {'handled': True}
+
+
+async def async_handler(task):
+    await asyncio.sleep(HANDLER_SECONDS)
+    return {'handled': True}
+
+
+def polling_loop(url: str, tasks: Tasks) -> None:
+    client = pycamunda.client.Client()
+    while not tasks.done.is_set():
+        fetch_and_lock = pycamunda.externaltask.FetchAndLock(url, 'worker', max_tasks=10)
+        fetch_and_lock.add_topic('invoice', lock_duration=30000)
+        fetch_and_lock.client = client
+        for task in fetch_and_lock():
+            complete = pycamunda.externaltask.Complete(url, id_=task.id_, worker_id='worker')
+            for name, value in handler(task).items():
+                complete.add_variable(name, value)
+            complete.client = client
+            complete()
+
+
+def worker_runtime(url: str, tasks: Tasks) -> None:
+    worker = pycamunda.worker.Worker(url, 'worker', max_workers=32)
+    worker.subscribe('invoice', handler)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    tasks.done.wait()
+    worker.stop()
+    thread.join()
+
+
+def async_worker_runtime(url: str, tasks: Tasks) -> None:
+    async def run():
+        worker = pycamunda.worker.AsyncWorker(url, 'worker', max_concurrency=100)
+        worker.subscribe('invoice', async_handler)
+        running = asyncio.ensure_future(worker.run())
+        while not tasks.done.is_set():
+            await asyncio.sleep(0.001)
+        worker.stop()
+        await running
+
+    asyncio.run(run())
+
+
+def measure(run, complete_seconds: float = 0.0) -> float:
+    tasks = Tasks(complete_seconds)
+    with stub_engine.running(tasks.routes()) as engine:
+        start = time.perf_counter()
+        run(engine.url, tasks)
+        return N_TASKS / (time.perf_counter() - start)
+
+
+def main():
+    loop_throughput = measure(polling_loop)
+    worker_throughput = measure(worker_runtime)
+    async_worker_throughput = measure(async_worker_runtime)
+    remote_throughput = measure(worker_runtime, COMPLETE_SECONDS)
+
+    print(f'single threaded polling loop: {loop_throughput:8.1f} tasks/s')
+    print(f'worker with 32 threads:       {worker_throughput:8.1f} tasks/s')
+    print(f'async worker with 100 tasks:  {async_worker_throughput:8.1f} tasks/s')
+    print(f'speedup: {worker_throughput / loop_throughput:.2f}x (threads), '
+          f'{async_worker_throughput / loop_throughput:.2f}x (asyncio)')
+    print(f'worker with {COMPLETE_SECONDS * 1000:.0f} ms completion round trip: '
+          f'{remote_throughput:8.1f} tasks/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the throughput of the worker for a CPU-bound handler that runs in threads with the
+same handler running in a pool of processes. The speedup is bounded by the number of CPUs.
+
+Run with `python -m benchmarks.bench_worker_cpu`.
+"""
+
+import os
+import threading
+import time
+
+import pycamunda.worker
+from benchmarks import stub_engine
+from benchmarks.bench_worker import Tasks
+
+N_TASKS = 400
+
+
+def cpu_handler(task):
+    total = 0
+    for i in range(200000):
+        total += i * i
+    return {'total': total}
+
+
+def measure(use_processes: bool) -> float:
+    tasks = Tasks()
+    with stub_engine.running(tasks.routes()) as engine:
+        worker = pycamunda.worker.Worker(engine.url, 'worker', max_workers=os.cpu_count() * 2)
+        worker.subscribe('invoice', cpu_handler, use_processes=use_processes)
+        start = time.perf_counter()
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        tasks.done.wait()
+        worker.stop()
+        thread.join()
+        return N_TASKS / (time.perf_counter() - start)
+
+
+def main():
+    threads = measure(use_processes=False)
+    processes = measure(use_processes=True)
+
+    print(f'{os.cpu_count()} CPUs')
+    print(f'handlers in threads:   {threads:8.1f} tasks/s')
+    print(f'handlers in processes: {processes:8.1f} tasks/s')
+    print(f'speedup: {processes / threads:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""Generators of JSON rows as returned by list endpoints of the Camunda REST api."""
+
+import datetime as dt
+import random
+import typing
+
+_START = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _timestamp(rng: random.Random) -> str:
+    datetime_ = _START + dt.timedelta(
+        seconds=rng.randint(0, 10 ** 8), milliseconds=rng.randint(0, 999)
+    )
+    return datetime_.strftime('%Y-%m-%dT%H:%M:%S.') + f'{datetime_.microsecond // 1000:03d}+0000'
+
+
+def tasks(n: int, seed: int = 0) -> typing.List[typing.Dict[str, typing.Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            'assignee': f'user{rng.randint(0, 50)}',
+            'caseDefinitionId': None,
+            'caseExecutionId': None,
+            'caseInstanceId': None,
+            'delegationState': None,
+            'description': None,
+            'executionId': f'execution-{i}',
+            'formKey': None,
+            'id': f'task-{i}',
+            'name': 'Review document',
+            'owner': None,
+            'parentTaskId': None,
+            'priority': 50,
+            'processDefinitionId': f'review:{rng.randint(1, 5)}:definition',
+            'processInstanceId': f'instance-{i}',
+            'suspended': False,
+            'taskDefinitionKey': 'review',
+            'tenantId': 'tenant',
+            'created': _timestamp(rng),
+            'due': _timestamp(rng),
+            'followUp': _timestamp(rng)
+        }
+        for i in range(n)
+    ]
+
+
+def process_instances(n: int, seed: int = 0) -> typing.List[typing.Dict[str, typing.Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            'id': f'instance-{i}',
+            'definitionId': f'review:{rng.randint(1, 5)}:definition',
+            'businessKey': f'order-{i}',
+            'caseInstanceId': None,
+            'tenantId': 'tenant',
+            'suspended': False,
+            'ended': False,
+            'links': []
+        }
+        for i in range(n)
+    ]
+
+
+def variable_instances(n: int, seed: int = 0) -> typing.List[typing.Dict[str, typing.Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            'id': f'variable-{i}',
+            'name': rng.choice(['amount', 'customer', 'approved']),
+            'type': 'String',
+            'value': f'value-{i}',
+            'valueInfo': {},
+            'processInstanceId': f'instance-{i // 3}',
+            'executionId': f'instance-{i // 3}',
+            'caseInstanceId': None,
+            'caseExecutionId': None,
+            'taskId': None,
+            'activityInstanceId': f'review:{i // 3}',
+            'tenantId': 'tenant',
+            'errorMessage': None
+        }
+        for i in range(n)
+    ]
+
+
+def external_tasks(
+    n: int, topics: typing.Sequence[str] = ('invoice',), seed: int = 0
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            'activityId': 'sendInvoice',
+            'activityInstanceId': f'sendInvoice:{i}',
+            'errorMessage': None,
+            'executionId': f'execution-{i}',
+            'id': f'external-task-{i}',
+            'processDefinitionId': f'invoice:{rng.randint(1, 5)}:definition',
+            'processDefinitionKey': 'invoice',
+            'processInstanceId': f'instance-{i}',
+            'tenantId': 'tenant',
+            'retries': None,
+            'workerId': 'worker',
+            'priority': rng.randint(0, 100),
+            'topicName': topics[i % len(topics)],
+            'lockExpirationTime': _timestamp(rng),
+            'suspended': False,
+            'businessKey': f'order-{i}',
+            'variables': {}
+        }
+        for i in range(n)
+    ]
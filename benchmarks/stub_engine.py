@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""A minimal local stand-in for the Camunda REST api used by the benchmarks. It answers every
+request with a fixed JSON body, or the result of a callable route, and keeps connections
+alive."""
+
+import contextlib
+import fnmatch
+import http.server
+import json
+import threading
+import typing
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request_body = self.rfile.read(length) if length else b''
+        body = self.server.body_for(self.path, request_body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class StubEngine(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, routes: typing.Mapping[str, typing.Any] = None):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.routes = {
+            path: body if callable(body) else json.dumps(body).encode()
+            for path, body in (routes or {}).items()
+        }
+
+    def body_for(self, path: str, request_body: bytes = b'') -> bytes:
+        """Get the response body of a path. Routes may contain shell-style wildcards. Callable
+        routes are called with the decoded json body of the request and their result is
+        encoded."""
+        path = path.split('?', 1)[0]
+        route = self.routes.get(path)
+        if route is None:
+            route = next(
+                (body for pattern, body in self.routes.items() if fnmatch.fnmatch(path, pattern)),
+                b'[]'
+            )
+        if callable(route):
+            return json.dumps(route(json.loads(request_body) if request_body else None)).encode()
+        return route
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_port}/engine-rest'
+
+
+@contextlib.contextmanager
+def running(routes: typing.Mapping[str, typing.Any] = None) -> typing.Iterator[StubEngine]:
+    engine = StubEngine(routes=routes)
+    thread = threading.Thread(target=engine.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield engine
+    finally:
+        engine.shutdown()
+        engine.server_close()
@@ -6,12 +6,14 @@ from __future__ import annotations
 import dataclasses
 import typing
 
+import pycamunda.base
 import pycamunda.incident
 
 
 __all__ = []
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class TransitionInstance:
     """Data class of transition instance as returned by the REST api of Camunda."""
@@ -42,6 +44,7 @@ class TransitionInstance:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ActivityInstance:
     """Data class of activity instance as returned by the REST api of Camunda."""
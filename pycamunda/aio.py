@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a non-blocking client for sending requests to the REST api of Camunda
+from asyncio applications. It requires the optional dependency `aiohttp`."""
+
+from __future__ import annotations
+import asyncio
+import json
+import typing
+
+import requests
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+import pycamunda
+
+
+__all__ = ['AsyncClient', 'Response']
+
+
+class Response:
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: typing.Mapping[str, str] = None,
+        encoding: str = None
+    ):
+        """Response of a request sent by the `AsyncClient`. The body is read completely and the
+        response provides the parts of the interface of `requests.Response` that PyCamunda uses.
+
+        :param status_code: Http status code of the response.
+        :param content: Body of the response.
+        :param headers: Headers of the response.
+        :param encoding: Encoding of the body.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else {}
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self) -> typing.Any:
+        return json.loads(self.content)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__qualname__} [{self.status_code}]>'
+
+
+async def _iterate(chunks: typing.Iterable[bytes]) -> typing.AsyncIterator[bytes]:
+    """Hand the chunks of a streamed body to aiohttp, which only accepts async iterables."""
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncClient:
+
+    def __init__(
+        self,
+        auth: typing.Any = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        timeout: float = None,
+        headers: typing.Mapping[str, str] = None,
+        persist_cookies: bool = False
+    ):
+        """Non-blocking client that binds authentication and a pool of persistent connections. It
+        is used to await requests using their `acall` method.
+
+        The http session of the client is created on first use, so it has to be used from within
+        the event loop it is closed on.
+
+        :param auth: Authentication that is used for each request sent by this client, e.g. an
+                     instance of `requests.auth.HTTPBasicAuth`.
+        :param limit: Maximum number of simultaneous connections.
+        :param limit_per_host: Maximum number of simultaneous connections per host. 0 means no
+                               limit besides `limit`.
+        :param keepalive_timeout: Seconds to keep idle connections alive.
+        :param timeout: Total timeout in seconds for each request.
+        :param headers: Additional headers that are sent with each request.
+        :param persist_cookies: Whether to keep cookies set by the engine and send them with all
+                                later requests of this client. By default cookies are discarded.
+        """
+        if aiohttp is None:
+            raise ImportError('The AsyncClient requires the optional dependency aiohttp.')
+        self.auth = auth
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.headers = dict(headers) if headers is not None else {}
+        self.persist_cookies = persist_cookies
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+                cookie_jar=None if self.persist_cookies else aiohttp.DummyCookieJar()
+            )
+        return self._session
+
+    async def request(
+        self, method: str, url: str, auth: typing.Any = None, **kwargs
+    ) -> Response:
+        """Send a http request using the connection pool of this client. The request is encoded
+        exactly like `requests` encodes it, so the same keyword arguments are accepted.
+
+        :param method: Http method of the request.
+        :param url: Url of the request.
+        :param auth: Authentication to use instead of the authentication of the client.
+        :param kwargs: Keyword arguments accepted by `requests.Request`, e.g. `params`, `json`,
+                       `data` or `files`.
+        :return: The response.
+        """
+        if auth is None:
+            auth = self.auth
+        prepared = requests.Request(method=method, url=url, auth=auth, **kwargs).prepare()
+        body = prepared.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = _iterate(body)
+        try:
+            async with self.session.request(
+                method=prepared.method,
+                url=yarl.URL(prepared.url, encoded=True),
+                headers=prepared.headers,
+                data=body
+            ) as response:
+                content = await response.read()
+                return Response(
+                    status_code=response.status,
+                    content=content,
+                    headers=response.headers,
+                    encoding=response.charset
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise pycamunda.PyCamundaException(exc)
+
+    async def close(self) -> None:
+        """Close all connections of this client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(limit={self.limit!r})'
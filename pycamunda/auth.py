@@ -26,6 +26,7 @@ class AuthorizationType(enum.IntEnum):
     revoke = 2
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Authorization:
     """Data class of authorization as returned by the REST api of Camunda."""
@@ -69,6 +70,7 @@ class Authorization:
         return authorization
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Permission:
     """Data class of permission as returned by the REST api of Camunda."""
@@ -87,7 +89,7 @@ class Permission:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     type_ = QueryParameter('type')
@@ -1,17 +1,35 @@
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import dataclasses
 import enum
 import datetime as dt
+import io
+import os
+import re
+import sys
+import types
 import typing
 import json
 
 import requests
 
+import pycamunda.bulk
+import pycamunda.client
+import pycamunda.columnar
 import pycamunda.request
 
 
 __all__ = ['isoformat', 'from_isoformat']
 
+# Default number of bytes read at once when binary values are streamed.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Number of bytes read and sent at once when binary values are uploaded.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def value_is_true(self, obj: typing.Any, obj_type: typing.Any) -> bool:
     return bool(obj.__dict__[self.name])
@@ -27,41 +45,70 @@ class RequestMethod(enum.Enum):
     HEAD = 'HEAD'
 
 
+class _PendingRequest(BaseException):
+    """Raised while a request is awaited to hand a http request that has to be sent
+    asynchronously back to `CamundaRequest.acall`. Derives from `BaseException` so it is not
+    caught by handlers of regular exceptions."""
+
+    def __init__(self, method: str, kwargs: typing.Dict[str, typing.Any]):
+        super().__init__(method)
+        self.method = method
+        self.kwargs = kwargs
+
+
+class _Replay:
+
+    def __init__(self):
+        """Responses that were received asynchronously for a request and are handed out in the
+        order the request sends them."""
+        self.responses = []
+        self.position = 0
+
+    def send(self, method: str, **kwargs) -> typing.Any:
+        if self.position < len(self.responses):
+            response = self.responses[self.position]
+            self.position += 1
+            return response
+        raise _PendingRequest(method, kwargs)
+
+
+_replay = contextvars.ContextVar('_replay', default=None)
+
+
 class CamundaRequest(pycamunda.request.Request):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.auth = None
         self.session = None
+        self.client = None
         self._files = None
 
     @property
     def files(self):
         return self._files
 
-    def __call__(self, method: RequestMethod, *args, **kwargs) -> requests.Response:
+    def _send(self, method: str, **kwargs) -> requests.Response:
+        """Send a http request using the session of this request if it is set or using its client
+        otherwise. Requests with neither a session nor a client use the default client.
+
+        :param method: Http method of the request.
+        :param kwargs: Keyword arguments passed to the session or client.
+        :return: The response.
+        """
+        replay = _replay.get()
         try:
-            if self.session is not None:
-                kwargs = {}
+            if replay is not None:
+                response = replay.send(method, **kwargs)
+            elif self.session is not None:
                 if self.auth is not None:
                     kwargs['auth'] = self.auth
-                response = self.session.request(
-                    method=method.value,
-                    url=self.url,
-                    params=self.query_parameters(),
-                    json=self.body_parameters(),
-                    files=self.files,
-                    **kwargs
-                )
+                response = self.session.request(method=method, **kwargs)
             else:
-                response = requests.request(
-                    method=method.value,
-                    url=self.url,
-                    params=self.query_parameters(),
-                    json=self.body_parameters(),
-                    auth=self.auth,
-                    files=self.files
-                )
+                client = self.client
+                if client is None:
+                    client = pycamunda.client.get_default_client()
+                response = client.request(method=method, auth=self.auth, **kwargs)
         except requests.exceptions.RequestException as exc:
             raise pycamunda.PyCamundaException(exc)
         if not response:
@@ -69,6 +116,59 @@ class CamundaRequest(pycamunda.request.Request):
 
         return response
 
+    async def _asend(
+        self, client: 'pycamunda.aio.AsyncClient', method: str, **kwargs
+    ) -> 'pycamunda.aio.Response':
+        """Send a http request like `_send` does, but await it using the connection pool of
+        `client`.
+
+        :param client: The client to send the request with.
+        :param method: Http method of the request.
+        :param kwargs: Keyword arguments passed to the client.
+        :return: The response.
+        """
+        response = await client.request(method, auth=self.auth, **kwargs)
+        if not response:
+            pycamunda.base._raise_for_status(response)
+
+        return response
+
+    def _request_kwargs(self) -> typing.Dict[str, typing.Any]:
+        """Get the keyword arguments of the http request that is sent by default."""
+        return {
+            'url': self.url,
+            'params': self.query_parameters(),
+            'json': self.body_parameters(),
+            'files': self.files
+        }
+
+    def __call__(self, method: RequestMethod, *args, **kwargs) -> requests.Response:
+        return self._send(method=method.value, **self._request_kwargs())
+
+    async def acall(self, client: 'pycamunda.aio.AsyncClient', *args, **kwargs) -> typing.Any:
+        """Send the request without blocking the event loop and return the same result as calling
+        the request does.
+
+        The request is processed by its regular `__call__` method. Each http request it sends is
+        instead awaited using the connection pool of `client` and its response is handed back.
+        `__call__` is run again for each further http request it sends, so requests that send
+        several http requests override this method.
+
+        :param client: The client to send the request with.
+        """
+        replay = _Replay()
+        while True:
+            replay.position = 0
+            token = _replay.set(replay)
+            try:
+                return self(*args, **kwargs)
+            except _PendingRequest as pending:
+                method, request_kwargs = pending.method, pending.kwargs
+            finally:
+                _replay.reset(token)
+            response = await client.request(method, auth=self.auth, **request_kwargs)
+            replay.responses.append(response)
+
     def body_parameters(self, apply: typing.Callable = ...):
         if apply is Ellipsis:
             return super().body_parameters(apply=prepare)
@@ -80,6 +180,44 @@ class CamundaRequest(pycamunda.request.Request):
         return super().query_parameters(apply=apply)
 
 
+_camunda_datetime = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)\.(\d{3})([+-]\d{4})'
+)
+_offset_strings = {}
+_timezones = {}
+
+
+def _format_offset(datetime_: dt.datetime) -> str:
+    """Format the utc offset of a datetime like `strftime('%z')` does. Formatted offsets are
+    cached by their value.
+
+    :param datetime_: Datetime whose offset is formatted.
+    :return: The formatted offset.
+    """
+    offset = datetime_.utcoffset()
+    if offset is None:
+        return ''
+    try:
+        return _offset_strings[offset]
+    except KeyError:
+        offset_str = _offset_strings[offset] = datetime_.strftime('%z')
+        return offset_str
+
+
+def _parse_offset(offset_str: str) -> dt.tzinfo:
+    """Parse a utc offset like `strptime` with '%z' does. Parsed offsets are cached by their
+    string.
+
+    :param offset_str: Offset to parse, e.g. '+0100'.
+    :return: The timezone.
+    """
+    try:
+        return _timezones[offset_str]
+    except KeyError:
+        tzinfo = _timezones[offset_str] = dt.datetime.strptime(offset_str, '%z').tzinfo
+        return tzinfo
+
+
 def isoformat(datetime_: typing.Union[dt.date, dt.datetime]) -> str:
     """Convert a datetime object to the isoformat string Camunda expects. Datetime objects are
     expected to contain timezoneinformation.
@@ -87,22 +225,39 @@ def isoformat(datetime_: typing.Union[dt.date, dt.datetime]) -> str:
     :param datetime_: Datetime or date object to convert.
     :return: Isoformat datetime or date string.
     """
+    if datetime_.year < 1000:  # strftime does not pad years on every platform
+        if isinstance(datetime_, dt.datetime):
+            dt_str = datetime_.strftime('%Y-%m-%dT%H:%M:%S.{ms}%z')
+            ms = datetime_.microsecond // 1000
+            return dt_str.format(ms=str(ms).zfill(3))
+        return datetime_.strftime('%Y-%m-%d')
     if isinstance(datetime_, dt.datetime):
-        dt_str = datetime_.strftime('%Y-%m-%dT%H:%M:%S.{ms}%z')
-        ms = datetime_.microsecond // 1000
-        dt_str = dt_str.format(ms=str(ms).zfill(3))
-    else:
-        dt_str = datetime_.strftime('%Y-%m-%d')
-
-    return dt_str
+        return '%d-%02d-%02dT%02d:%02d:%02d.%03d%s' % (
+            datetime_.year, datetime_.month, datetime_.day, datetime_.hour, datetime_.minute,
+            datetime_.second, datetime_.microsecond // 1000, _format_offset(datetime_)
+        )
+    return '%d-%02d-%02d' % (datetime_.year, datetime_.month, datetime_.day)
 
 
 def from_isoformat(datetime_str: str) -> dt.datetime:
     """Convert an isoformat string to a datetime object.
 
+    Strings in the exact format Camunda uses (e.g. '2020-01-01T01:01:01.000+0100') are parsed
+    directly, all others are parsed using `strptime`.
+
     :param datetime_str: String to convert.
     :return: Converted datetime.
     """
+    match = _camunda_datetime.fullmatch(datetime_str)
+    if match is not None:
+        try:
+            year, month, day, hour, minute, second, millisecond, offset_str = match.groups()
+            return dt.datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(millisecond) * 1000, _parse_offset(offset_str)
+            )
+        except ValueError:
+            pass
     return dt.datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f%z')
 
 
@@ -157,6 +312,109 @@ def _raise_for_status(response: requests.Response) -> None:
     raise pycamunda.NoSuccess(response.text)
 
 
+def slotted(cls: typing.Type) -> typing.Type:
+    """Recreate a data class with `__slots__` for its fields, so its instances have no
+    `__dict__`. Names listed in the class attribute `_cache_slots` get a slot as well, e.g. to
+    cache values computed from the fields. Must be applied on top of `dataclasses.dataclass`.
+
+    :param cls: The data class.
+    :return: The slotted data class.
+    """
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    names += tuple(getattr(cls, '_cache_slots', ()))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+_intern_strings = False
+
+
+def set_string_interning(enabled: bool) -> None:
+    """Set whether highly repeated strings like definition ids, topic names or tenant ids are
+    interned when results are loaded. Results that share such values then share a single string
+    object, which reduces memory use of large result sets.
+
+    :param enabled: Whether to intern strings.
+    """
+    global _intern_strings
+    _intern_strings = enabled
+
+
+def intern_string(value: typing.Optional[str]) -> typing.Optional[str]:
+    """Intern a string if string interning is enabled.
+
+    :param value: The string or `None`.
+    :return: The interned string or the value itself.
+    """
+    if _intern_strings and value is not None:
+        return sys.intern(value)
+    return value
+
+
+class LazyField:
+
+    def __init__(self, key: str, load: typing.Callable = None):
+        """Attribute of a `LazyRecord` that is converted from the underlying data on first access.
+        The converted value is cached in the slot of the same name of the slotted data class the
+        record derives from.
+
+        :param key: Api key of the value in the data.
+        :param load: Callable that converts the value if it is not `None`.
+        """
+        self.key = key
+        self.load = load
+        self.name = None
+        self.slot = None
+
+    def __set_name__(self, owner: typing.Any, name: str):
+        self.name = name
+        for base in owner.__mro__[1:]:
+            slot = base.__dict__.get(name)
+            if isinstance(slot, types.MemberDescriptorType):
+                self.slot = slot
+                break
+        else:
+            raise TypeError(f'{owner.__qualname__} derives from no class with a slot {name}.')
+
+    def __get__(self, obj: typing.Any, obj_type: typing.Any = None) -> typing.Any:
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, obj_type)
+        except AttributeError:
+            pass
+        value = obj._data.get(self.key)
+        if value is not None and self.load is not None:
+            value = self.load(value)
+        self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: typing.Any, value: typing.Any) -> None:
+        self.slot.__set__(obj, value)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(key=\'{self.key}\')'
+
+
+class LazyRecord:
+    __slots__ = ()
+
+    def __init__(self, data: typing.Mapping[str, typing.Any]):
+        """Base class of lightweight views over the data of a result as returned by the REST api
+        of Camunda. Subclasses derive from the slotted data class of the result, declare its
+        attributes as `LazyField`s and add a slot `_data`, so they provide the same attributes
+        without converting the data up front and without a `__dict__`.
+
+        :param data: The decoded json data of the result.
+        """
+        self._data = data
+
+
 class _PathMixin:
     @property
     def url(self):
@@ -165,3 +423,300 @@ class _PathMixin:
         if self.tenant_id is not None:
             return self._url.format(path=f'key/{self.key}/tenant-id/{self.tenant_id}')
         return self._url.format(path=f'key/{self.key}')
+
+
+class _ColumnarMixin:
+    _record_view = None
+
+    def columns(self, output: str = 'lists') -> typing.Any:
+        """Send the request and decode the results into columns named like the attributes of
+        their data class instead of creating an object per result.
+
+        :param output: Type of the output. 'lists' for a dict of lists, 'numpy' for a dict of
+                       NumPy arrays or 'pandas' for a pandas DataFrame. The latter two require
+                       the respective optional dependency.
+        :return: The columns.
+        """
+        response = super().__call__(RequestMethod.GET)
+        return pycamunda.columnar.load_columns(self._record_view, response.json(), output=output)
+
+
+class _DownloadMixin:
+
+    @property
+    def _data_url(self) -> str:
+        return self.url if self.binary else self.url + '/data'
+
+    def iter_content(self, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> typing.Iterator[bytes]:
+        """Send the request for the binary value of the variable and yield it in chunks as it
+        is received instead of holding the whole value in memory. The connection is kept until
+        the iterator is exhausted or closed.
+
+        :param chunk_size: Maximum number of bytes per chunk.
+        :return: Iterator of the chunks.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1.')
+        response = self._send(
+            method=RequestMethod.GET.value,
+            url=self._data_url,
+            params=self.query_parameters(),
+            stream=True
+        )
+        try:
+            try:
+                yield from response.iter_content(chunk_size=chunk_size)
+            except requests.exceptions.RequestException as exc:
+                raise pycamunda.PyCamundaException(exc)
+        finally:
+            response.close()
+
+    def download(
+        self,
+        target: typing.Union[str, os.PathLike, typing.BinaryIO],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> int:
+        """Send the request for the binary value of the variable and write it to a file chunk by
+        chunk, so memory use does not depend on the size of the value.
+
+        :param target: Path of the file to write or a binary file object to write to. A file
+                       that was written partly is removed if the download fails.
+        :param chunk_size: Maximum number of bytes read and written at once.
+        :return: Number of bytes written.
+        """
+        if not isinstance(target, (str, os.PathLike)):
+            return sum(map(target.write, self.iter_content(chunk_size=chunk_size)))
+        with open(target, 'wb') as file:
+            try:
+                return sum(map(file.write, self.iter_content(chunk_size=chunk_size)))
+            except BaseException:
+                file.close()
+                with contextlib.suppress(OSError):
+                    os.remove(target)
+                raise
+
+
+def _quote_param(value: str) -> str:
+    """Quote a parameter of a multipart header like browsers do."""
+    return value.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class _MultipartBody:
+
+    def __init__(
+        self,
+        fields: typing.Mapping[str, str],
+        name: str,
+        value: typing.Any,
+        chunk_size: int = UPLOAD_CHUNK_SIZE
+    ):
+        """Body of a multipart form that is generated chunk by chunk while it is sent, so the
+        uploaded value is never copied into a single bytes object. Iterating the body yields its
+        chunks. `len` is its size in bytes or `None` if the size of the value is not known, in
+        which case the body is sent with chunked transfer encoding.
+
+        :param fields: Text fields of the form.
+        :param name: Name of the field of the value.
+        :param value: The value. Either bytes-like, e.g. `bytes`, `mmap.mmap` or `memoryview`, a
+                      string, an `os.PathLike` path of a file, a file object or a tuple of the
+                      filename, one of the former and optionally a content type.
+        :param chunk_size: Maximum number of bytes read from the value at once.
+        """
+        filename, content_type = None, None
+        if isinstance(value, tuple):
+            filename, value, *rest = value
+            content_type = rest[0] if rest else None
+        if isinstance(value, str):
+            value = value.encode()
+        self.value = value
+        self.chunk_size = chunk_size
+        self._nbytes = None
+        if isinstance(value, os.PathLike):
+            default_filename = os.path.basename(value)
+        else:
+            # Buffers like mmap objects may be readable as well, but are sent without copying.
+            try:
+                with memoryview(value) as view:
+                    self._nbytes = view.nbytes
+            except TypeError:
+                if not hasattr(value, 'read'):
+                    raise
+            default_filename = getattr(value, 'name', None)
+            if self._nbytes is not None or not isinstance(default_filename, str):
+                default_filename = name
+            default_filename = os.path.basename(default_filename)
+        if filename is None:
+            filename = default_filename
+        self.boundary = os.urandom(16).hex()
+
+        parts = [
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote_param(key)}"'
+            f'\r\n\r\n{field}\r\n'
+            for key, field in fields.items()
+        ]
+        parts.append(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote_param(name)}"; '
+            f'filename="{_quote_param(filename)}"\r\n'
+        )
+        if content_type is not None:
+            parts.append(f'Content-Type: {content_type}\r\n')
+        parts.append('\r\n')
+        self._head = ''.join(parts).encode()
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode()
+
+        size = self._size()
+        self.len = None if size is None else len(self._head) + size + len(self._tail)
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def _size(self) -> typing.Optional[int]:
+        """Get the number of bytes left in the value or `None` if it is not known."""
+        if self._nbytes is not None:
+            return self._nbytes
+        if isinstance(self.value, os.PathLike):
+            return os.path.getsize(self.value)
+        if isinstance(self.value, io.TextIOBase):
+            return None
+        try:
+            return os.fstat(self.value.fileno()).st_size - self.value.tell()
+        except (AttributeError, OSError):
+            pass
+        try:
+            if self.value.seekable():
+                position = self.value.tell()
+                size = self.value.seek(0, io.SEEK_END) - position
+                self.value.seek(position)
+                return size
+        except (AttributeError, OSError):
+            pass
+        return None
+
+    def _read(self, file: typing.IO) -> typing.Iterator[bytes]:
+        while True:
+            chunk = file.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+
+    def __iter__(self) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        yield self._head
+        if self._nbytes is not None:
+            # The views are released after sending, so a mmap object can be closed afterwards.
+            with memoryview(self.value) as view, view.cast('B') as data:
+                for start in range(0, self._nbytes, self.chunk_size):
+                    yield data[start:start + self.chunk_size]
+        elif isinstance(self.value, os.PathLike):
+            with open(self.value, 'rb') as file:
+                yield from self._read(file)
+        else:
+            yield from self._read(self.value)
+        yield self._tail
+
+
+class _UploadMixin:
+
+    def _upload(self) -> requests.Response:
+        """Send the binary value of the variable as multipart form that is streamed in chunks."""
+        body = _MultipartBody(fields={'valueType': self.type_}, name='data', value=self.value)
+        return self._send(
+            method=RequestMethod.POST.value,
+            url=self.url,
+            data=body,
+            headers={'Content-Type': body.content_type}
+        )
+
+
+class _PaginationMixin:
+
+    def _page(self, first_result: int, max_results: int) -> '_PaginationMixin':
+        """Create a copy of this request that requests a single page of results.
+
+        :param first_result: Index of the first result of the page.
+        :param max_results: Maximum number of results of the page.
+        """
+        page = copy.copy(self)
+        page.first_result = first_result
+        page.max_results = max_results
+        return page
+
+    def count(self) -> int:
+        """Get the number of results of this request regardless of its pagination parameters.
+
+        :return: The number of results.
+        """
+        params = self.query_parameters()
+        for key in ('firstResult', 'maxResults', 'sortBy', 'sortOrder'):
+            params.pop(key, None)
+        response = self._send(
+            method=RequestMethod.GET.value, url=self.url + '/count', params=params
+        )
+        return int(response.json()['count'])
+
+    def _iterate_parallel(self, page_size: int, max_workers: int) -> typing.Iterator[typing.Any]:
+        first_result = self.first_result or 0
+        total = self.count() - first_result
+        if self.max_results is not None:
+            total = min(total, self.max_results)
+        windows = (
+            self._page(first_result + start, min(page_size, total - start))
+            for start in range(0, max(total, 0), page_size)
+        )
+        executor = pycamunda.bulk.BulkExecutor(max_workers=max_workers, ordered=True)
+        for result in executor.map(windows):
+            if not result.ok:
+                raise result.exception
+            yield from result.result
+
+    def iterate(
+        self, page_size: int = 100, prefetch: bool = True, max_workers: int = 1
+    ) -> typing.Iterator[typing.Any]:
+        """Send the request page by page and yield the results one by one. Only the current page
+        and the pages fetched ahead are held in memory, regardless of the total number of results.
+
+        Set `sort_by` to get a stable order of the results across pages. `first_result` and
+        `max_results` of the request limit the range of results that is iterated.
+
+        If `max_workers` is larger than 1, the number of results is requested first and the
+        pages covering them are requested concurrently. Results are still yielded in order.
+        Results that are added while iterating are not included in that case.
+
+        :param page_size: Number of results to request at once.
+        :param prefetch: Whether to request the next page in the background while the current
+                         page is consumed. Ignored if `max_workers` is larger than 1.
+        :param max_workers: Maximum number of pages that are requested at the same time.
+        :return: Iterator of the results.
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1.')
+        if max_workers > 1:
+            yield from self._iterate_parallel(page_size=page_size, max_workers=max_workers)
+            return
+        first_result = self.first_result or 0
+        remaining = self.max_results
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        size = page_size if remaining is None else min(page_size, remaining)
+        window = (first_result, size) if size > 0 else None
+        future = None
+        try:
+            while window is not None:
+                first_result, size = window
+                page = future.result() if future is not None else self._page(*window)()
+                if remaining is not None:
+                    remaining -= size
+                next_size = page_size if remaining is None else min(page_size, remaining)
+                if len(page) < size or next_size < 1:
+                    window = None
+                else:
+                    window = (first_result + size, next_size)
+                future = None
+                if executor is not None and window is not None:
+                    future = executor.submit(self._page(*window))
+                yield from page
+        finally:
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
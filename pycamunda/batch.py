@@ -15,6 +15,7 @@ URL_SUFFIX = '/batch'
 __all__ = ['GetList', 'Count', 'Get', 'Activate', 'Suspend', 'Delete', 'GetStats', 'CountStats']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Batch:
     """Data class of batch as returned by the REST api of Camunda."""
@@ -49,6 +50,7 @@ class Batch:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class BatchStats:
     """Data class of batch statistics as returned by the REST api of Camunda."""
@@ -89,7 +91,7 @@ class BatchStats:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     batch_id = QueryParameter('batchId')
     type_ = QueryParameter('type')
@@ -273,7 +275,7 @@ class Delete(pycamunda.base.CamundaRequest):
         super().__call__(pycamunda.base.RequestMethod.DELETE, *args, **kwargs)
 
 
-class GetStats(pycamunda.base.CamundaRequest):
+class GetStats(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     batch_id = QueryParameter('batchId')
     type_ = QueryParameter('type')
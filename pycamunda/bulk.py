@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides sending many independent requests concurrently."""
+
+from __future__ import annotations
+import collections
+import concurrent.futures
+import dataclasses
+import threading
+import time
+import typing
+
+import pycamunda.base
+import pycamunda.client
+
+
+__all__ = ['BulkExecutor', 'BulkResult', 'BulkStats']
+
+
+@dataclasses.dataclass
+class BulkResult:
+    """Data class of the outcome of a request sent by a `BulkExecutor`."""
+    index: int
+    request: pycamunda.base.CamundaRequest
+    result: typing.Any = None
+    exception: BaseException = None
+    duration: float = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+@dataclasses.dataclass
+class BulkStats:
+    """Data class of the counters of a `BulkExecutor`."""
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    errors: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.completed / self.elapsed
+
+
+class BulkExecutor:
+
+    def __init__(
+        self,
+        max_workers: int = 10,
+        ordered: bool = True,
+        client: pycamunda.client.Client = None
+    ):
+        """Send many independent requests concurrently using a pool of threads. At most
+        `max_workers` requests are in flight at the same time and requests are taken from the
+        provided iterable only when there is capacity for them, so arbitrarily large iterables
+        can be sent.
+
+        An exception raised by a request is captured in its result instead of aborting the other
+        requests.
+
+        :param max_workers: Maximum number of requests that are sent at the same time. The pool
+                            of the used client should be at least as large.
+        :param ordered: Whether results are returned in the order the requests were provided.
+                        Otherwise they are returned in the order they complete.
+        :param client: Client that is set for requests that have neither a client nor a session.
+        """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.client = client
+        self.stats = BulkStats()
+        self._lock = threading.Lock()
+
+    def _send(self, index: int, request: pycamunda.base.CamundaRequest) -> BulkResult:
+        if self.client is not None and request.client is None and request.session is None:
+            request.client = self.client
+        start = time.perf_counter()
+        try:
+            result = BulkResult(index=index, request=request, result=request())
+        except Exception as exc:
+            result = BulkResult(index=index, request=request, exception=exc)
+        result.duration = time.perf_counter() - start
+        with self._lock:
+            if result.ok:
+                self.stats.succeeded += 1
+            else:
+                self.stats.failed += 1
+                name = type(result.exception).__qualname__
+                self.stats.errors[name] = self.stats.errors.get(name, 0) + 1
+        return result
+
+    def map(
+        self, requests: typing.Iterable[pycamunda.base.CamundaRequest]
+    ) -> typing.Iterator[BulkResult]:
+        """Send the requests and yield their results as they become available.
+
+        :param requests: The requests to send. They may be of different types.
+        :return: Iterator of the results.
+        """
+        requests = enumerate(requests)
+        start = time.perf_counter()
+        elapsed = self.stats.elapsed
+        pending = collections.deque() if self.ordered else set()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def submit() -> bool:
+                try:
+                    index, request = next(requests)
+                except StopIteration:
+                    return False
+                future = executor.submit(self._send, index, request)
+                if self.ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+                with self._lock:
+                    self.stats.submitted += 1
+                return True
+
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(pending) < self.max_workers:
+                        exhausted = not submit()
+                    if not pending:
+                        break
+                    if self.ordered:
+                        done = [pending.popleft()]
+                        concurrent.futures.wait(done)
+                    else:
+                        done, _ = concurrent.futures.wait(
+                            pending, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        pending.difference_update(done)
+                    self.stats.elapsed = elapsed + time.perf_counter() - start
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def __call__(
+        self, requests: typing.Iterable[pycamunda.base.CamundaRequest]
+    ) -> typing.List[BulkResult]:
+        """Send the requests and wait for all of them.
+
+        :param requests: The requests to send. They may be of different types.
+        :return: The results.
+        """
+        return list(self.map(requests))
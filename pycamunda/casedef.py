@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class CaseDefinition:
     """Data class of case definition as returned by the REST api of Camunda."""
@@ -47,7 +48,7 @@ class CaseDefinition:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('caseDefinitionId')
     id_in = QueryParameter('caseDefinitionIdIn')
@@ -17,6 +17,7 @@ URL_SUFFIX = '/case-instance'
 __all__ = ['GetList', 'Count', 'Get', 'Complete', 'Close', 'Terminate']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class CaseInstance:
     """Data class of case instance as returned by the REST api of Camunda."""
@@ -44,7 +45,7 @@ class CaseInstance:
         return case_instance
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     case_instance_id = QueryParameter('caseInstanceId')
     business_key = QueryParameter('businessKey')
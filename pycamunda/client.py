@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a client that sends requests to the REST api of Camunda over a pool of
+persistent connections."""
+
+from __future__ import annotations
+import http.cookiejar
+import threading
+import typing
+
+import requests
+import requests.adapters
+import requests.sessions
+
+
+__all__ = ['Client', 'get_default_client', 'set_default_client']
+
+
+class Client:
+
+    def __init__(
+        self,
+        auth: typing.Any = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        timeout: typing.Union[float, typing.Tuple[float, float]] = None,
+        headers: typing.Mapping[str, str] = None,
+        persist_cookies: bool = False
+    ):
+        """Client that binds authentication and a pool of persistent connections. Requests that
+        are sent using the same client reuse already established TCP (and TLS) connections
+        instead of opening a new one for each call. The url of the engine is still set on each
+        request object.
+
+        :param auth: Authentication that is used for each request sent by this client, e.g. an
+                     instance of `requests.auth.HTTPBasicAuth`.
+        :param pool_connections: Number of hosts to keep connection pools for.
+        :param pool_maxsize: Maximum number of connections kept alive per host.
+        :param pool_block: Whether to block when no connection to a host is available instead of
+                           opening an additional connection that is not kept alive.
+        :param keep_alive: Whether to keep connections alive after a response was received.
+        :param max_retries: Number of retries for failed connection attempts.
+        :param timeout: Timeout in seconds for each request. Either a single value or a tuple of
+                        connect and read timeout.
+        :param headers: Additional headers that are sent with each request.
+        :param persist_cookies: Whether to keep cookies set by the engine, e.g. a session id, and
+                                send them with all later requests of this client. By default
+                                cookies are discarded, so the session of one identity is not
+                                sent along with requests that use a different `auth`.
+        """
+        self.auth = auth
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.persist_cookies = persist_cookies
+
+        self.session = requests.sessions.Session()
+        self.session.auth = auth
+        if not persist_cookies:
+            self.session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        if headers is not None:
+            self.session.headers.update(headers)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(
+        self, method: str, url: str, auth: typing.Any = None, **kwargs
+    ) -> requests.Response:
+        """Send a http request using the connection pool of this client.
+
+        :param method: Http method of the request.
+        :param url: Url of the request.
+        :param auth: Authentication to use instead of the authentication of the client.
+        :param kwargs: Additional keyword arguments passed to `requests.Session.request`.
+        :return: The response.
+        """
+        if auth is not None:
+            kwargs['auth'] = auth
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def close(self) -> None:
+        """Close all connections of this client."""
+        self.session.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(pool_maxsize={self.pool_maxsize!r}, ' \
+               f'keep_alive={self.keep_alive!r})'
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> Client:
+    """Get the client that is used by requests that have neither a client nor a session set. It
+    is created on first use.
+
+    :return: The default client.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def set_default_client(client: typing.Optional[Client]) -> None:
+    """Set the client that is used by requests that have neither a client nor a session set.
+
+    :param client: The new default client. If `None`, a new default client is created on next
+                   use.
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides decoding list responses of the REST api of Camunda into columns instead
+of one data class per result. NumPy and pandas are used for the output if they are installed."""
+
+from __future__ import annotations
+import dataclasses
+import datetime as dt
+import itertools
+import re
+import typing
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+import pycamunda.base
+
+
+__all__ = ['load_columns', 'from_isoformat_many', 'OUTPUTS']
+
+OUTPUTS = ('lists', 'numpy', 'pandas')
+
+_Columns = typing.Dict[str, typing.Any]
+
+# Matches datetimes in the exact format of Camunda, each followed by a line break.
+_camunda_datetimes = re.compile(r'(?:\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}[+-]\d{4}\n)*')
+_MILLISECOND = dt.timedelta(milliseconds=1)
+
+
+def _parse_column(
+    values: typing.Sequence[str]
+) -> typing.Optional[typing.Tuple[typing.Any, typing.List[str], typing.Dict[str, dt.tzinfo]]]:
+    """Parse datetime strings in the exact format of Camunda at once. The format of all strings
+    is checked by a single regex match, the local times are parsed by a single NumPy conversion
+    and each distinct utc offset is parsed once.
+
+    :param values: Strings to parse.
+    :return: The local times as datetime64 array, the offset of each string and the timezones by
+             offset or `None` if NumPy is not installed or any string is not in the format of
+             Camunda or invalid.
+    """
+    if numpy is None or not values:
+        return None
+    if _camunda_datetimes.fullmatch('\n'.join(values) + '\n') is None:
+        return None
+    offsets = [value[23:] for value in values]
+    try:
+        local = numpy.array([value[:23] for value in values], dtype='datetime64[ms]')
+        timezones = {offset: pycamunda.base._parse_offset(offset) for offset in set(offsets)}
+    except ValueError:
+        return None
+    return local, offsets, timezones
+
+
+def from_isoformat_many(
+    values: typing.Iterable[typing.Optional[str]]
+) -> typing.List[typing.Optional[dt.datetime]]:
+    """Convert isoformat strings to datetime objects. Strings in the exact format of Camunda are
+    parsed in bulk if NumPy is installed, others one by one like `base.from_isoformat` does.
+
+    :param values: Strings to convert. `None` is kept.
+    :return: Converted datetimes.
+    """
+    values = list(values)
+    parsed = _parse_column([value for value in values if value is not None])
+    if parsed is None:
+        from_isoformat = pycamunda.base.from_isoformat
+        return [None if value is None else from_isoformat(value) for value in values]
+    local, offsets, timezones = parsed
+    datetimes = iter([
+        datetime_.replace(tzinfo=timezones[offset])
+        for datetime_, offset in zip(local.astype(object).tolist(), offsets)
+    ])
+    return [None if value is None else next(datetimes) for value in values]
+
+
+def _datetime64_many(values: typing.Sequence[typing.Optional[str]]) -> typing.Any:
+    """Convert isoformat strings to a NumPy array of UTC datetimes in milliseconds. Strings in
+    the exact format of Camunda are converted in bulk. `None` becomes NaT.
+    """
+    present = [value for value in values if value is not None]
+    parsed = _parse_column(present)
+    if parsed is None:
+        return numpy.array([
+            None if datetime_ is None
+            else datetime_.astimezone(dt.timezone.utc).replace(tzinfo=None)
+            for datetime_ in from_isoformat_many(values)
+        ], dtype='datetime64[ms]')
+    local, offsets, timezones = parsed
+    milliseconds = {
+        offset: timezone.utcoffset(None) // _MILLISECOND for offset, timezone in timezones.items()
+    }
+    utc = local - numpy.array([milliseconds[offset] for offset in offsets], dtype='timedelta64[ms]')
+    if len(present) == len(values):
+        return utc
+    datetimes = numpy.full(len(values), numpy.datetime64('NaT'), dtype='datetime64[ms]')
+    datetimes[[value is not None for value in values]] = utc
+    return datetimes
+
+
+def _fields(
+    view: typing.Type[pycamunda.base.LazyRecord]
+) -> typing.List[typing.Tuple[str, pycamunda.base.LazyField]]:
+    return [(field.name, getattr(view, field.name)) for field in dataclasses.fields(view)]
+
+
+def _to_numpy(columns: _Columns, datetime_names: typing.Collection[str]) -> _Columns:
+    arrays = {}
+    for name, column in columns.items():
+        if name in datetime_names:
+            arrays[name] = column
+        elif any(value is None or isinstance(value, (dict, tuple)) for value in column):
+            arrays[name] = numpy.array(column, dtype=object)
+        else:
+            arrays[name] = numpy.array(column)
+    return arrays
+
+
+def load_columns(
+    view: typing.Type[pycamunda.base.LazyRecord],
+    data: typing.Sequence[typing.Dict[str, typing.Any]],
+    output: str = 'lists'
+) -> typing.Any:
+    """Decode the json data of a list response into columns named like the attributes of the
+    data class of the results. No object is created per result. Datetime columns are parsed in
+    bulk.
+
+    :param view: Lazy view class of the results that declares how each attribute is loaded.
+    :param data: The decoded json data of the response, a sequence of dicts.
+    :param output: Type of the output. 'lists' for a dict of lists, 'numpy' for a dict of NumPy
+                   arrays or 'pandas' for a pandas DataFrame. Datetime columns are converted to
+                   UTC for NumPy and pandas.
+    :return: The columns.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f'output must be one of {", ".join(OUTPUTS)}.')
+    if output == 'numpy' and numpy is None:
+        raise ImportError('The numpy output requires the optional dependency numpy.')
+    if output == 'pandas' and pandas is None:
+        raise ImportError('The pandas output requires the optional dependency pandas.')
+
+    columns = {}
+    datetime_names = set()
+    for name, field in _fields(view):
+        key, load = field.key, field.load
+        column = list(map(dict.get, data, itertools.repeat(key)))
+        if load is pycamunda.base.from_isoformat:
+            datetime_names.add(name)
+            if output == 'pandas':
+                column = pandas.to_datetime(
+                    column, format='%Y-%m-%dT%H:%M:%S.%f%z', utc=True
+                )
+            elif output == 'numpy':
+                column = _datetime64_many(column)
+            else:
+                column = from_isoformat_many(column)
+        elif load is not None:
+            column = [None if value is None else load(value) for value in column]
+        columns[name] = column
+
+    if output == 'numpy':
+        return _to_numpy(columns, datetime_names)
+    if output == 'pandas':
+        return pandas.DataFrame(columns)
+    return columns
@@ -17,6 +17,7 @@ URL_SUFFIX = '/decision-definition'
 __all__ = ['GetList', 'Count', 'Get', 'GetXML', 'GetDiagram', 'Evaluate']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class DecisionDefinition:
     """Data class of decision definition as returned by the REST api of Camunda."""
@@ -51,7 +52,7 @@ class DecisionDefinition:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('decisionDefinitionId')
     id_in = QueryParameter('decisionDefinitionIdIn')
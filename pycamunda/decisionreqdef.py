@@ -6,10 +6,13 @@ from __future__ import annotations
 import typing
 import dataclasses
 
+import pycamunda.base
+
 
 __all__ = []
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class DecisionRequirementsDefinition:
     """Data class of decision requirements definition as returned by the REST api of Camunda."""
@@ -7,8 +7,6 @@ import datetime as dt
 import dataclasses
 import typing
 
-import requests
-
 import pycamunda.variable
 import pycamunda.base
 import pycamunda.resource
@@ -24,6 +22,7 @@ URL_SUFFIX = '/deployment'
 __all__ = ['GetList', 'Get', 'Create', 'GetResources', 'GetResource', 'Delete']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Deployment:
     """Data class of deployment as returned by the REST api of Camunda."""
@@ -47,6 +46,7 @@ class Deployment:
         return deployment
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Resource:
     """Data class of resource as returned by the REST api of Camunda."""
@@ -63,6 +63,7 @@ class Resource:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class DeploymentWithDefinitions:
     """Data class of deployment with definitions as returned by the REST api of Camunda."""
@@ -123,7 +124,7 @@ class DeploymentWithDefinitions:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     name = QueryParameter('name')
@@ -286,19 +287,13 @@ class Create(pycamunda.base.CamundaRequest):
     def __call__(self, *args, **kwargs) -> DeploymentWithDefinitions:
         """Send the request."""
         assert bool(self.files), 'Cannot create deployment without resources.'
-        try:
-            response = requests.request(
-                method=pycamunda.base.RequestMethod.POST.value,
-                url=self.url,
-                params=self.query_parameters(),
-                data=self.body_parameters(),
-                auth=self.auth,
-                files=self.files
-            )
-        except requests.exceptions.RequestException as exc:
-            raise pycamunda.PyCamundaException(exc)
-        if not response:
-            pycamunda.base._raise_for_status(response)
+        response = self._send(
+            method=pycamunda.base.RequestMethod.POST.value,
+            url=self.url,
+            params=self.query_parameters(),
+            data=self.body_parameters(),
+            files=self.files
+        )
 
         return DeploymentWithDefinitions.load(data=response.json())
 
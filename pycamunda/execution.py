@@ -6,10 +6,13 @@ from __future__ import annotations
 import dataclasses
 import typing
 
+import pycamunda.base
+
 
 __all__ = []
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Execution:
     """Data class of execution as returned by the REST api of Camunda."""
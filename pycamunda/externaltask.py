@@ -3,12 +3,15 @@
 """This module provides access to the external task REST api of Camunda."""
 
 from __future__ import annotations
+import asyncio
+import collections
+import concurrent.futures
 import datetime as dt
 import dataclasses
+import threading
+import time
 import typing
 
-import requests
-
 import pycamunda
 import pycamunda.base
 import pycamunda.variable
@@ -24,6 +27,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ExternalTask:
     """Data class of external task as returned by the REST api of Camunda."""
@@ -49,19 +53,19 @@ class ExternalTask:
     @classmethod
     def load(cls, data: typing.Mapping[str, typing.Any]) -> ExternalTask:
         external_task = cls(
-            activity_id=data['activityId'],
+            activity_id=pycamunda.base.intern_string(data['activityId']),
             activity_instance_id=data['activityInstanceId'],
             error_message=data['errorMessage'],
             execution_id=data['executionId'],
             id_=data['id'],
-            process_definition_id=data['processDefinitionId'],
-            process_definition_key=data['processDefinitionKey'],
+            process_definition_id=pycamunda.base.intern_string(data['processDefinitionId']),
+            process_definition_key=pycamunda.base.intern_string(data['processDefinitionKey']),
             process_instance_id=data['processInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base.intern_string(data['tenantId']),
             retries=data['retries'],
-            worker_id=data['workerId'],
+            worker_id=pycamunda.base.intern_string(data['workerId']),
             priority=data['priority'],
-            topic_name=data['topicName']
+            topic_name=pycamunda.base.intern_string(data['topicName'])
         )
         if data['lockExpirationTime'] is not None:
             external_task.lock_expiration_time = pycamunda.base.from_isoformat(
@@ -93,21 +97,202 @@ class ExternalTask:
         return external_task
 
 
+def _load_variables(data: typing.Mapping[str, typing.Any]) -> typing.Dict:
+    return {
+        var_name: pycamunda.variable.Variable(
+            type_=var['type'], value=var['value'], value_info=var['valueInfo']
+        )
+        for var_name, var in data.items()
+    }
+
+
+class _ExternalTaskView(pycamunda.base.LazyRecord, ExternalTask):
+    """View of an external task whose attributes are converted on first access."""
+    __slots__ = ('_data', )
+    activity_id = pycamunda.base.LazyField('activityId', pycamunda.base.intern_string)
+    activity_instance_id = pycamunda.base.LazyField('activityInstanceId')
+    error_message = pycamunda.base.LazyField('errorMessage')
+    execution_id = pycamunda.base.LazyField('executionId')
+    id_ = pycamunda.base.LazyField('id')
+    process_definition_id = pycamunda.base.LazyField(
+        'processDefinitionId', pycamunda.base.intern_string
+    )
+    process_definition_key = pycamunda.base.LazyField(
+        'processDefinitionKey', pycamunda.base.intern_string
+    )
+    process_instance_id = pycamunda.base.LazyField('processInstanceId')
+    tenant_id = pycamunda.base.LazyField('tenantId', pycamunda.base.intern_string)
+    retries = pycamunda.base.LazyField('retries')
+    worker_id = pycamunda.base.LazyField('workerId', pycamunda.base.intern_string)
+    priority = pycamunda.base.LazyField('priority')
+    topic_name = pycamunda.base.LazyField('topicName', pycamunda.base.intern_string)
+    lock_expiration_time = pycamunda.base.LazyField(
+        'lockExpirationTime', pycamunda.base.from_isoformat
+    )
+    suspended = pycamunda.base.LazyField('suspended')
+    business_key = pycamunda.base.LazyField('businessKey')
+    variables = pycamunda.base.LazyField('variables', _load_variables)
+    error_details = pycamunda.base.LazyField('errorDetails')
+
+
+# Maximum number of error details kept in the cache.
+_ERROR_DETAILS_CACHE_SIZE = 512
+_error_details_cache = collections.OrderedDict()
+_error_details_lock = threading.Lock()
+
+
+def _cached_error_details(
+    external_tasks: typing.Iterable[ExternalTask],
+    url: typing.Callable[[ExternalTask], str],
+    ttl: typing.Optional[float]
+) -> typing.List[typing.Tuple[typing.Tuple, ExternalTask]]:
+    """Set the cached error details of external tasks that failed. External tasks that never
+    failed have no retries set and no error details to request. Error details are cached by
+    their url, so external tasks of different engines do not share them, and by the retries and
+    error message of the external task. An external task that fails again with the same retries
+    and error message has the same key, so cached error details may be outdated until they
+    expire after `ttl` seconds.
+
+    :param external_tasks: The external tasks.
+    :param url: Returns the url of the error details of an external task.
+    :param ttl: Seconds cached error details are used for. `None` disables the cache.
+    :return: The cache keys and the external tasks whose error details have to be requested.
+    """
+    missing = []
+    now = time.monotonic()
+    for external_task in external_tasks:
+        if external_task.error_details is not None or external_task.retries is None:
+            continue
+        key = (url(external_task), external_task.retries, external_task.error_message)
+        error_details = None
+        if ttl is not None:
+            with _error_details_lock:
+                error_details, expires = _error_details_cache.get(key, (None, None))
+                if error_details is not None and expires <= now:
+                    del _error_details_cache[key]
+                    error_details = None
+                elif error_details is not None:
+                    _error_details_cache.move_to_end(key)
+        if error_details is None:
+            missing.append((key, external_task))
+        else:
+            external_task.error_details = error_details
+    return missing
+
+
+def _store_error_details(
+    missing: typing.List[typing.Tuple[typing.Tuple, ExternalTask]],
+    details: typing.Iterable[str],
+    ttl: typing.Optional[float]
+) -> None:
+    """Set the requested error details of external tasks and add them to the cache.
+
+    :param missing: The cache keys and the external tasks.
+    :param details: The error details of the external tasks.
+    :param ttl: Seconds the error details are cached for. `None` disables the cache.
+    """
+    expires = None if ttl is None else time.monotonic() + ttl
+    for (key, external_task), error_details in zip(missing, details):
+        external_task.error_details = error_details
+        if expires is None:
+            continue
+        with _error_details_lock:
+            _error_details_cache[key] = (error_details, expires)
+            _error_details_cache.move_to_end(key)
+            if len(_error_details_cache) > _ERROR_DETAILS_CACHE_SIZE:
+                _error_details_cache.popitem(last=False)
+
+
+def _request_error_details(
+    request: pycamunda.base.CamundaRequest,
+    external_tasks: typing.Iterable[ExternalTask],
+    url: typing.Callable[[ExternalTask], str],
+    max_workers: int
+) -> None:
+    """Set the error details of external tasks that failed. Error details that are not cached
+    are requested concurrently using the session or client of `request`. The error details are
+    cached for `request.error_details_ttl` seconds.
+
+    :param request: The request that returned the external tasks.
+    :param external_tasks: The external tasks.
+    :param url: Returns the url of the error details of an external task.
+    :param max_workers: Maximum number of error details that are requested at the same time.
+    """
+    missing = _cached_error_details(external_tasks, url, request.error_details_ttl)
+
+    def send(external_task: ExternalTask) -> str:
+        return request._send(
+            method=pycamunda.base.RequestMethod.GET.value, url=url(external_task)
+        ).text
+
+    tasks = [external_task for _, external_task in missing]
+    if max_workers > 1 and len(tasks) > 1:
+        with concurrent.futures.ThreadPoolExecutor(min(max_workers, len(tasks))) as executor:
+            details = list(executor.map(send, tasks))
+    else:
+        details = [send(external_task) for external_task in tasks]
+    _store_error_details(missing, details, request.error_details_ttl)
+
+
+async def _arequest_error_details(
+    request: pycamunda.base.CamundaRequest,
+    client: 'pycamunda.aio.AsyncClient',
+    external_tasks: typing.Iterable[ExternalTask],
+    url: typing.Callable[[ExternalTask], str],
+    max_workers: int
+) -> None:
+    """Set the error details of external tasks that failed like `_request_error_details` does,
+    but await the requests concurrently using `client`.
+
+    :param request: The request that returned the external tasks.
+    :param client: The client to send the requests with.
+    :param external_tasks: The external tasks.
+    :param url: Returns the url of the error details of an external task.
+    :param max_workers: Maximum number of error details that are requested at the same time.
+    """
+    missing = _cached_error_details(external_tasks, url, request.error_details_ttl)
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def send(external_task: ExternalTask) -> str:
+        async with semaphore:
+            response = await request._asend(
+                client, pycamunda.base.RequestMethod.GET.value, url=url(external_task)
+            )
+        return response.text
+
+    details = await asyncio.gather(*(send(external_task) for _, external_task in missing))
+    _store_error_details(missing, details, request.error_details_ttl)
+
+
 class Get(pycamunda.base.CamundaRequest):
 
     id_ = PathParameter('id')
 
-    def __init__(self, url: str, id_: str, request_error_details: bool = True):
+    def __init__(
+        self,
+        url: str,
+        id_: str,
+        request_error_details: bool = True,
+        error_details_ttl: float = None
+    ):
         """Query for an external task.
 
         :param url: Camunda Rest engine URL.
         :param id_: Id of the external task.
         :param request_error_details: Whether to request error details for tasks. Requires an
-                                      additional request.
+                                      additional request if the external task failed and its
+                                      error details are not cached.
+        :param error_details_ttl: Seconds requested error details are cached for. Cached error
+                                  details are outdated if the external task failed again with the
+                                  same retries and error message. `None` disables the cache.
         """
         super().__init__(url=url + URL_SUFFIX + '/{id}')
         self.id_ = id_
         self.request_error_details = request_error_details
+        self.error_details_ttl = error_details_ttl
+
+    def _error_details_url(self, external_task: ExternalTask) -> str:
+        return self.url + '/errorDetails'
 
     def __call__(self, *args, **kwargs) -> ExternalTask:
         """Send the request."""
@@ -115,19 +300,32 @@ class Get(pycamunda.base.CamundaRequest):
         external_task = ExternalTask.load(response.json())
 
         if self.request_error_details:
-            if external_task.error_details is None:
-                try:
-                    response = requests.get(self.url + '/errorDetails')
-                except requests.exceptions.RequestException:
-                    raise pycamunda.PyCamundaException()
-                if not response:
-                    pycamunda.base._raise_for_status(response)
-                external_task.error_details = response.text
+            _request_error_details(
+                self, (external_task,), self._error_details_url, max_workers=1
+            )
+
+        return external_task
+
+    async def acall(self, client: 'pycamunda.aio.AsyncClient', *args, **kwargs) -> ExternalTask:
+        """Send the request without blocking the event loop and return the same result as calling
+        the request does.
+
+        :param client: The client to send the request with.
+        """
+        response = await self._asend(
+            client, pycamunda.base.RequestMethod.GET.value, **self._request_kwargs()
+        )
+        external_task = ExternalTask.load(response.json())
+
+        if self.request_error_details:
+            await _arequest_error_details(
+                self, client, (external_task,), self._error_details_url, max_workers=1
+            )
 
         return external_task
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('externalTaskId')
     topic_name = QueryParameter('topicName')
@@ -193,7 +391,10 @@ class GetList(pycamunda.base.CamundaRequest):
         ascending: bool = True,
         first_result: int = None,
         max_results: int = None,
-        request_error_details: bool = True
+        request_error_details: bool = True,
+        lazy: bool = False,
+        max_workers: int = 10,
+        error_details_ttl: float = None
     ):
         """Query for a list of external tasks using a list of parameters. The size of the result set
         can be retrieved by using the Get Count request.
@@ -228,8 +429,15 @@ class GetList(pycamunda.base.CamundaRequest):
         :param ascending: Sort order.
         :param first_result: Pagination of results. Index of the first result to return.
         :param max_results: Pagination of results. Maximum number of results to return.
-        :param request_error_details: Whether to request error details for tasks. Requires
-                                      additional requests.
+        :param request_error_details: Whether to request error details for tasks. Requires an
+                                      additional request for each external task that failed and
+                                      whose error details are not cached.
+        :param lazy: Whether to return views of the external tasks that convert their attributes on
+                     first access instead of fully loaded external tasks.
+        :param max_workers: Maximum number of error details that are requested at the same time.
+        :param error_details_ttl: Seconds requested error details are cached for. Cached error
+                                  details are outdated if an external task failed again with the
+                                  same retries and error message. `None` disables the cache.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.id_ = id_
@@ -256,22 +464,48 @@ class GetList(pycamunda.base.CamundaRequest):
         self.first_result = first_result
         self.max_results = max_results
         self.request_error_details = request_error_details
+        self.lazy = lazy
+        self.max_workers = max_workers
+        self.error_details_ttl = error_details_ttl
+
+    def _load(self, data: typing.Sequence[typing.Mapping]) -> typing.Tuple[ExternalTask]:
+        load = _ExternalTaskView if self.lazy else ExternalTask.load
+        return tuple(load(task_json) for task_json in data)
+
+    def _error_details_url(self, external_task: ExternalTask) -> str:
+        return self.url + f'/{external_task.id_}/errorDetails'
 
     def __call__(self, *args, **kwargs) -> typing.Tuple[ExternalTask]:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
-        external_tasks = tuple(ExternalTask.load(task_json) for task_json in response.json())
+        external_tasks = self._load(response.json())
+
+        if self.request_error_details:
+            _request_error_details(
+                self, external_tasks, self._error_details_url, max_workers=self.max_workers
+            )
+
+        return external_tasks
+
+    async def acall(
+        self, client: 'pycamunda.aio.AsyncClient', *args, **kwargs
+    ) -> typing.Tuple[ExternalTask]:
+        """Send the request without blocking the event loop and return the same result as calling
+        the request does. Error details are requested concurrently, at most `max_workers` at
+        the same time.
+
+        :param client: The client to send the request with.
+        """
+        response = await self._asend(
+            client, pycamunda.base.RequestMethod.GET.value, **self._request_kwargs()
+        )
+        external_tasks = self._load(response.json())
 
         if self.request_error_details:
-            for external_task in external_tasks:
-                if external_task.error_details is None:
-                    try:
-                        response = requests.get(self.url + f'/{external_task.id_}/errorDetails')
-                    except requests.exceptions.RequestException:
-                        raise pycamunda.PyCamundaException()
-                    if not response:
-                        pycamunda.base._raise_for_status(response)
-                    external_task.error_details = response.text
+            await _arequest_error_details(
+                self, client, external_tasks, self._error_details_url,
+                max_workers=self.max_workers
+            )
 
         return external_tasks
 
@@ -366,6 +600,19 @@ class Count(GetList):
         )
         self._url += '/count'
 
+    acall = pycamunda.base.CamundaRequest.acall
+
+    def count(self) -> int:
+        """Get the number of results. Same as sending the request.
+
+        :return: The number of external tasks.
+        """
+        return self()
+
+    def iterate(self, *args, **kwargs) -> typing.NoReturn:
+        """Not supported, the request returns a single number instead of pages of results."""
+        raise TypeError(f'{type(self).__name__} cannot be iterated page by page.')
+
     def query_parameters(self, apply: typing.Callable = ...):
         params = super().query_parameters(apply=apply)
         for key, value in params.items():
@@ -375,16 +622,11 @@ class Count(GetList):
 
     def __call__(self, *args, **kwargs) -> int:
         """Send the request."""
-        try:
-            response = requests.request(
-                method=pycamunda.base.RequestMethod.GET.value,
-                url=self.url,
-                params=self.query_parameters()
-            )
-        except requests.exceptions.RequestException:
-            raise pycamunda.PyCamundaException()
-        if not response:
-            pycamunda.base._raise_for_status(response)
+        response = self._send(
+            method=pycamunda.base.RequestMethod.GET.value,
+            url=self.url,
+            params=self.query_parameters()
+        )
 
         return int(response.json()['count'])
 
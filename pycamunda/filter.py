@@ -44,6 +44,7 @@ class Properties:
         return properties
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Filter:
     """Data class of filter as returned by the REST api of Camunda."""
@@ -68,7 +69,7 @@ class Filter:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('filterId')
     resource_type = QueryParameter('resourceType')
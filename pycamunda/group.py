@@ -22,6 +22,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Group:
     """Data class of group as returned by the REST api of Camunda."""
@@ -63,7 +64,7 @@ class Get(pycamunda.base.CamundaRequest):
         return Group.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     id_in = QueryParameter('idIn')
@@ -18,6 +18,7 @@ URL_SUFFIX = '/identity'
 __all__ = ['GetGroups', 'VerifyUser', 'GetPasswordPolicy', 'ValidatePassword']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class UsersGroups:
     """Data class of the groups of an user and all of their members as returned by the REST api of
@@ -33,6 +34,7 @@ class UsersGroups:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class AuthStatus:
     """Data class of the authentication status of an user as returned by the REST api of Camunda."""
@@ -47,6 +49,7 @@ class AuthStatus:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class PasswordPolicy:
     """Data class of the password policy as returned by the REST api of Camunda."""
@@ -61,6 +64,7 @@ class PasswordPolicy:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class PasswordPolicyCompliance:
     """Data class of the password policy compliance as returned by the REST api of Camunda."""
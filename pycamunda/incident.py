@@ -23,6 +23,7 @@ class IncidentType(enum.Enum):
     failed_external_task = 'failedExternalTask'
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class IncidentTypeCount:
     """Data class of incident type count as returned by the REST api of Camunda."""
@@ -37,6 +38,7 @@ class IncidentTypeCount:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Incident:
     """Data class of incident as returned by the REST api of Camunda."""
@@ -58,17 +60,17 @@ class Incident:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> Incident:
         incident = cls(
             id_=data['id'],
-            process_definition_id=data['processDefinitionId'],
+            process_definition_id=pycamunda.base.intern_string(data['processDefinitionId']),
             process_instance_id=data['processInstanceId'],
             execution_id=data['executionId'],
             incident_type=IncidentType(data['incidentType']),
-            activity_id=data['activityId'],
+            activity_id=pycamunda.base.intern_string(data['activityId']),
             cause_incident_id=data['causeIncidentId'],
             root_cause_incident_id=data['rootCauseIncidentId'],
             configuration=data['configuration'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base.intern_string(data['tenantId']),
             incident_message=data['incidentMessage'],
-            job_definition_id=data['jobDefinitionId']
+            job_definition_id=pycamunda.base.intern_string(data['jobDefinitionId'])
         )
         if data['incidentTimestamp'] is not None:
             incident.incident_timestamp = pycamunda.base.from_isoformat(
@@ -78,6 +80,28 @@ class Incident:
         return incident
 
 
+class _IncidentView(pycamunda.base.LazyRecord, Incident):
+    """View of an incident whose attributes are converted on first access."""
+    __slots__ = ('_data', )
+    id_ = pycamunda.base.LazyField('id')
+    process_definition_id = pycamunda.base.LazyField(
+        'processDefinitionId', pycamunda.base.intern_string
+    )
+    process_instance_id = pycamunda.base.LazyField('processInstanceId')
+    execution_id = pycamunda.base.LazyField('executionId')
+    incident_type = pycamunda.base.LazyField('incidentType', IncidentType)
+    activity_id = pycamunda.base.LazyField('activityId', pycamunda.base.intern_string)
+    cause_incident_id = pycamunda.base.LazyField('causeIncidentId')
+    root_cause_incident_id = pycamunda.base.LazyField('rootCauseIncidentId')
+    configuration = pycamunda.base.LazyField('configuration')
+    tenant_id = pycamunda.base.LazyField('tenantId', pycamunda.base.intern_string)
+    incident_message = pycamunda.base.LazyField('incidentMessage')
+    job_definition_id = pycamunda.base.LazyField('jobDefinitionId', pycamunda.base.intern_string)
+    incident_timestamp = pycamunda.base.LazyField(
+        'incidentTimestamp', pycamunda.base.from_isoformat
+    )
+
+
 class Get(pycamunda.base.CamundaRequest):
 
     id_ = PathParameter('id')
@@ -98,7 +122,7 @@ class Get(pycamunda.base.CamundaRequest):
         return Incident.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     incident_id = QueryParameter('incidentId')
     incident_type = QueryParameter('incidentType')
@@ -135,6 +159,8 @@ class GetList(pycamunda.base.CamundaRequest):
         mapping={True: 'asc', False: 'desc'},
         provide=lambda self, obj, obj_type: vars(obj).get('sort_by', None) is not None
     )
+    first_result = QueryParameter('firstResult')
+    max_results = QueryParameter('maxResults')
 
     def __init__(
         self,
@@ -153,7 +179,10 @@ class GetList(pycamunda.base.CamundaRequest):
         tenant_id_in: typing.Iterable[str] = None,
         job_definition_id_in: typing.Iterable[str] = None,
         sort_by: str = None,
-        ascending: bool = True
+        ascending: bool = True,
+        first_result: int = None,
+        max_results: int = None,
+        lazy: bool = False
     ):
         """Get a list of incidents.
 
@@ -178,6 +207,10 @@ class GetList(pycamunda.base.CamundaRequest):
                         'process_definition_id', 'cause_incident_id', 'root_cause_incident_id',
                         'configuration' or 'tenant_id'.
         :param ascending: Sort order.
+        :param first_result: Pagination of results. Index of the first result to return.
+        :param max_results: Pagination of results. Maximum number of results to return.
+        :param lazy: Whether to return views of the incidents that convert their attributes on
+                     first access instead of fully loaded incidents.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.incident_id = incident_id
@@ -195,12 +228,16 @@ class GetList(pycamunda.base.CamundaRequest):
         self.job_definition_id_in = job_definition_id_in
         self.sort_by = sort_by
         self.ascending = ascending
+        self.first_result = first_result
+        self.max_results = max_results
+        self.lazy = lazy
 
     def __call__(self, *args, **kwargs) -> typing.Tuple[Incident]:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
 
-        return tuple(Incident.load(incident_json) for incident_json in response.json())
+        load = _IncidentView if self.lazy else Incident.load
+        return tuple(load(incident_json) for incident_json in response.json())
 
 
 class Resolve(pycamunda.base.CamundaRequest):
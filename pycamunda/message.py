@@ -24,6 +24,7 @@ class ResultType(enum.Enum):
     execution = 'Execution'
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class MessageCorrelationResult:
     """Data class of message correlation result as returned by the REST api of Camunda."""
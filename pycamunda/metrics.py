@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides the metrics of external task workers. Workers record counters and
+histograms in a sink, which keeps them in memory by default. A snapshot of the recorded values
+can be taken at any time and exported in the text format of Prometheus."""
+
+from __future__ import annotations
+import abc
+import bisect
+import dataclasses
+import math
+import threading
+import typing
+
+
+__all__ = [
+    'Metric', 'Sink', 'NullSink', 'InMemorySink', 'HistogramSnapshot', 'Snapshot',
+    'to_prometheus', 'FETCH_SECONDS', 'FETCHED_TASKS', 'EMPTY_POLLS', 'FETCH_ERRORS',
+    'QUEUE_WAIT_SECONDS', 'HANDLER_SECONDS', 'HANDLED_TASKS', 'COMPLETION_SECONDS',
+    'FAILED_REPORTS', 'LOCK_EXTENSIONS', 'FAILED_LOCK_EXTENSIONS', 'LOCK_EXPIRY_MISSES'
+]
+
+_Labels = typing.Tuple[typing.Tuple[str, str], ...]
+
+SECONDS_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+@dataclasses.dataclass(frozen=True)
+class Metric:
+    """Data class of the definition of a metric."""
+    name: str
+    kind: str
+    description: str
+    buckets: typing.Tuple[float, ...] = ()
+
+
+FETCH_SECONDS = Metric(
+    'fetch_seconds', 'histogram', 'Round trip time of fetch and lock requests.', SECONDS_BUCKETS
+)
+FETCHED_TASKS = Metric(
+    'fetched_tasks', 'histogram', 'External tasks returned by a fetch and lock request.',
+    COUNT_BUCKETS
+)
+EMPTY_POLLS = Metric(
+    'empty_polls_total', 'counter', 'Fetch and lock requests that returned no external task.'
+)
+FETCH_ERRORS = Metric('fetch_errors_total', 'counter', 'Fetch and lock requests that failed.')
+QUEUE_WAIT_SECONDS = Metric(
+    'queue_wait_seconds', 'histogram',
+    'Time fetched external tasks waited for a free handler.', SECONDS_BUCKETS
+)
+HANDLER_SECONDS = Metric(
+    'handler_seconds', 'histogram', 'Duration of handlers.', SECONDS_BUCKETS
+)
+HANDLED_TASKS = Metric(
+    'handled_tasks_total', 'counter', 'External tasks handled, by outcome of the handler.'
+)
+COMPLETION_SECONDS = Metric(
+    'completion_seconds', 'histogram',
+    'Time from the end of a handler until its outcome was reported.', SECONDS_BUCKETS
+)
+FAILED_REPORTS = Metric(
+    'failed_reports_total', 'counter', 'Outcomes of handlers that could not be reported.'
+)
+LOCK_EXTENSIONS = Metric('lock_extensions_total', 'counter', 'Locks that were extended.')
+FAILED_LOCK_EXTENSIONS = Metric(
+    'failed_lock_extensions_total', 'counter', 'Lock extensions that failed.'
+)
+LOCK_EXPIRY_MISSES = Metric(
+    'lock_expiry_misses_total', 'counter',
+    'Outcomes of handlers that were reported after the lock of the external task expired.'
+)
+
+
+def _labels(labels: typing.Optional[typing.Mapping[str, str]]) -> _Labels:
+    if not labels:
+        return ()
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Sink(abc.ABC):
+    """Base class of the sinks workers record their metrics in. Subclasses forward the values
+    e.g. to a metrics library. Both methods are called from the hot paths of workers and from
+    several threads, so they have to be fast and thread-safe.
+    """
+
+    @abc.abstractmethod
+    def increment(
+        self, metric: Metric, labels: typing.Mapping[str, str] = None, value: float = 1
+    ) -> None:
+        """Increment a counter.
+
+        :param metric: The counter.
+        :param labels: Labels of the counter, e.g. the topic.
+        :param value: Value to add.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def observe(
+        self, metric: Metric, value: float, labels: typing.Mapping[str, str] = None
+    ) -> None:
+        """Record a value in a histogram.
+
+        :param metric: The histogram.
+        :param value: The value.
+        :param labels: Labels of the histogram, e.g. the topic.
+        """
+        raise NotImplementedError
+
+
+class NullSink(Sink):
+    """Sink that discards all values."""
+
+    def increment(
+        self, metric: Metric, labels: typing.Mapping[str, str] = None, value: float = 1
+    ) -> None:
+        pass
+
+    def observe(
+        self, metric: Metric, value: float, labels: typing.Mapping[str, str] = None
+    ) -> None:
+        pass
+
+
+@dataclasses.dataclass
+class HistogramSnapshot:
+    """Data class of the values recorded in a histogram. `counts` holds the number of values per
+    bucket that are at most the upper bound of the bucket and greater than the bound of the
+    previous bucket. The last count is of the values greater than all bounds.
+    """
+    buckets: typing.Tuple[float, ...]
+    counts: typing.List[int]
+    count: int = 0
+    sum: float = 0.0
+
+    @property
+    def mean(self) -> typing.Optional[float]:
+        if not self.count:
+            return None
+        return self.sum / self.count
+
+    def merge(self, other: HistogramSnapshot) -> HistogramSnapshot:
+        """Add the values of a histogram with the same buckets.
+
+        :param other: The other histogram.
+        :return: The merged histogram.
+        """
+        return HistogramSnapshot(
+            buckets=self.buckets,
+            counts=[count + other_count for count, other_count in zip(self.counts, other.counts)],
+            count=self.count + other.count,
+            sum=self.sum + other.sum
+        )
+
+
+@dataclasses.dataclass
+class Snapshot:
+    """Data class of the values of all metrics of a sink at one point in time. Values are stored
+    by the name of the metric and its labels.
+    """
+    metrics: typing.Dict[str, Metric]
+    counters: typing.Dict[typing.Tuple[str, _Labels], float]
+    histograms: typing.Dict[typing.Tuple[str, _Labels], HistogramSnapshot]
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Get the value of a counter summed over all labels that are not given.
+
+        :param name: Name of the counter.
+        :param labels: Labels the counter must have.
+        :return: The value.
+        """
+        wanted = set(_labels(labels))
+        return sum(
+            value for (name_, labels_), value in self.counters.items()
+            if name_ == name and wanted.issubset(labels_)
+        )
+
+    def histogram(self, name: str, **labels: str) -> typing.Optional[HistogramSnapshot]:
+        """Get the values of a histogram merged over all labels that are not given.
+
+        :param name: Name of the histogram.
+        :param labels: Labels the histogram must have.
+        :return: The histogram or `None` if no value was recorded.
+        """
+        wanted = set(_labels(labels))
+        merged = None
+        for (name_, labels_), histogram in self.histograms.items():
+            if name_ == name and wanted.issubset(labels_):
+                merged = histogram if merged is None else merged.merge(histogram)
+        return merged
+
+
+class InMemorySink(Sink):
+
+    def __init__(self):
+        """Sink that keeps the values of all metrics in memory. `snapshot` returns a copy of
+        them. It is the default sink of the workers.
+        """
+        self._metrics = {}
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(
+        self, metric: Metric, labels: typing.Mapping[str, str] = None, value: float = 1
+    ) -> None:
+        """Increment a counter.
+
+        :param metric: The counter.
+        :param labels: Labels of the counter, e.g. the topic.
+        :param value: Value to add.
+        """
+        key = metric.name, _labels(labels)
+        with self._lock:
+            self._metrics[metric.name] = metric
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(
+        self, metric: Metric, value: float, labels: typing.Mapping[str, str] = None
+    ) -> None:
+        """Record a value in a histogram.
+
+        :param metric: The histogram.
+        :param value: The value.
+        :param labels: Labels of the histogram, e.g. the topic.
+        """
+        key = metric.name, _labels(labels)
+        index = bisect.bisect_left(metric.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                self._metrics[metric.name] = metric
+                histogram = self._histograms[key] = HistogramSnapshot(
+                    buckets=metric.buckets, counts=[0] * (len(metric.buckets) + 1)
+                )
+            histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.sum += value
+
+    def snapshot(self) -> Snapshot:
+        """Get a copy of the values of all metrics.
+
+        :return: The snapshot.
+        """
+        with self._lock:
+            return Snapshot(
+                metrics=dict(self._metrics),
+                counters=dict(self._counters),
+                histograms={
+                    key: dataclasses.replace(histogram, counts=list(histogram.counts))
+                    for key, histogram in self._histograms.items()
+                }
+            )
+
+    def reset(self) -> None:
+        """Discard all values."""
+        with self._lock:
+            self._metrics.clear()
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def to_prometheus(snapshot: Snapshot, namespace: str = 'pycamunda_worker') -> str:
+    """Export a snapshot in the text exposition format of Prometheus, e.g. to serve it from an
+    http endpoint of the application.
+
+    :param snapshot: The snapshot.
+    :param namespace: Prefix of the names of the metrics.
+    :return: The metrics in the text format.
+    """
+    lines = []
+    for metric_name in sorted(snapshot.metrics):
+        metric = snapshot.metrics[metric_name]
+        name = f'{namespace}_{metric_name}' if namespace else metric_name
+        lines.append(f'# HELP {name} {metric.description}')
+        lines.append(f'# TYPE {name} {metric.kind}')
+        if metric.kind == 'counter':
+            for (name_, labels), value in sorted(snapshot.counters.items()):
+                if name_ == metric_name:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+            continue
+        for (name_, labels), histogram in sorted(
+            snapshot.histograms.items(), key=lambda item: item[0]
+        ):
+            if name_ != metric_name:
+                continue
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (math.inf, ), histogram.counts):
+                cumulative += count
+                bucket_labels = _format_labels(labels + (('le', _format_value(bound)), ))
+                lines.append(f'{name}_bucket{bucket_labels} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}')
+            lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+    return '\n'.join(lines) + '\n' if lines else ''
@@ -16,6 +16,7 @@ URL_SUFFIX = '/migration'
 __all__ = ['Generate', 'Validate', 'Execute']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class MigrationInstruction:
     """Data class of migration instruction as returned by the REST api of Camunda."""
@@ -32,6 +33,7 @@ class MigrationInstruction:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class MigrationPlan:
     """Data class of migration plan as returned by the REST api of Camunda."""
@@ -51,6 +53,7 @@ class MigrationPlan:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class InstructionReport:
     """Data class of instruction report as returned by the Camunda REST api."""
@@ -25,6 +25,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ProcessDefinition:
     """Data class of process definition as returned by the REST api of Camunda."""
@@ -63,6 +64,7 @@ class ProcessDefinition:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ActivityStats:
     """Data class of activity statistics as returned by the REST api of Camunda."""
@@ -84,6 +86,7 @@ class ActivityStats:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ProcessInstanceStats:
     """Data class of process instance statistics as returned by the REST api of Camunda."""
@@ -337,7 +340,7 @@ class Count(pycamunda.base.CamundaRequest):
         return response.json()['count']
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('processDefinitionId')
     id_in = QueryParameter('processDefinitionIdIn')
@@ -24,6 +24,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ProcessInstance:
     """Data class of process instance as returned by the REST api of Camunda."""
@@ -40,10 +41,10 @@ class ProcessInstance:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> ProcessInstance:
         process_instance = cls(
             id_=data['id'],
-            definition_id=data['definitionId'],
+            definition_id=pycamunda.base.intern_string(data['definitionId']),
             business_key=data['businessKey'],
             case_instance_id=data['caseInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base.intern_string(data['tenantId']),
             suspended=data['suspended'],
             links=tuple(pycamunda.resource.Link.load(link_json) for link_json in data['links']),
         )
@@ -58,6 +59,27 @@ class ProcessInstance:
         return process_instance
 
 
+def _load_links(data: typing.List[typing.Mapping[str, typing.Any]]) -> typing.Tuple:
+    return tuple(pycamunda.resource.Link.load(link_json) for link_json in data)
+
+
+def _load_variables(data: typing.Mapping[str, typing.Any]) -> typing.Dict:
+    return {name: pycamunda.variable.Variable.load(var_json) for name, var_json in data.items()}
+
+
+class _ProcessInstanceView(pycamunda.base.LazyRecord, ProcessInstance):
+    """View of a process instance whose attributes are converted on first access."""
+    __slots__ = ('_data', )
+    id_ = pycamunda.base.LazyField('id')
+    definition_id = pycamunda.base.LazyField('definitionId', pycamunda.base.intern_string)
+    business_key = pycamunda.base.LazyField('businessKey')
+    case_instance_id = pycamunda.base.LazyField('caseInstanceId')
+    tenant_id = pycamunda.base.LazyField('tenantId', pycamunda.base.intern_string)
+    suspended = pycamunda.base.LazyField('suspended')
+    links = pycamunda.base.LazyField('links', _load_links)
+    variables = pycamunda.base.LazyField('variables', _load_variables)
+
+
 class Delete(pycamunda.base.CamundaRequest):
 
     id_ = PathParameter('id')
@@ -116,7 +138,11 @@ class GetActivityInstance(pycamunda.base.CamundaRequest):
         return pycamunda.activityinst.ActivityInstance.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(
+    pycamunda.base._ColumnarMixin, pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest
+):
+
+    _record_view = _ProcessInstanceView
 
     process_instance_ids = QueryParameter('processInstanceIds')
     business_key = QueryParameter('businessKey')
@@ -200,7 +226,8 @@ class GetList(pycamunda.base.CamundaRequest):
             sort_by: str = None,
             ascending: bool = True,
             first_result: int = None,
-            max_results: int = None
+            max_results: int = None,
+            lazy: bool = False
     ):
         """Get a list of process instances.
 
@@ -247,6 +274,8 @@ class GetList(pycamunda.base.CamundaRequest):
         :param ascending: Sort order.
         :param first_result: Pagination of results. Index of the first result to return.
         :param max_results: Pagination of results. Maximum number of results to return.
+        :param lazy: Whether to return views of the process instances that convert their
+                     attributes on first access instead of fully loaded process instances.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.process_instance_ids = process_instance_ids
@@ -284,12 +313,14 @@ class GetList(pycamunda.base.CamundaRequest):
         self.ascending = ascending
         self.first_result = first_result
         self.max_results = max_results
+        self.lazy = lazy
 
     def __call__(self, *args, **kwargs) -> typing.Tuple[ProcessInstance]:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
 
-        return tuple(ProcessInstance.load(instance_json) for instance_json in response.json())
+        load = _ProcessInstanceView if self.lazy else ProcessInstance.load
+        return tuple(load(instance_json) for instance_json in response.json())
 
 
 class Get(pycamunda.base.CamundaRequest):
@@ -599,7 +630,7 @@ class VariablesDelete(pycamunda.base.CamundaRequest):
         super().__call__(pycamunda.base.RequestMethod.DELETE, *args, **kwargs)
 
 
-class VariablesGet(pycamunda.base.CamundaRequest):
+class VariablesGet(pycamunda.base._DownloadMixin, pycamunda.base.CamundaRequest):
 
     process_instance_id = PathParameter('id')
     var_name = PathParameter('varName')
@@ -615,6 +646,9 @@ class VariablesGet(pycamunda.base.CamundaRequest):
     ):
         """Get a variable of a process instance.
 
+        The binary value of a file or bytes variable can be streamed with `iter_content` or
+        written to a file with `download` instead of reading it into memory.
+
         :param url: Camunda Rest engine URL.
         :param process_instance_id: Id of the process instance.
         :param var_name: Name of the variable.
@@ -719,7 +753,7 @@ class VariablesModify(pycamunda.base.CamundaRequest):
         super().__call__(pycamunda.base.RequestMethod.POST, *args, **kwargs)
 
 
-class VariablesUpdate(pycamunda.base.CamundaRequest):
+class VariablesUpdate(pycamunda.base._UploadMixin, pycamunda.base.CamundaRequest):
 
     process_instance_id = PathParameter('id')
     var_name = PathParameter('varName')
@@ -740,7 +774,9 @@ class VariablesUpdate(pycamunda.base.CamundaRequest):
         :param url: Camunda Rest engine URL.
         :param process_instance_id: Id of the process instance.
         :param var_name: Name of the variable.
-        :param value: Value of the variable.
+        :param value: Value of the variable. Binary values may be bytes-like objects like
+                      `bytes`, `mmap.mmap` or `memoryview`, file objects or `os.PathLike` paths
+                      of files. They are streamed in chunks without being copied into memory.
         :param type_: Value type of the variable. To send binary variables use the value 'Bytes' and
                       to send the binary value of a file variable use the value 'File' for this
                       parameter.
@@ -775,7 +811,7 @@ class VariablesUpdate(pycamunda.base.CamundaRequest):
     def __call__(self, *args, **kwargs) -> None:
         """Send the request."""
         if self._is_binary():
-            response = super().__call__(pycamunda.base.RequestMethod.POST, *args, **kwargs)
+            response = self._upload()
         else:
             response = super().__call__(pycamunda.base.RequestMethod.PUT, *args, **kwargs)
 
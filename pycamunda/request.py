@@ -87,6 +87,53 @@ class BodyParameterContainer:
                f'{", ".join(k+"="+str(v) for k, v in self.parameters.items())})'
 
 
+def _compile_slot(
+    cls: typing.Any, attribute: RequestParameter
+) -> typing.Tuple[str, str, typing.Optional[typing.Mapping], typing.Optional[typing.Callable]]:
+    """Resolve how the value of a request parameter is read from an instance of `cls`.
+
+    Parameters without a `provide` callable are read directly from the instance dictionary and
+    mapped with their mapping. All other parameters are read using their descriptor or, if the
+    attribute is overridden in a subclass, using `getattr`.
+
+    :param cls: The request class.
+    :param attribute: The request parameter.
+    :return: Tuple of api key, attribute name, mapping and a getter. The getter is `None` if the
+             value can be read from the instance dictionary.
+    """
+    for klass in cls.__mro__:
+        if attribute.name in vars(klass):
+            overridden = vars(klass)[attribute.name] is not attribute
+            break
+    else:
+        overridden = True
+    if overridden:
+        name = attribute.name
+        return attribute.key, name, None, lambda obj, obj_type: getattr(obj, name)
+    if attribute.provide is not None:
+        return attribute.key, attribute.name, None, attribute.__get__
+    return attribute.key, attribute.name, attribute.mapping, None
+
+
+def _compile_container(cls: typing.Any, container: BodyParameterContainer) -> typing.Tuple:
+    """Resolve the slots of the parameters of a container.
+
+    :param cls: The request class.
+    :param container: The container.
+    :return: Tuple of entries that are either a compiled slot, a nested container plan or a
+             constant value.
+    """
+    plan = []
+    for key, val in container.parameters.items():
+        if isinstance(val, BodyParameterContainer):
+            plan.append((key, _compile_container(cls, val)))
+        elif isinstance(val, RequestParameter):
+            plan.append(_compile_slot(cls, val))
+        elif val is not None:
+            plan.append((key, val, None, ...))
+    return tuple(plan)
+
+
 class RequestMeta(abc.ABCMeta):
 
     def __init__(cls, name: str, bases: typing.Any, attr_dict: typing.Dict[str, typing.Any]):
@@ -109,6 +156,21 @@ class RequestMeta(abc.ABCMeta):
             elif isinstance(attr, BodyParameterContainer):
                 cls._containers[key] = attr
 
+        parameters = cls._parameters.values()
+        cls._path_plan = tuple(
+            _compile_slot(cls, attr) for attr in parameters if isinstance(attr, PathParameter)
+        )
+        cls._query_plan = tuple(
+            _compile_slot(cls, attr) for attr in parameters if isinstance(attr, QueryParameter)
+        )
+        cls._body_plan = tuple(
+            _compile_slot(cls, attr) for attr in parameters
+            if isinstance(attr, BodyParameter) and not attr.hidden
+        )
+        cls._container_plan = tuple(
+            (attr.key, _compile_container(cls, attr)) for attr in cls._containers.values()
+        )
+
 
 class Request(metaclass=RequestMeta):
 
@@ -124,71 +186,82 @@ class Request(metaclass=RequestMeta):
     @property
     def url(self) -> str:
         params = {}
-        missing_params = {}
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, PathParameter):
+        values = self.__dict__
+        obj_type = type(self)
+        for key, name, mapping, getter in self._path_plan:
+            if getter is None:
+                value = values[name]
+                params[key] = value if mapping is None else mapping[value]
+            else:
                 try:
-                    params[attribute.key] = getattr(self, attribute.name)
+                    params[key] = getter(self, obj_type)
                 except AttributeError:
-                    missing_params[attribute.key] = ''
-        return self._url.format(**{**params, **missing_params}).rstrip('/')
+                    params[key] = ''
+        return self._url.format(**params).rstrip('/')
 
     @abc.abstractmethod
     def __call__(self, *args, **kwargs):
         return NotImplementedError
 
-    def query_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
-        query = {}
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, QueryParameter):
-                try:
-                    value = getattr(self, attribute.name)
-                except KeyError:
-                    pass
+    def _collect(
+        self, plan: typing.Tuple, query: typing.Dict[str, typing.Any], apply: typing.Callable
+    ) -> typing.Dict[str, typing.Any]:
+        """Collect the values of the parameters of a plan that are set and not `None`.
+
+        :param plan: The compiled slots of the parameters.
+        :param query: Dictionary the values are added to.
+        :param apply: Callable that is applied to each value or `None`.
+        """
+        values = self.__dict__
+        obj_type = type(self)
+        for key, name, mapping, getter in plan:
+            try:
+                if getter is None:
+                    value = values[name]
+                    if mapping is not None:
+                        value = mapping[value]
                 else:
-                    if value is not None:
-                        query[attribute.key] = value
+                    value = getter(self, obj_type)
+            except KeyError:
+                continue
+            if value is not None:
+                query[key] = value if apply is None else apply(value)
+        return query
 
-        if apply is None:
-            return query
-        return {key: apply(value) for key, value in query.items()}
+    def query_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
+        return self._collect(self._query_plan, {}, apply)
 
-    def _traverse(self, container: BodyParameterContainer) -> typing.Dict[str, typing.Any]:
+    def _traverse(self, plan: typing.Tuple) -> typing.Dict[str, typing.Any]:
         query = {}
-        for key, val in container.parameters.items():
-            if isinstance(val, BodyParameterContainer):
-                query[key] = self._traverse(val)
-            else:
-                try:
-                    value = getattr(self, val.name)
-                except KeyError:
-                    pass
-                except AttributeError:
-                    if val is not None:
-                        query[key] = val
+        values = self.__dict__
+        obj_type = type(self)
+        for entry in plan:
+            if len(entry) == 2:
+                query[entry[0]] = self._traverse(entry[1])
+                continue
+            key, name, mapping, getter = entry
+            if getter is Ellipsis:
+                query[key] = name
+                continue
+            try:
+                if getter is None:
+                    value = values[name]
+                    if mapping is not None:
+                        value = mapping[value]
                 else:
-                    if value is not None:
-                        query[key] = value
+                    value = getter(self, obj_type)
+            except KeyError:
+                continue
+            if value is not None:
+                query[key] = value
         return query
 
     def body_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
         query = {}
-        for name, attribute in self._containers.items():
-            if isinstance(attribute, BodyParameterContainer):
-                query[attribute.key] = self._traverse(attribute)
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, BodyParameter) and not attribute.hidden:
-                try:
-                    value = getattr(self, attribute.name)
-                except KeyError:
-                    pass
-                else:
-                    if value is not None:
-                        query[attribute.key] = value
-
-        if apply is None:
-            return query
-        return {key: apply(value) for key, value in query.items()}
+        for key, plan in self._container_plan:
+            value = self._traverse(plan)
+            query[key] = value if apply is None else apply(value)
+        return self._collect(self._body_plan, query, apply)
 
     def __repr__(self) -> str:
         keys_values = {}
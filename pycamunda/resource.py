@@ -7,10 +7,13 @@ import dataclasses
 import typing
 import enum
 
+import pycamunda.base
+
 
 __all__ = ['ResourceType']
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Link:
     """Data class of link as returned by the REST api of Camunda."""
@@ -27,6 +30,7 @@ class Link:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class ResourceOptions:
     """Data class of resource options as returned by the REST api of Camunda."""
@@ -23,6 +23,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Task:
     """Data class of task as returned by the REST api of Camunda."""
@@ -51,7 +52,7 @@ class Task:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> Task:
         task = cls(
             assignee=data['assignee'],
-            case_definition_id=data['caseDefinitionId'],
+            case_definition_id=pycamunda.base.intern_string(data['caseDefinitionId']),
             case_execution_id=data['caseExecutionId'],
             case_instance_id=data['caseInstanceId'],
             delegation_state=data['delegationState'],
@@ -63,10 +64,10 @@ class Task:
             owner=data['owner'],
             parent_task_id=data['parentTaskId'],
             priority=data['priority'],
-            process_definition_id=data['processDefinitionId'],
+            process_definition_id=pycamunda.base.intern_string(data['processDefinitionId']),
             process_instance_id=data['processInstanceId'],
             suspended=data['suspended'],
-            task_definition_key=data['taskDefinitionKey'],
+            task_definition_key=pycamunda.base.intern_string(data['taskDefinitionKey']),
         )
         if data['created'] is not None:
             task.created = pycamunda.base.from_isoformat(data['created'])
@@ -78,11 +79,41 @@ class Task:
         return task
 
 
+class _TaskView(pycamunda.base.LazyRecord, Task):
+    """View of a task whose attributes are converted on first access."""
+    __slots__ = ('_data', )
+    assignee = pycamunda.base.LazyField('assignee')
+    case_definition_id = pycamunda.base.LazyField('caseDefinitionId', pycamunda.base.intern_string)
+    case_execution_id = pycamunda.base.LazyField('caseExecutionId')
+    case_instance_id = pycamunda.base.LazyField('caseInstanceId')
+    delegation_state = pycamunda.base.LazyField('delegationState')
+    description = pycamunda.base.LazyField('description')
+    execution_id = pycamunda.base.LazyField('executionId')
+    form_key = pycamunda.base.LazyField('formKey')
+    id_ = pycamunda.base.LazyField('id')
+    name = pycamunda.base.LazyField('name')
+    owner = pycamunda.base.LazyField('owner')
+    parent_task_id = pycamunda.base.LazyField('parentTaskId')
+    priority = pycamunda.base.LazyField('priority')
+    process_definition_id = pycamunda.base.LazyField(
+        'processDefinitionId', pycamunda.base.intern_string
+    )
+    process_instance_id = pycamunda.base.LazyField('processInstanceId')
+    suspended = pycamunda.base.LazyField('suspended')
+    task_definition_key = pycamunda.base.LazyField(
+        'taskDefinitionKey', pycamunda.base.intern_string
+    )
+    created = pycamunda.base.LazyField('created', pycamunda.base.from_isoformat)
+    due = pycamunda.base.LazyField('due', pycamunda.base.from_isoformat)
+    follow_up = pycamunda.base.LazyField('followUp', pycamunda.base.from_isoformat)
+
+
 class DelegationState(enum.Enum):
     pending = 'PENDING'
     resolved = 'RESOLVED'
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class IdentityLink:
     """Data class of an identity link related to user tasks as returned by the REST api of
@@ -101,6 +132,7 @@ class IdentityLink:
         )
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Comment:
     """Data class of a comment that is attached to an user task."""
@@ -129,6 +161,7 @@ class Comment:
         return comment
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class CountByCandidateGroup:
     """Data class of task count by candidate group."""
@@ -163,7 +196,11 @@ class Get(pycamunda.base.CamundaRequest):
         return Task.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(
+    pycamunda.base._ColumnarMixin, pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest
+):
+
+    _record_view = _TaskView
 
     process_instance_id = QueryParameter('processInstanceId')
     process_instance_id_in = QueryParameter('processInstanceIdIn')
@@ -332,7 +369,8 @@ class GetList(pycamunda.base.CamundaRequest):
         sort_by: str = None,
         ascending: bool = True,
         first_result: int = None,
-        max_results: int = None
+        max_results: int = None,
+        lazy: bool = False
     ):
         """Get a list of user tasks.
 
@@ -421,6 +459,8 @@ class GetList(pycamunda.base.CamundaRequest):
         :param ascending: Sort order.
         :param first_result: Pagination of results. Index of the first result to return.
         :param max_results: Pagination of results. Maximum number of results to return.
+        :param lazy: Whether to return views of the tasks that convert their attributes on first
+                     access instead of fully loaded tasks.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.process_instance_id = process_instance_id
@@ -492,12 +532,14 @@ class GetList(pycamunda.base.CamundaRequest):
         self.ascending = ascending
         self.first_result = first_result
         self.max_results = max_results
+        self.lazy = lazy
 
     def __call__(self, *args, **kwargs) -> typing.Tuple[Task]:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
 
-        return tuple(Task.load(task_json) for task_json in response.json())
+        load = _TaskView if self.lazy else Task.load
+        return tuple(load(task_json) for task_json in response.json())
 
 
 class Claim(pycamunda.base.CamundaRequest):
@@ -963,7 +1005,7 @@ class CommentCreate(pycamunda.base.CamundaRequest):
         return Comment.load(data=response.json())
 
 
-class LocalVariablesGet(pycamunda.base.CamundaRequest):
+class LocalVariablesGet(pycamunda.base._DownloadMixin, pycamunda.base.CamundaRequest):
 
     task_id = PathParameter('id')
     var_name = PathParameter('varName')
@@ -979,7 +1021,9 @@ class LocalVariablesGet(pycamunda.base.CamundaRequest):
     ):
         """Get a local variable of an user task.
 
-        Local variables are variables that do only exist in the context of a task.
+        Local variables are variables that do only exist in the context of a task. The binary
+        value of a file or bytes variable can be streamed with `iter_content` or written to a file
+        with `download` instead of reading it into memory.
 
         :param url: Camunda Rest engine URL.
         :param task_id: Id of the task.
@@ -1089,7 +1133,7 @@ class LocalVariablesModify(pycamunda.base.CamundaRequest):
         super().__call__(pycamunda.base.RequestMethod.POST, *args, **kwargs)
 
 
-class LocalVariablesUpdate(pycamunda.base.CamundaRequest):
+class LocalVariablesUpdate(pycamunda.base._UploadMixin, pycamunda.base.CamundaRequest):
 
     task_id = PathParameter('id')
     var_name = PathParameter('varName')
@@ -1112,7 +1156,9 @@ class LocalVariablesUpdate(pycamunda.base.CamundaRequest):
         :param url: Camunda Rest engine URL.
         :param task_id: Id of the task.
         :param var_name: Name of the variable.
-        :param value: Value of the variable.
+        :param value: Value of the variable. Binary values may be bytes-like objects like
+                      `bytes`, `mmap.mmap` or `memoryview`, file objects or `os.PathLike` paths
+                      of files. They are streamed in chunks without being copied into memory.
         :param type_: Value type of the variable. To send binary variables use the value 'Bytes' and
                       to send the binary value of a file variable use the value 'File' for this
                       parameter.
@@ -1145,7 +1191,7 @@ class LocalVariablesUpdate(pycamunda.base.CamundaRequest):
     def __call__(self, *args, **kwargs) -> None:
         """Send the request."""
         if self._is_binary():
-            response = super().__call__(pycamunda.base.RequestMethod.POST, *args, **kwargs)
+            response = self._upload()
         else:
             response = super().__call__(pycamunda.base.RequestMethod.PUT, *args, **kwargs)
 
@@ -23,6 +23,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class Tenant:
     """Data class of tenant as returned by the REST api of Camunda."""
@@ -160,7 +161,7 @@ class GroupMemberOptions(pycamunda.base.CamundaRequest):
         return pycamunda.resource.ResourceOptions.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     name = QueryParameter('name')
@@ -21,6 +21,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
 class User:
     """Data class of user as returned by the REST api of Camunda."""
@@ -28,7 +29,7 @@ class User:
     first_name: str
     last_name: str
     email: str = None
-    display_name = None
+    display_name: str = None
 
     @classmethod
     def load(cls, data: typing.Mapping[str, typing.Any]) -> User:
@@ -123,7 +124,7 @@ class Count(pycamunda.base.CamundaRequest):
         return response.json()['count']
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     first_name = QueryParameter('firstName')
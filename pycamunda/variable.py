@@ -3,20 +3,105 @@
 """This module provides access to the variable instance REST api of Camunda"""
 
 from __future__ import annotations
+import collections.abc
+import copy
 import dataclasses
+import json
 import typing
+import urllib.parse
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 import pycamunda.base
+import pycamunda.bulk
+import pycamunda.client
 from pycamunda.request import QueryParameter, PathParameter
 
 URL_SUFFIX = '/variable-instance'
 
+# Parameter of `GetList` that filters by the ids of each scope of `load_variables` and attribute
+# of `VariableInstance` holding the id. The variables of a process instance belong to its root
+# execution, whose id is the id of the process instance.
+_SCOPES = {
+    'process_instance': ('execution_id_in', 'execution_id'),
+    'execution': ('execution_id_in', 'execution_id'),
+    'task': ('task_id_in', 'task_id')
+}
+
+
+# Marks variables of `TrackedVariables` that did not change.
+_UNCHANGED = object()
+
 
-__all__ = ['GetList', 'Get']
+__all__ = ['GetList', 'Get', 'load_variables', 'loads_json', 'TrackedVariables']
+
+
+def loads_json(value: typing.Union[str, bytes]) -> typing.Any:
+    """Decode a json document using orjson if it is installed and the json module otherwise.
+    Documents orjson does not accept, e.g. with integers beyond 64 bits, are decoded by the json
+    module as well.
+
+    :param value: The json document.
+    :return: The decoded value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+def _decode(
+    value: typing.Any, type_: str, value_info: typing.Optional[typing.Mapping]
+) -> typing.Any:
+    """Decode the value of a variable as returned by the REST api of Camunda according to its
+    type. Serialized Json variables and Object variables in json format are decoded and Date
+    variables are parsed. Other values are returned unchanged.
+    """
+    if value is None:
+        return None
+    if type_ == 'Json' and isinstance(value, str):
+        return loads_json(value)
+    if type_ == 'Object' and isinstance(value, str) and value_info and (
+        value_info.get('serializationDataFormat') == 'application/json'
+    ):
+        return loads_json(value)
+    if type_ == 'Date' and isinstance(value, str):
+        return pycamunda.base.from_isoformat(value)
+    return value
+
+
+class _TypedValueMixin:
+    __slots__ = ()
+    _cache_slots = ('_typed_value_cache', )
+
+    @property
+    def typed_value(self) -> typing.Any:
+        """The value decoded according to the type of the variable. Json variables and Object
+        variables serialized as json are decoded and Date variables are parsed into datetimes.
+        Other values are the same as `value`. The value is decoded on first access and cached
+        until `value` is replaced.
+        """
+        try:
+            value, typed_value = self._typed_value_cache
+            if value is self.value:
+                return typed_value
+        except AttributeError:
+            pass
+        typed_value = _decode(self.value, self.type_, self.value_info)
+        self._typed_value_cache = self.value, typed_value
+        return typed_value
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
-class Variable:
+class Variable(_TypedValueMixin):
     """Data class of variable as returned by the REST api of Camunda."""
     value: typing.Any
     type_: str
@@ -27,7 +112,7 @@ class Variable:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> Variable:
         variable = cls(
             value=data['value'],
-            type_=data['type'],
+            type_=pycamunda.base.intern_string(data['type']),
             value_info=data['valueInfo']
         )
         try:
@@ -37,8 +122,9 @@ class Variable:
         return variable
 
 
+@pycamunda.base.slotted
 @dataclasses.dataclass
-class VariableInstance:
+class VariableInstance(_TypedValueMixin):
     """Data class of variable instance as returned by the REST api of Camunda."""
     id_: str
     name: str
@@ -59,7 +145,7 @@ class VariableInstance:
         return cls(
             id_=data['id'],
             name=data['name'],
-            type_=data['type'],
+            type_=pycamunda.base.intern_string(data['type']),
             value=data['value'],
             value_info=data['valueInfo'],
             process_instance_id=data['processInstanceId'],
@@ -68,12 +154,34 @@ class VariableInstance:
             case_execution_id=data['caseExecutionId'],
             task_id=data['taskId'],
             activity_instance_id=data['activityInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base.intern_string(data['tenantId']),
             error_message=data['errorMessage']
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class _VariableInstanceView(pycamunda.base.LazyRecord, VariableInstance):
+    """View of a variable instance whose attributes are converted on first access."""
+    __slots__ = ('_data', )
+    id_ = pycamunda.base.LazyField('id')
+    name = pycamunda.base.LazyField('name')
+    type_ = pycamunda.base.LazyField('type', pycamunda.base.intern_string)
+    value = pycamunda.base.LazyField('value')
+    value_info = pycamunda.base.LazyField('valueInfo')
+    process_instance_id = pycamunda.base.LazyField('processInstanceId')
+    execution_id = pycamunda.base.LazyField('executionId')
+    case_instance_id = pycamunda.base.LazyField('caseInstanceId')
+    case_execution_id = pycamunda.base.LazyField('caseExecutionId')
+    task_id = pycamunda.base.LazyField('taskId')
+    activity_instance_id = pycamunda.base.LazyField('activityInstanceId')
+    tenant_id = pycamunda.base.LazyField('tenantId', pycamunda.base.intern_string)
+    error_message = pycamunda.base.LazyField('errorMessage')
+
+
+class GetList(
+    pycamunda.base._ColumnarMixin, pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest
+):
+
+    _record_view = _VariableInstanceView
 
     name = QueryParameter('variableName')
     name_like = QueryParameter('variableNameLike')
@@ -118,7 +226,8 @@ class GetList(pycamunda.base.CamundaRequest):
         ascending: bool = True,
         first_result: int = None,
         max_results: int = None,
-        deserialize_values: bool = False
+        deserialize_values: bool = False,
+        lazy: bool = False
     ):
         """Get a list of variable instances.
 
@@ -139,6 +248,8 @@ class GetList(pycamunda.base.CamundaRequest):
         :param max_results: Pagination of results. Maximum number of results to return.
         :param deserialize_values: Whether serializable variable values are deserialized on server
                                    side.
+        :param lazy: Whether to return views of the variable instances that convert their
+                     attributes on first access instead of fully loaded variable instances.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.name = name
@@ -154,6 +265,7 @@ class GetList(pycamunda.base.CamundaRequest):
         self.first_result = first_result
         self.max_results = max_results
         self.deserialize_values = deserialize_values
+        self.lazy = lazy
 
         self.variable_values = []
 
@@ -239,7 +351,8 @@ class GetList(pycamunda.base.CamundaRequest):
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
 
-        return tuple(VariableInstance.load(variable_json) for variable_json in response.json())
+        load = _VariableInstanceView if self.lazy else VariableInstance.load
+        return tuple(load(variable_json) for variable_json in response.json())
 
 
 class Get(pycamunda.base.CamundaRequest):
@@ -264,3 +377,220 @@ class Get(pycamunda.base.CamundaRequest):
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
 
         return VariableInstance.load(response.json())
+
+
+def _chunk_ids(
+    ids: typing.Sequence[str], max_length: int
+) -> typing.Iterator[typing.List[str]]:
+    """Split ids into chunks whose comma separated and url encoded form is at most `max_length`
+    characters long. Each chunk holds at least one id.
+    """
+    chunk, length = [], 0
+    for id_ in ids:
+        id_length = len(urllib.parse.quote(id_, safe='')) + 3  # an encoded comma
+        if chunk and length + id_length > max_length:
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(id_)
+        length += id_length
+    if chunk:
+        yield chunk
+
+
+def load_variables(
+    url: str,
+    ids: typing.Iterable[str],
+    scope: str = 'process_instance',
+    deserialize_values: bool = False,
+    max_workers: int = 4,
+    max_url_length: int = 4000,
+    page_size: int = 1000,
+    client: pycamunda.client.Client = None
+) -> typing.Dict[str, typing.Dict[str, Variable]]:
+    """Load the variables of many process instances, executions or tasks with a few variable
+    instance queries instead of a request per id. The ids are split into chunks that keep the url
+    of each query below `max_url_length` and the chunks are requested concurrently, page by page.
+
+    Like `processinst.VariablesGetList`, only the variables of the process instances themselves
+    are returned for process instances, not the local variables of their executions and tasks.
+    For executions and tasks, their local variables are returned.
+
+    :param url: Camunda Rest engine URL.
+    :param ids: Ids of the process instances, executions or tasks.
+    :param scope: Scope the ids belong to. 'process_instance', 'execution' or 'task'.
+    :param deserialize_values: Whether serializable variable values are deserialized on server
+                               side.
+    :param max_workers: Maximum number of queries that are sent at the same time.
+    :param max_url_length: Maximum length of the url of a query.
+    :param page_size: Maximum number of variables returned by a single query.
+    :param client: Client used for the queries. Defaults to the default client.
+    :return: Mapping of each id to a mapping of the names of its variables to the variables.
+    """
+    if page_size < 1:
+        raise ValueError('page_size must be at least 1.')
+    try:
+        parameter, attribute = _SCOPES[scope]
+    except KeyError:
+        raise ValueError(f'scope must be one of {", ".join(_SCOPES)}.') from None
+    ids = list(dict.fromkeys(ids))
+    variables = {id_: {} for id_ in ids}
+    if not ids:
+        return variables
+
+    # The first result of later pages is reserved with enough digits for any page.
+    longest_page = GetList(
+        url, deserialize_values=deserialize_values, first_result=10 ** 12, max_results=page_size
+    )
+    query_url = requests.Request(
+        'GET', url + URL_SUFFIX, params=longest_page.query_parameters()
+    ).prepare().url
+    key = GetList.__dict__[parameter].key
+    max_length = max_url_length - len(query_url) - len(key) - 2
+
+    queries = []
+    for chunk in _chunk_ids(ids, max_length):
+        query = GetList(
+            url, deserialize_values=deserialize_values, first_result=0, max_results=page_size
+        )
+        # Camunda expects the ids of a single comma separated parameter.
+        setattr(query, parameter, ','.join(chunk))
+        queries.append(query)
+
+    executor = pycamunda.bulk.BulkExecutor(max_workers=max_workers, ordered=False, client=client)
+    while queries:
+        # Chunks whose page was full are queried again for their next page.
+        next_pages = []
+        for result in executor.map(queries):
+            if not result.ok:
+                raise result.exception
+            if len(result.result) >= page_size:
+                query = result.request
+                next_pages.append(query._page(query.first_result + page_size, page_size))
+            for instance in result.result:
+                if scope != 'task' and instance.task_id is not None:
+                    continue
+                try:
+                    scope_variables = variables[getattr(instance, attribute)]
+                except KeyError:
+                    continue
+                scope_variables[instance.name] = Variable(
+                    value=instance.value, type_=instance.type_, value_info=instance.value_info
+                )
+        queries = next_pages
+    return variables
+
+
+class TrackedVariables(collections.abc.MutableMapping):
+
+    def __init__(self, variables: typing.Mapping[str, Variable]):
+        """Mapping of variables that records the variables it is created with, e.g. as returned
+        by `processinst.VariablesGetList` or as `variables` of an external task. Variables can be
+        set, replaced and deleted like in a dict. `apply_to` adds only the variables that changed
+        and the deleted ones to a request instead of sending all variables back.
+
+        A variable is changed if its value, type or value info differs from the loaded one, or if
+        its `typed_value` was modified in place. Plain values that are set get no type, so Camunda
+        infers it.
+
+        :param variables: The loaded variables by name.
+        """
+        self._variables = dict(variables)
+        self._snapshot = {
+            name: copy.deepcopy((variable.value, variable.type_, variable.value_info))
+            for name, variable in self._variables.items()
+        }
+
+    def __getitem__(self, name: str) -> Variable:
+        return self._variables[name]
+
+    def __setitem__(self, name: str, variable: typing.Union[Variable, typing.Any]) -> None:
+        if not isinstance(variable, Variable):
+            variable = Variable(value=variable, type_=None, value_info=None)
+        self._variables[name] = variable
+
+    def __delitem__(self, name: str) -> None:
+        del self._variables[name]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._variables)
+
+    def __len__(self) -> int:
+        return len(self._variables)
+
+    def set(
+        self, name: str, value: typing.Any, type_: str = None, value_info: typing.Any = None
+    ) -> None:
+        """Set a variable.
+
+        :param name: Name of the variable.
+        :param value: Value of the variable.
+        :param type_: Value type of the variable.
+        :param value_info: Additional information regarding the value type.
+        """
+        self._variables[name] = Variable(value=value, type_=type_, value_info=value_info)
+
+    def _changed_value(self, name: str, variable: Variable) -> typing.Any:
+        """Get the value to send for a variable or `_UNCHANGED` if it did not change."""
+        loaded = self._snapshot.get(name)
+        if loaded is None:
+            return variable.value
+        value, type_, value_info = loaded
+        if variable.type_ != type_ or variable.value_info != value_info:
+            return variable.value
+        if variable.value is not value and variable.value != value:
+            return variable.value
+        try:
+            raw, typed_value = variable._typed_value_cache
+        except AttributeError:
+            return _UNCHANGED
+        if raw is variable.value and isinstance(typed_value, (dict, list)) and (
+            typed_value != _decode(raw, variable.type_, variable.value_info)
+        ):
+            return json.dumps(typed_value)
+        return _UNCHANGED
+
+    def changed(self) -> typing.Dict[str, Variable]:
+        """Get the variables that were added or changed since they were loaded.
+
+        :return: The changed variables by name.
+        """
+        changed = {}
+        for name, variable in self._variables.items():
+            value = self._changed_value(name, variable)
+            if value is not _UNCHANGED:
+                changed[name] = Variable(
+                    value=value, type_=variable.type_, value_info=variable.value_info
+                )
+        return changed
+
+    def deleted(self) -> typing.List[str]:
+        """Get the names of the loaded variables that were deleted.
+
+        :return: The names.
+        """
+        return [name for name in self._snapshot if name not in self._variables]
+
+    def apply_to(self, request: pycamunda.base.CamundaRequest) -> pycamunda.base.CamundaRequest:
+        """Add the changed variables to a request with an `add_variable` method and the deleted
+        ones to its `deletions`, e.g. `processinst.VariablesModify` or
+        `externaltask.Complete`.
+
+        :param request: The request.
+        :return: The request.
+        """
+        deleted = self.deleted()
+        if deleted:
+            if not hasattr(request, 'deletions'):
+                raise ValueError(
+                    f'{type(request).__name__} cannot delete the variables {", ".join(deleted)}.'
+                )
+            deletions = request.deletions or []
+            if isinstance(deletions, str):
+                deletions = [deletions]
+            request.deletions = list(deletions) + deleted
+        for name, variable in self.changed().items():
+            request.add_variable(
+                name=name, value=variable.value, type_=variable.type_,
+                value_info=variable.value_info
+            )
+        return request
@@ -0,0 +1,1211 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides runtimes for external task workers that fetch external tasks of
+multiple topics, pass them to handlers and report their outcome to Camunda."""
+
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import queue
+import threading
+import time
+import traceback
+import typing
+
+import pycamunda
+import pycamunda.aio
+import pycamunda.base
+import pycamunda.bulk
+import pycamunda.client
+import pycamunda.externaltask
+import pycamunda.metrics
+import pycamunda.variable
+
+
+__all__ = ['AsyncWorker', 'BPMNError', 'Subscription', 'Worker']
+
+_logger = logging.getLogger(__name__)
+
+_Handler = typing.Callable[
+    [pycamunda.externaltask.ExternalTask], typing.Optional[typing.Mapping[str, typing.Any]]
+]
+
+# A lock is extended when less than this fraction of its duration is left. Locks with less than
+# _EXTEND_WITHIN left are extended in the same pass.
+_EXTEND_AT = 1 / 3
+_EXTEND_WITHIN = 2 / 3
+
+# Fetched external tasks that wait for a free handler thread are expected to start within this
+# fraction of the shortest lock duration.
+_MAX_QUEUED_SHARE = 1 / 2
+# Weight of the latest handler latency in its exponential moving average.
+_LATENCY_WEIGHT = 0.2
+
+# Number of threads that send the lock extensions of a pass or the unlocks on shutdown.
+_BULK_THREADS = 4
+# Seconds to wait before the first retry of a report. The delay doubles with each retry.
+_REPORT_BACKOFF = 0.5
+
+
+class BPMNError(Exception):
+
+    def __init__(
+        self,
+        error_code: str,
+        error_message: str = None,
+        variables: typing.Mapping[str, typing.Any] = None
+    ):
+        """Exception that is raised by a handler to report a business error for the external
+        task it handles.
+
+        :param error_code: Error code that identifies the predefined error.
+        :param error_message: Error message that describes the error.
+        :param variables: Variables to send to the Camunda process instance.
+        """
+        super().__init__(error_code, error_message)
+        self.error_code = error_code
+        self.error_message = error_message
+        self.variables = variables if variables is not None else {}
+
+    def __reduce__(self) -> typing.Tuple:
+        return type(self), (self.error_code, self.error_message, self.variables)
+
+
+@dataclasses.dataclass
+class Subscription:
+    """Data class of a topic a worker fetches external tasks for."""
+    topic: str
+    handler: _Handler
+    lock_duration: int = 30000
+    variables: typing.List[str] = None
+    deserialize_values: bool = False
+    use_processes: bool = False
+    weight: float = 1.0
+    priority: int = 0
+
+
+def _add_variables(
+    request: pycamunda.base.CamundaRequest, variables: typing.Mapping[str, typing.Any]
+) -> None:
+    for name, value in variables.items():
+        if isinstance(value, pycamunda.variable.Variable):
+            request.add_variable(
+                name=name, value=value.value, type_=value.type_, value_info=value.value_info
+            )
+        else:
+            request.add_variable(name=name, value=value)
+
+
+@dataclasses.dataclass
+class _Lock:
+    task_id: str
+    duration: int
+    expires: float
+    due: float
+
+
+class _LockTracker:
+    """Tracks the locks of the external tasks that are handled by a worker. Times are measured
+    with `time.monotonic` on the side of the worker, starting before the request that acquired or
+    extended a lock was sent, so clock differences to the Camunda server do not matter.
+
+    This class is not thread-safe.
+    """
+
+    def __init__(self):
+        self._locks = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def track(self, task_id: str, duration: int, locked_at: float) -> None:
+        """Start tracking the lock of an external task.
+
+        :param task_id: Id of the external task.
+        :param duration: Lock duration in milliseconds.
+        :param locked_at: Time before the lock was requested.
+        """
+        self._locks[task_id] = _Lock(task_id=task_id, duration=duration, expires=0.0, due=0.0)
+        self.extended(task_id, locked_at)
+
+    def untrack(self, task_id: str) -> None:
+        """Stop tracking the lock of an external task."""
+        self._locks.pop(task_id, None)
+
+    def expires(self, task_id: str) -> typing.Optional[float]:
+        """Time at which the lock of an external task expires or `None` if it is not tracked."""
+        lock = self._locks.get(task_id)
+        return None if lock is None else lock.expires
+
+    def next_due(self) -> typing.Optional[float]:
+        """Time at which the next lock has to be extended or `None` if no lock is tracked."""
+        return min((lock.due for lock in self._locks.values()), default=None)
+
+    def due(self, now: float) -> typing.List[_Lock]:
+        """Get the locks to extend in a pass at `now`. If any lock is due, all locks that would
+        become due soon are returned as well.
+
+        :param now: Current time.
+        :return: The locks to extend.
+        """
+        next_due = self.next_due()
+        if next_due is None or next_due > now:
+            return []
+        return [
+            lock for lock in self._locks.values()
+            if lock.due <= now or lock.expires - now <= lock.duration / 1000 * _EXTEND_WITHIN
+        ]
+
+    def extended(self, task_id: str, sent_at: float) -> None:
+        """Record that the lock of an external task was extended.
+
+        :param task_id: Id of the external task.
+        :param sent_at: Time before the extension was requested.
+        """
+        lock = self._locks.get(task_id)
+        if lock is not None:
+            duration = lock.duration / 1000
+            lock.expires = sent_at + duration
+            lock.due = lock.expires - duration * _EXTEND_AT
+
+    def failed(self, task_id: str, now: float) -> bool:
+        """Record that extending the lock of an external task failed. The extension is retried
+        after half of the time that is left. Locks that expired are not tracked anymore.
+
+        :param task_id: Id of the external task.
+        :param now: Current time.
+        :return: Whether the lock was tracked.
+        """
+        lock = self._locks.get(task_id)
+        if lock is None:
+            return False
+        left = lock.expires - now
+        if left <= 0:
+            del self._locks[task_id]
+        else:
+            lock.due = now + left / 2
+        return True
+
+
+class _FairQueue:
+    """Local queue of fetched external tasks that waits for free handler threads. It keeps a
+    queue per topic, so a busy topic cannot delay the external tasks of other topics for long.
+
+    Topics with a higher priority are served first. Topics with the same priority share the
+    handler threads in proportion to their weights: each topic has a virtual time that advances by
+    the inverse of its weight with each external task that is taken, and the topic with the
+    smallest virtual time is served next. A topic whose queue was empty starts at least at the
+    virtual time of the topic served last, so it cannot save up a share while it is idle. Within a
+    topic, external tasks with a higher priority are taken first and otherwise in the order they
+    were fetched.
+
+    This class is not thread-safe.
+    """
+
+    def __init__(self, subscriptions: typing.Mapping[str, Subscription]):
+        self.subscriptions = subscriptions
+        self._queues = {}
+        self._virtual_times = {}
+        self._now = 0.0
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(len(pending) for pending in self._queues.values())
+
+    def push(self, task: pycamunda.externaltask.ExternalTask) -> None:
+        """Add a fetched external task."""
+        topic = task.topic_name
+        pending = self._queues.setdefault(topic, [])
+        if not pending:
+            self._virtual_times[topic] = max(self._virtual_times.get(topic, 0.0), self._now)
+        heapq.heappush(pending, (-(task.priority or 0), next(self._order), task))
+
+    def pop(self) -> pycamunda.externaltask.ExternalTask:
+        """Take the external task to handle next."""
+        topic = min(
+            (topic for topic, pending in self._queues.items() if pending),
+            key=lambda topic: (-self.subscriptions[topic].priority, self._virtual_times[topic])
+        )
+        _, _, task = heapq.heappop(self._queues[topic])
+        self._now = self._virtual_times[topic]
+        self._virtual_times[topic] += 1 / self.subscriptions[topic].weight
+        return task
+
+
+async def _first_completed(*awaitables: typing.Awaitable) -> None:
+    """Wait until the first of the awaitables completes and cancel the others."""
+    futures = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for future in futures:
+            if not future.done():
+                future.cancel()
+
+
+class _BaseWorker:
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        async_response_timeout: int = 20000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 10000,
+        extend_locks: bool = True,
+        report_retries: int = 3,
+        metrics: pycamunda.metrics.Sink = None
+    ):
+        self.url = url
+        self.worker_id = worker_id
+        self.async_response_timeout = async_response_timeout
+        self.use_priority = use_priority
+        self.retries = retries
+        self.retry_timeout = retry_timeout
+        self.extend_locks = extend_locks
+        self.report_retries = report_retries
+        self.metrics = metrics if metrics is not None else pycamunda.metrics.InMemorySink()
+        self.subscriptions = {}
+        self._locks = _LockTracker()
+        self._unfinished = set()
+        self._drain_deadline = None
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: _Handler,
+        lock_duration: int = 30000,
+        variables: typing.Iterable[str] = None,
+        deserialize_values: bool = False
+    ) -> Subscription:
+        """Register a handler for the external tasks of a topic.
+
+        The handler is called with the external task. It returns a mapping of variables to
+        complete the external task with or `None`. Values of type `pycamunda.variable.Variable`
+        are sent with their type. To report a business error the handler raises `BPMNError`, any
+        other exception is reported as failure of the external task.
+
+        :param topic: Name of the topic.
+        :param handler: The handler.
+        :param lock_duration: Duration to lock the fetched external tasks for in milliseconds.
+        :param variables: Variables to fetch with the external tasks. If set to `None` all
+                          variables are fetched.
+        :param deserialize_values: Whether serializable variable values are deserialized on
+                                   server side.
+        :return: The subscription.
+        """
+        subscription = Subscription(
+            topic=topic,
+            handler=handler,
+            lock_duration=lock_duration,
+            variables=list(variables) if variables is not None else None,
+            deserialize_values=deserialize_values
+        )
+        self.subscriptions[topic] = subscription
+        return subscription
+
+    def _fetch_request(self, max_tasks: int) -> pycamunda.externaltask.FetchAndLock:
+        fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+            url=self.url,
+            worker_id=self.worker_id,
+            max_tasks=max_tasks,
+            async_response_timeout=self.async_response_timeout,
+            use_priority=self.use_priority
+        )
+        for subscription in self.subscriptions.values():
+            fetch_and_lock.add_topic(
+                name=subscription.topic,
+                lock_duration=subscription.lock_duration,
+                variables=subscription.variables,
+                deserialize_values=subscription.deserialize_values
+            )
+        return fetch_and_lock
+
+    def _track(
+        self, tasks: typing.Iterable[pycamunda.externaltask.ExternalTask], locked_at: float
+    ) -> None:
+        for task in tasks:
+            duration = self.subscriptions[task.topic_name].lock_duration
+            self._locks.track(task.id_, duration, locked_at)
+
+    def _fetched(
+        self, tasks: typing.Sequence[pycamunda.externaltask.ExternalTask], seconds: float
+    ) -> None:
+        self.metrics.observe(pycamunda.metrics.FETCH_SECONDS, seconds)
+        self.metrics.observe(pycamunda.metrics.FETCHED_TASKS, len(tasks))
+        if not tasks:
+            self.metrics.increment(pycamunda.metrics.EMPTY_POLLS)
+
+    def _set_drain_deadline(self, timeout: typing.Optional[float]) -> None:
+        """Set the deadline of the shutdown. A deadline that was set before is only moved to an
+        earlier time.
+        """
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            if self._drain_deadline is None or deadline < self._drain_deadline:
+                self._drain_deadline = deadline
+
+    def _unlock_requests(
+        self, task_ids: typing.Iterable[str]
+    ) -> typing.List[pycamunda.externaltask.Unlock]:
+        return [pycamunda.externaltask.Unlock(url=self.url, id_=task_id) for task_id in task_ids]
+
+    def _extend_requests(
+        self, locks: typing.Iterable[_Lock]
+    ) -> typing.List[pycamunda.externaltask.ExtendLock]:
+        return [
+            pycamunda.externaltask.ExtendLock(
+                url=self.url, id_=lock.task_id, new_duration=lock.duration, worker_id=self.worker_id
+            )
+            for lock in locks
+        ]
+
+    def _extension_done(
+        self,
+        request: pycamunda.externaltask.ExtendLock,
+        sent_at: float,
+        exc: typing.Optional[BaseException]
+    ) -> None:
+        if exc is None:
+            self._locks.extended(request.id_, sent_at)
+            self.metrics.increment(pycamunda.metrics.LOCK_EXTENSIONS)
+            return
+        self.metrics.increment(pycamunda.metrics.FAILED_LOCK_EXTENSIONS)
+        if self._locks.failed(request.id_, time.monotonic()):
+            _logger.warning('Extending the lock of external task %s failed: %s', request.id_, exc)
+
+    def _complete_request(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        variables: typing.Optional[typing.Mapping[str, typing.Any]]
+    ) -> pycamunda.externaltask.Complete:
+        complete = pycamunda.externaltask.Complete(
+            url=self.url, id_=task.id_, worker_id=self.worker_id
+        )
+        if variables:
+            _add_variables(complete, variables)
+        return complete
+
+    def _error_request(
+        self, task: pycamunda.externaltask.ExternalTask, exc: BaseException
+    ) -> pycamunda.base.CamundaRequest:
+        if isinstance(exc, BPMNError):
+            bpmn_error = pycamunda.externaltask.HandleBPMNError(
+                url=self.url,
+                id_=task.id_,
+                worker_id=self.worker_id,
+                error_code=exc.error_code,
+                error_message=exc.error_message
+            )
+            _add_variables(bpmn_error, exc.variables)
+            return bpmn_error
+        retries = self.retries if task.retries is None else task.retries - 1
+        return pycamunda.externaltask.HandleFailure(
+            url=self.url,
+            id_=task.id_,
+            worker_id=self.worker_id,
+            error_message=str(exc) or type(exc).__qualname__,
+            error_details=''.join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            ),
+            retries=max(retries, 0),
+            retry_timeout=self.retry_timeout
+        )
+
+    def _handled(
+        self, task: pycamunda.externaltask.ExternalTask, handler: _Handler
+    ) -> pycamunda.base.CamundaRequest:
+        """Call the handler and create the request that reports its outcome."""
+        try:
+            variables = handler(task)
+        except Exception as exc:
+            return self._error_request(task, exc)
+        return self._complete_request(task, variables)
+
+    def _handler_done(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        request: pycamunda.base.CamundaRequest,
+        seconds: float
+    ) -> None:
+        if isinstance(request, pycamunda.externaltask.Complete):
+            outcome = 'completed'
+        elif isinstance(request, pycamunda.externaltask.HandleBPMNError):
+            outcome = 'bpmn_error'
+        else:
+            outcome = 'failure'
+        self.metrics.observe(
+            pycamunda.metrics.HANDLER_SECONDS, seconds, {'topic': task.topic_name}
+        )
+        self.metrics.increment(
+            pycamunda.metrics.HANDLED_TASKS, {'topic': task.topic_name, 'outcome': outcome}
+        )
+
+    def _reported(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        finished_at: float,
+        sent_at: typing.Optional[float],
+        expires: typing.Optional[float]
+    ) -> None:
+        """Record the metrics of a report. `sent_at` is the time before the last attempt to
+        report was sent and `expires` the time the lock of the external task expired at.
+        """
+        labels = {'topic': task.topic_name}
+        self.metrics.observe(
+            pycamunda.metrics.COMPLETION_SECONDS, time.monotonic() - finished_at, labels
+        )
+        if sent_at is not None and expires is not None and sent_at > expires:
+            self.metrics.increment(pycamunda.metrics.LOCK_EXPIRY_MISSES, labels)
+
+    def _report_delay(
+        self, request: pycamunda.base.CamundaRequest, exc: BaseException, attempt: int
+    ) -> typing.Optional[float]:
+        """Get the seconds to wait before reporting the outcome of an external task again or
+        `None` if reporting is given up. Errors that occurred before a response was received and
+        responses without a specific client error status, e.g. 500 or 503, are retried. Reports
+        that were rejected as bad request, unauthorized, forbidden or not found are not.
+        """
+        rejected = isinstance(exc, pycamunda.NoSuccess) and exc.http_code is not None
+        if rejected or attempt >= self.report_retries:
+            _logger.error(
+                'Reporting the outcome of external task %s failed.', request.id_, exc_info=exc
+            )
+            self.metrics.increment(pycamunda.metrics.FAILED_REPORTS)
+            return None
+        return _REPORT_BACKOFF * 2 ** attempt
+
+
+class Worker(_BaseWorker):
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        max_workers: int = 10,
+        max_tasks: int = None,
+        async_response_timeout: int = 20000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 10000,
+        poll_interval: float = 5.0,
+        client: pycamunda.client.Client = None,
+        max_processes: int = None,
+        extend_locks: bool = True,
+        report_threads: int = None,
+        max_pending_reports: int = None,
+        report_retries: int = 3,
+        metrics: pycamunda.metrics.Sink = None
+    ):
+        """External task worker that long polls Camunda for external tasks of the subscribed
+        topics and runs their handlers in a pool of threads.
+
+        The number of external tasks that is fetched by each poll follows the free capacity of
+        the pool and the measured latency of the handlers. No external tasks are fetched while
+        all threads are busy. When handlers are fast, up to `max_workers` additional external
+        tasks are fetched ahead, as long as they are expected to wait for a free thread for less
+        than half of the shortest lock duration. This saves round trips without letting fetched
+        external tasks wait while their lock expires.
+
+        Fetched external tasks that wait for a free thread are queued per topic. Topics share the
+        threads by their priority and weight and external tasks of the same topic are handled by
+        their priority, so a busy topic does not hold up the external tasks of other topics.
+
+        Handlers of topics that are subscribed with `use_processes` run in a pool of processes
+        instead, so CPU-bound handlers are not limited by the global interpreter lock. Their
+        outcome is still reported by the worker using its client.
+
+        While a handler runs, a heartbeat thread extends the lock of its external task before it
+        expires, so handlers may run longer than the lock duration of their topic. Lock durations
+        can be kept short for a fast failover of external tasks of workers that crashed. The locks
+        of all external tasks that expire soon are extended together in one pass.
+
+        The outcome of a handler is reported automatically: the external task is completed with
+        the returned variables, a raised `BPMNError` is reported as business error and any other
+        exception is reported as failure. Outcomes are put in a queue that is sent by a few
+        reporting threads, so handler threads take the next external task without waiting for
+        the response. Reports that fail before a response is received are retried.
+
+        Counters and histograms of fetching, queueing, handling, reporting and lock extensions
+        are recorded in the sink `metrics`. See `pycamunda.metrics` for the recorded metrics.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param max_workers: Maximum number of handlers that run at the same time.
+        :param max_tasks: Maximum number of external tasks to fetch at once. If set to `None`,
+                          the number is only limited by the capacity of the worker.
+        :param async_response_timeout: Long polling timeout in milliseconds.
+        :param use_priority: Whether the external tasks are fetched based on their priority.
+        :param retries: Retries of a failed external task that had no retries set yet.
+        :param retry_timeout: Timeout in milliseconds until a failed external task can be
+                              fetched again.
+        :param poll_interval: Seconds to wait before polling again after fetching failed.
+        :param client: Client used for all requests of the worker. Defaults to a client with a
+                       connection for each thread.
+        :param max_processes: Maximum number of processes that run handlers of topics subscribed
+                              with `use_processes`. Defaults to the number of CPUs.
+        :param extend_locks: Whether to extend the locks of external tasks while they are handled.
+        :param report_threads: Number of threads that report the outcome of handlers. Defaults
+                               to half of `max_workers`.
+        :param max_pending_reports: Maximum number of outcomes waiting to be reported. Handler
+                                    threads wait when it is reached. Defaults to `max_workers`.
+        :param report_retries: Number of retries of a report that failed without a response.
+        :param metrics: Sink the metrics of the worker are recorded in. Defaults to a
+                        `pycamunda.metrics.InMemorySink`.
+        """
+        super().__init__(
+            url=url,
+            worker_id=worker_id,
+            async_response_timeout=async_response_timeout,
+            use_priority=use_priority,
+            retries=retries,
+            retry_timeout=retry_timeout,
+            extend_locks=extend_locks,
+            report_retries=report_retries,
+            metrics=metrics
+        )
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        if report_threads is None:
+            report_threads = max(max_workers // 2, 1)
+        if report_threads < 1:
+            raise ValueError('report_threads must be at least 1.')
+        self.max_workers = max_workers
+        self.max_tasks = max_tasks
+        self.poll_interval = poll_interval
+        if client is None:
+            client = pycamunda.client.Client(
+                pool_maxsize=report_threads + _BULK_THREADS + 1
+            )
+        self.client = client
+        self.report_threads = report_threads
+        self.max_pending_reports = max_pending_reports or max_workers
+        self.max_processes = max_processes
+        self.handler_latency = None
+        self._in_flight = 0
+        self._queue = _FairQueue(self.subscriptions)
+        self._queued_at = {}
+        self._capacity = threading.Condition()
+        self._stopped = threading.Event()
+        self._process_pool = None
+        self._locks_changed = threading.Condition()
+        self._heartbeat_stopped = threading.Event()
+        self._reports = queue.Queue(maxsize=self.max_pending_reports)
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: _Handler,
+        lock_duration: int = 30000,
+        variables: typing.Iterable[str] = None,
+        deserialize_values: bool = False,
+        use_processes: bool = False,
+        weight: float = 1.0,
+        priority: int = 0
+    ) -> Subscription:
+        """Register a handler for the external tasks of a topic.
+
+        The handler is called with the external task. It returns a mapping of variables to
+        complete the external task with or `None`. Values of type `pycamunda.variable.Variable`
+        are sent with their type. To report a business error the handler raises `BPMNError`, any
+        other exception is reported as failure of the external task.
+
+        :param topic: Name of the topic.
+        :param handler: The handler.
+        :param lock_duration: Duration to lock the fetched external tasks for in milliseconds.
+        :param variables: Variables to fetch with the external tasks. If set to `None` all
+                          variables are fetched.
+        :param deserialize_values: Whether serializable variable values are deserialized on
+                                   server side.
+        :param use_processes: Whether to run the handler in a pool of processes. The handler,
+                              the external tasks and the returned variables have to be picklable.
+        :param weight: Share of the handler threads the topic gets relative to the other topics
+                       of the same priority when external tasks of several topics wait for a
+                       free thread.
+        :param priority: External tasks of topics with a higher priority are handled before the
+                         waiting external tasks of other topics.
+        :return: The subscription.
+        """
+        if weight <= 0:
+            raise ValueError('weight must be positive.')
+        subscription = super().subscribe(
+            topic=topic,
+            handler=handler,
+            lock_duration=lock_duration,
+            variables=variables,
+            deserialize_values=deserialize_values
+        )
+        subscription.use_processes = use_processes
+        subscription.weight = weight
+        subscription.priority = priority
+        return subscription
+
+    def _send(self, request: pycamunda.base.CamundaRequest) -> typing.Any:
+        request.client = self.client
+        return request()
+
+    def _max_queued(self) -> int:
+        """Get the number of fetched external tasks that may wait for a free handler thread. The
+        last of them is expected to start before `_MAX_QUEUED_SHARE` of the shortest lock
+        duration passed. Nothing is fetched ahead before the latency of a handler was measured.
+        """
+        if self.handler_latency is None:
+            return 0
+        lock_duration = min(
+            subscription.lock_duration for subscription in self.subscriptions.values()
+        ) / 1000
+        queued = self.max_workers * lock_duration * _MAX_QUEUED_SHARE
+        if queued >= self.max_workers * self.handler_latency:
+            return self.max_workers
+        return int(queued / self.handler_latency)
+
+    def _observe_latency(self, latency: float) -> None:
+        if self.handler_latency is None:
+            self.handler_latency = latency
+        else:
+            self.handler_latency += _LATENCY_WEIGHT * (latency - self.handler_latency)
+
+    def _free_capacity(self) -> int:
+        """Wait until there is capacity for more external tasks and return it. Returns 0 if the
+        worker is stopped while waiting.
+        """
+        with self._capacity:
+            while not self._stopped.is_set():
+                free = self.max_workers + self._max_queued() - self._in_flight
+                if free > 0:
+                    return free
+                self._capacity.wait(timeout=0.1)
+            return 0
+
+    def _fetch(self, free: int) -> typing.Tuple[pycamunda.externaltask.ExternalTask]:
+        if self.max_tasks is not None:
+            free = min(free, self.max_tasks)
+        start = time.perf_counter()
+        tasks = self._send(self._fetch_request(max_tasks=free))
+        self._fetched(tasks, time.perf_counter() - start)
+        return tasks
+
+    def _run_in_process(
+        self, handler: _Handler, task: pycamunda.externaltask.ExternalTask
+    ) -> typing.Optional[typing.Mapping[str, typing.Any]]:
+        return self._process_pool.submit(handler, task).result()
+
+    def _execute(self, task: pycamunda.externaltask.ExternalTask) -> None:
+        latency = None
+        release = True
+        try:
+            if self._stopped.is_set():
+                # Fetched ahead and not started before the worker was stopped, so it is unlocked.
+                release = False
+                return
+            subscription = self.subscriptions[task.topic_name]
+            handler = subscription.handler
+            if subscription.use_processes:
+                handler = functools.partial(self._run_in_process, handler)
+            start = time.perf_counter()
+            request = self._handled(task, handler)
+            latency = time.perf_counter() - start
+            self._handler_done(task, request, latency)
+            with self._capacity:
+                # The external task was unlocked if the handler did not finish before the
+                # deadline of the shutdown.
+                unlocked = task.id_ not in self._unfinished
+                self._unfinished.discard(task.id_)
+            if not unlocked:
+                self._reports.put((task, request, time.monotonic()))
+                release = False
+        finally:
+            if release:
+                with self._capacity:
+                    self._unfinished.discard(task.id_)
+                with self._locks_changed:
+                    self._locks.untrack(task.id_)
+            with self._capacity:
+                self._in_flight -= 1
+                if latency is not None:
+                    self._observe_latency(latency)
+                self._capacity.notify()
+
+    def _execute_next(self) -> None:
+        """Handle the external task that is next in the local queue. It is called once for each
+        external task that is added to the queue.
+        """
+        with self._capacity:
+            task = self._queue.pop()
+            queued_at = self._queued_at.pop(task.id_)
+        self.metrics.observe(
+            pycamunda.metrics.QUEUE_WAIT_SECONDS,
+            time.perf_counter() - queued_at,
+            {'topic': task.topic_name}
+        )
+        self._execute(task)
+
+    def _report(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        request: pycamunda.base.CamundaRequest,
+        finished_at: float
+    ) -> None:
+        sent_at = None
+        try:
+            for attempt in itertools.count():
+                sent_at = time.monotonic()
+                try:
+                    self._send(request)
+                    return
+                except pycamunda.PyCamundaException as exc:
+                    delay = self._report_delay(request, exc, attempt)
+                    if delay is None:
+                        return
+                time.sleep(delay)
+        finally:
+            with self._locks_changed:
+                expires = self._locks.expires(task.id_)
+                self._locks.untrack(task.id_)
+            self._reported(task, finished_at, sent_at, expires)
+
+    def _reporter(self) -> None:
+        """Report the queued outcomes of handlers until `None` is taken from the queue."""
+        while True:
+            item = self._reports.get()
+            if item is None:
+                return
+            self._report(*item)
+
+    def _heartbeat(self) -> None:
+        """Extend the locks of the handled external tasks until the heartbeat is stopped."""
+        executor = pycamunda.bulk.BulkExecutor(
+            max_workers=_BULK_THREADS, ordered=False, client=self.client
+        )
+        while True:
+            with self._locks_changed:
+                if self._heartbeat_stopped.is_set():
+                    return
+                next_due = self._locks.next_due()
+                timeout = None if next_due is None else next_due - time.monotonic()
+                if timeout is None or timeout > 0:
+                    self._locks_changed.wait(timeout)
+                    continue
+                sent_at = time.monotonic()
+                requests = self._extend_requests(self._locks.due(sent_at))
+            for result in executor.map(requests):
+                with self._locks_changed:
+                    self._extension_done(result.request, sent_at, result.exception)
+
+    def run(self) -> None:
+        """Fetch and handle external tasks until the worker is stopped. Handlers that are
+        running when the worker is stopped are awaited.
+        """
+        if not self.subscriptions:
+            raise ValueError('No topic is subscribed.')
+        self._stopped.clear()
+        self._drain_deadline = None
+        with contextlib.ExitStack() as stack:
+            if self.extend_locks:
+                self._heartbeat_stopped.clear()
+                heartbeat = threading.Thread(target=self._heartbeat, name='pycamunda-heartbeat')
+                heartbeat.start()
+                stack.callback(self._stop_heartbeat, heartbeat)
+            reporters = [
+                threading.Thread(target=self._reporter, name=f'pycamunda-reporter-{i}')
+                for i in range(self.report_threads)
+            ]
+            for reporter in reporters:
+                reporter.start()
+            stack.callback(self._stop_reporters, reporters)
+            self._poll()
+
+    def _stop_heartbeat(self, heartbeat: threading.Thread) -> None:
+        with self._locks_changed:
+            self._heartbeat_stopped.set()
+            self._locks_changed.notify()
+        heartbeat.join()
+
+    def _stop_reporters(self, reporters: typing.List[threading.Thread]) -> None:
+        """Stop the reporting threads after all queued outcomes are reported."""
+        for _ in reporters:
+            self._reports.put(None)
+        for reporter in reporters:
+            reporter.join()
+
+    def _drain(self) -> None:
+        """Wait until the running handlers finished or the deadline of the shutdown passed.
+        Then unlock the external tasks that were not handled.
+        """
+        with self._capacity:
+            while self._in_flight:
+                deadline = self._drain_deadline
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    break
+                self._capacity.wait(timeout)
+            unfinished, self._unfinished = self._unfinished, set()
+        if not unfinished:
+            return
+        executor = pycamunda.bulk.BulkExecutor(
+            max_workers=_BULK_THREADS, ordered=False, client=self.client
+        )
+        for result in executor.map(self._unlock_requests(unfinished)):
+            if not result.ok:
+                _logger.warning(
+                    'Unlocking external task %s failed: %s', result.request.id_, result.exception
+                )
+        with self._locks_changed:
+            for task_id in unfinished:
+                self._locks.untrack(task_id)
+
+    def _poll(self) -> None:
+        with contextlib.ExitStack() as stack:
+            if any(subscription.use_processes for subscription in self.subscriptions.values()):
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_processes
+                )
+                stack.callback(self._process_pool.shutdown, wait=False)
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+            stack.callback(executor.shutdown, wait=False)
+            stack.callback(self._drain)
+            while not self._stopped.is_set():
+                free = self._free_capacity()
+                if not free:
+                    continue
+                locked_at = time.monotonic()
+                try:
+                    tasks = self._fetch(free)
+                except pycamunda.PyCamundaException:
+                    _logger.exception('Fetching external tasks failed.')
+                    self.metrics.increment(pycamunda.metrics.FETCH_ERRORS)
+                    self._stopped.wait(self.poll_interval)
+                    continue
+                with self._locks_changed:
+                    self._track(tasks, locked_at)
+                    self._locks_changed.notify()
+                for task in tasks:
+                    with self._capacity:
+                        self._in_flight += 1
+                        self._unfinished.add(task.id_)
+                        self._queue.push(task)
+                        self._queued_at[task.id_] = time.perf_counter()
+                    executor.submit(self._execute_next)
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the worker. A running long poll is not interrupted.
+
+        The worker waits for the running handlers to finish. External tasks that were fetched
+        ahead and have not been started are unlocked, so other workers can fetch them right
+        away. If a handler is still running when the timeout passed, its external task is
+        unlocked as well and its outcome is not reported.
+
+        :param timeout: Seconds to wait for the running handlers. If set to `None`, the worker
+                        waits until all of them finished. Stopping again only shortens the
+                        timeout.
+        """
+        self._set_drain_deadline(timeout)
+        self._stopped.set()
+        with self._capacity:
+            self._capacity.notify_all()
+
+
+class AsyncWorker(_BaseWorker):
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        max_concurrency: int = 100,
+        async_response_timeout: int = 20000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 10000,
+        poll_interval: float = 5.0,
+        client: pycamunda.aio.AsyncClient = None,
+        extend_locks: bool = True,
+        report_retries: int = 3,
+        metrics: pycamunda.metrics.Sink = None
+    ):
+        """External task worker for asyncio applications. It long polls Camunda for external
+        tasks of the subscribed topics without blocking the event loop and runs a coroutine for
+        each external task, so a single event loop can handle many external tasks that wait on
+        I/O at the same time.
+
+        Handlers are coroutine functions that behave like the handlers of `Worker`. The number
+        of external tasks of a topic that are handled at the same time is bounded and external
+        tasks are only fetched for topics that have capacity left. Like `Worker`, the locks of
+        external tasks are extended while they are handled. An external task stops counting
+        towards the concurrency of its topic as soon as its handler returned, before its outcome
+        is reported. The same metrics as of `Worker` are recorded in `metrics`, where the queue
+        wait is the time an external task waits for the concurrency limit of its topic.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param max_concurrency: Default of the maximum number of external tasks of a topic that
+                                are handled at the same time.
+        :param async_response_timeout: Long polling timeout in milliseconds.
+        :param use_priority: Whether the external tasks are fetched based on their priority.
+        :param retries: Retries of a failed external task that had no retries set yet.
+        :param retry_timeout: Timeout in milliseconds until a failed external task can be
+                              fetched again.
+        :param poll_interval: Seconds to wait before polling again after fetching failed.
+        :param client: Client used for all requests of the worker. Defaults to a client that is
+                       created and closed by `run`.
+        :param extend_locks: Whether to extend the locks of external tasks while they are handled.
+        :param report_retries: Number of retries of a report that failed without a response.
+        :param metrics: Sink the metrics of the worker are recorded in. Defaults to a
+                        `pycamunda.metrics.InMemorySink`.
+        """
+        super().__init__(
+            url=url,
+            worker_id=worker_id,
+            async_response_timeout=async_response_timeout,
+            use_priority=use_priority,
+            retries=retries,
+            retry_timeout=retry_timeout,
+            extend_locks=extend_locks,
+            report_retries=report_retries,
+            metrics=metrics
+        )
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self.client = client
+        self.concurrency = {}
+        self._running = {}
+        self._stopped = None
+        self._capacity = None
+        self._locks_changed = None
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: _Handler,
+        lock_duration: int = 30000,
+        variables: typing.Iterable[str] = None,
+        deserialize_values: bool = False,
+        max_concurrency: int = None
+    ) -> Subscription:
+        """Register a coroutine function as handler for the external tasks of a topic.
+
+        :param topic: Name of the topic.
+        :param handler: The handler.
+        :param lock_duration: Duration to lock the fetched external tasks for in milliseconds.
+        :param variables: Variables to fetch with the external tasks. If set to `None` all
+                          variables are fetched.
+        :param deserialize_values: Whether serializable variable values are deserialized on
+                                   server side.
+        :param max_concurrency: Maximum number of external tasks of the topic that are handled
+                                at the same time. Defaults to the `max_concurrency` of the worker.
+        :return: The subscription.
+        """
+        subscription = super().subscribe(
+            topic=topic,
+            handler=handler,
+            lock_duration=lock_duration,
+            variables=variables,
+            deserialize_values=deserialize_values
+        )
+        self.concurrency[topic] = max_concurrency or self.max_concurrency
+        self._running[topic] = 0
+        return subscription
+
+    def _free(self) -> typing.Dict[str, int]:
+        return {
+            topic: self.concurrency[topic] - running
+            for topic, running in self._running.items()
+            if running < self.concurrency[topic]
+        }
+
+    async def _execute(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        semaphore: asyncio.Semaphore,
+        queued_at: float
+    ) -> None:
+        try:
+            try:
+                async with semaphore:
+                    if self._stopped.is_set():
+                        # Not started before the worker was stopped, so it is unlocked.
+                        return
+                    subscription = self.subscriptions[task.topic_name]
+                    start = time.perf_counter()
+                    self.metrics.observe(
+                        pycamunda.metrics.QUEUE_WAIT_SECONDS,
+                        start - queued_at,
+                        {'topic': task.topic_name}
+                    )
+                    try:
+                        variables = subscription.handler(task)
+                        if inspect.isawaitable(variables):
+                            variables = await variables
+                    except Exception as exc:
+                        request = self._error_request(task, exc)
+                    else:
+                        request = self._complete_request(task, variables)
+                    self._handler_done(task, request, time.perf_counter() - start)
+                    self._unfinished.discard(task.id_)
+            finally:
+                self._running[task.topic_name] -= 1
+                self._capacity.set()
+            await self._report(task, request, time.monotonic())
+        finally:
+            self._locks.untrack(task.id_)
+
+    async def _report(
+        self,
+        task: pycamunda.externaltask.ExternalTask,
+        request: pycamunda.base.CamundaRequest,
+        finished_at: float
+    ) -> None:
+        sent_at = None
+        try:
+            for attempt in itertools.count():
+                sent_at = time.monotonic()
+                try:
+                    await request.acall(self.client)
+                    return
+                except pycamunda.PyCamundaException as exc:
+                    delay = self._report_delay(request, exc, attempt)
+                    if delay is None:
+                        return
+                await asyncio.sleep(delay)
+        finally:
+            self._reported(task, finished_at, sent_at, self._locks.expires(task.id_))
+
+    async def _heartbeat(self) -> None:
+        """Extend the locks of the handled external tasks until the heartbeat is cancelled."""
+        while True:
+            self._locks_changed.clear()
+            next_due = self._locks.next_due()
+            if next_due is None:
+                await self._locks_changed.wait()
+                continue
+            timeout = next_due - time.monotonic()
+            if timeout > 0:
+                await _first_completed(self._locks_changed.wait(), asyncio.sleep(timeout))
+                continue
+            sent_at = time.monotonic()
+            requests = self._extend_requests(self._locks.due(sent_at))
+            results = await asyncio.gather(
+                *(request.acall(self.client) for request in requests), return_exceptions=True
+            )
+            for request, result in zip(requests, results):
+                exc = result if isinstance(result, Exception) else None
+                self._extension_done(request, sent_at, exc)
+
+    async def _fetch(
+        self, free: typing.Dict[str, int]
+    ) -> typing.Tuple[pycamunda.externaltask.ExternalTask]:
+        fetch_and_lock = self._fetch_request(max_tasks=sum(free.values()))
+        fetch_and_lock.topics = [
+            topic for topic in fetch_and_lock.topics if topic['topicName'] in free
+        ]
+        start = time.perf_counter()
+        fetch = asyncio.ensure_future(fetch_and_lock.acall(self.client))
+        await _first_completed(fetch, self._stopped.wait())
+        if not fetch.done():
+            return ()
+        tasks = fetch.result()
+        self._fetched(tasks, time.perf_counter() - start)
+        return tasks
+
+    async def _drain(self, handling: typing.Dict[asyncio.Future, str]) -> None:
+        """Wait until the running handlers finished or the deadline of the shutdown passed.
+        Handlers that are still running are cancelled. Then unlock the external tasks that were
+        not handled.
+        """
+        if handling:
+            timeout = None
+            if self._drain_deadline is not None:
+                timeout = max(self._drain_deadline - time.monotonic(), 0)
+            await asyncio.wait(handling, timeout=timeout)
+            for future, task_id in list(handling.items()):
+                if task_id in self._unfinished:
+                    future.cancel()
+        if handling:
+            await asyncio.wait(handling)
+        unfinished, self._unfinished = self._unfinished, set()
+        requests = self._unlock_requests(unfinished)
+        results = await asyncio.gather(
+            *(request.acall(self.client) for request in requests), return_exceptions=True
+        )
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                _logger.warning('Unlocking external task %s failed: %s', request.id_, result)
+            self._locks.untrack(request.id_)
+
+    async def run(self) -> None:
+        """Fetch and handle external tasks until the worker is stopped. A running long poll is
+        cancelled when the worker is stopped and handlers that are running are awaited.
+        """
+        if not self.subscriptions:
+            raise ValueError('No topic is subscribed.')
+        self._stopped = asyncio.Event()
+        self._drain_deadline = None
+        self._capacity = asyncio.Event()
+        self._locks_changed = asyncio.Event()
+        semaphores = {topic: asyncio.Semaphore(limit) for topic, limit in self.concurrency.items()}
+        own_client = self.client is None
+        if own_client:
+            self.client = pycamunda.aio.AsyncClient()
+        handling = {}
+        heartbeat = asyncio.ensure_future(self._heartbeat()) if self.extend_locks else None
+        try:
+            while not self._stopped.is_set():
+                free = self._free()
+                if not free:
+                    self._capacity.clear()
+                    await _first_completed(self._capacity.wait(), self._stopped.wait())
+                    continue
+                locked_at = time.monotonic()
+                try:
+                    tasks = await self._fetch(free)
+                except pycamunda.PyCamundaException:
+                    _logger.exception('Fetching external tasks failed.')
+                    self.metrics.increment(pycamunda.metrics.FETCH_ERRORS)
+                    try:
+                        await asyncio.wait_for(self._stopped.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                self._track(tasks, locked_at)
+                self._locks_changed.set()
+                for task in tasks:
+                    self._running[task.topic_name] += 1
+                    self._unfinished.add(task.id_)
+                    future = asyncio.ensure_future(
+                        self._execute(task, semaphores[task.topic_name], time.perf_counter())
+                    )
+                    handling[future] = task.id_
+                    future.add_done_callback(handling.pop)
+            await self._drain(handling)
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await heartbeat
+            if own_client:
+                await self.client.close()
+                self.client = None
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the worker. Must be called from the event loop the worker runs in.
+
+        The worker waits for the running handlers to finish. If a handler is still running when
+        the timeout passed, it is cancelled and its external task is unlocked, so other workers
+        can fetch it right away.
+
+        :param timeout: Seconds to wait for the running handlers. If set to `None`, the worker
+                        waits until all of them finished. Stopping again only shortens the
+                        timeout.
+        """
+        self._set_drain_deadline(timeout)
+        if self._stopped is not None:
+            self._stopped.set()
@@ -22,5 +22,11 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.7',
-    install_requires=['requests>=2.0.0']
+    install_requires=['requests>=2.0.0'],
+    extras_require={
+        'async': ['aiohttp>=3.6.0'],
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+        'pandas': ['pandas']
+    }
 )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import http.server
+import json
+import threading
+
+import pytest
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        self.server.received.append((self.command, self.path, dict(self.headers), body))
+        status, payload = self.server.routes.get(self.path.split('?', 1)[0], (404, {}))
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def engine():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.routes = {}
+    server.received = []
+    server.url = f'http://127.0.0.1:{server.server_port}/engine-rest'
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def my_externaltask_json():
+    return {
+        'activityId': 'anActivityId',
+        'activityInstanceId': 'anActivityInstanceId',
+        'errorMessage': 'anErrorMessage',
+        'executionId': 'anExecutionId',
+        'id': 'anId',
+        'processDefinitionId': 'aProcessDefinitionId',
+        'processDefinitionKey': 'aProcessDefinitionKey',
+        'processInstanceId': 'aProcessInstanceId',
+        'tenantId': 'aTenantId',
+        'retries': 10,
+        'workerId': 'aWorkerId',
+        'priority': 50,
+        'topicName': 'aTopicName',
+        'lockExpirationTime': '2000-01-01T01:01:00.000+0000'
+    }
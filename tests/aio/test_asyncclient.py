@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest.mock
+
+import pytest
+import requests.auth
+
+import pycamunda.externaltask
+import pycamunda.processinst
+
+aiohttp = pytest.importorskip('aiohttp')
+
+import pycamunda.aio  # noqa: E402
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_acall_returns_loaded_result(engine, my_externaltask_json):
+    engine.routes['/engine-rest/external-task/fetchAndLock'] = (200, [my_externaltask_json])
+    fetch_and_lock = pycamunda.externaltask.FetchAndLock(engine.url, worker_id='1', max_tasks=5)
+    fetch_and_lock.add_topic(name='aTopic', lock_duration=1000)
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await fetch_and_lock.acall(client)
+
+    tasks = run(main())
+
+    assert isinstance(tasks, tuple)
+    assert tasks[0].id_ == 'anId'
+    method, path, headers, body = engine.received[0]
+    assert method == 'POST'
+    assert b'"maxTasks": 5' in body
+    assert headers['Content-Type'] == 'application/json'
+
+
+def test_acall_sends_query_parameters(engine):
+    engine.routes['/engine-rest/process-instance'] = (200, [])
+    get_instances = pycamunda.processinst.GetList(
+        engine.url, business_key='aKey', suspended=True, variables=[]
+    )
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await get_instances.acall(client)
+
+    assert run(main()) == ()
+    method, path, headers, body = engine.received[0]
+    assert method == 'GET'
+    assert 'businessKey=aKey' in path
+    assert 'suspended=true' in path
+
+
+def test_acall_sends_subsequent_requests(engine, my_externaltask_json):
+    engine.routes['/engine-rest/external-task/anId'] = (200, my_externaltask_json)
+    engine.routes['/engine-rest/external-task/anId/errorDetails'] = (200, 'aDetail')
+    get_task = pycamunda.externaltask.Get(engine.url, id_='anId')
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await get_task.acall(client)
+
+    task = run(main())
+
+    assert task.error_details == '"aDetail"'
+    assert [path for _, path, _, _ in engine.received] == [
+        '/engine-rest/external-task/anId', '/engine-rest/external-task/anId/errorDetails'
+    ]
+
+
+def test_acall_loads_each_external_task_once(engine, my_externaltask_json):
+    tasks_json = [dict(my_externaltask_json, id=f'anId{i}') for i in range(30)]
+    engine.routes['/engine-rest/external-task'] = (200, tasks_json)
+    for i in range(30):
+        engine.routes[f'/engine-rest/external-task/anId{i}/errorDetails'] = (200, f'aDetail{i}')
+    get_tasks = pycamunda.externaltask.GetList(engine.url, max_workers=5)
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await get_tasks.acall(client)
+
+    load = pycamunda.externaltask.ExternalTask.load
+    with unittest.mock.patch.object(
+        pycamunda.externaltask.ExternalTask, 'load', side_effect=load
+    ) as load_mock:
+        tasks = run(main())
+
+    assert load_mock.call_count == 30
+    assert len(engine.received) == 31
+    assert [task.error_details for task in tasks] == [f'"aDetail{i}"' for i in range(30)]
+
+
+def test_acall_count(engine):
+    engine.routes['/engine-rest/external-task/count'] = (200, {'count': 3})
+    count = pycamunda.externaltask.Count(engine.url)
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await count.acall(client)
+
+    assert run(main()) == 3
+
+
+def test_acall_uses_auth(engine):
+    engine.routes['/engine-rest/process-instance'] = (200, [])
+    get_instances = pycamunda.processinst.GetList(engine.url)
+    auth = requests.auth.HTTPBasicAuth(username='Jane', password='password')
+
+    async def main():
+        async with pycamunda.aio.AsyncClient(auth=auth) as client:
+            return await get_instances.acall(client)
+
+    run(main())
+
+    assert engine.received[0][2]['Authorization'].startswith('Basic ')
+
+
+def test_acall_raises_for_status(engine):
+    engine.routes['/engine-rest/process-instance'] = (404, {'message': 'an error message'})
+    get_instances = pycamunda.processinst.GetList(engine.url)
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await get_instances.acall(client)
+
+    with pytest.raises(pycamunda.NotFound):
+        run(main())
+
+
+def test_acall_raises_pycamunda_exception():
+    get_instances = pycamunda.processinst.GetList('http://127.0.0.1:1/engine-rest')
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await get_instances.acall(client)
+
+    with pytest.raises(pycamunda.PyCamundaException):
+        run(main())
+
+
+def test_acall_runs_concurrently(engine):
+    engine.routes['/engine-rest/process-instance'] = (200, [])
+
+    async def main():
+        async with pycamunda.aio.AsyncClient(limit=10) as client:
+            return await asyncio.gather(*(
+                pycamunda.processinst.GetList(engine.url).acall(client) for _ in range(50)
+            ))
+
+    assert run(main()) == [()] * 50
+    assert len(engine.received) == 50
+
+
+def test_response_interface():
+    response = pycamunda.aio.Response(status_code=400, content=b'{"message": "aMessage"}')
+
+    assert not response
+    assert response.json() == {'message': 'aMessage'}
+    assert response.text == '{"message": "aMessage"}'
+
+
+def test_acall_streams_binary_variables(engine):
+    engine.routes['/engine-rest/process-instance/anId/variables/aVar/data'] = (200, {})
+    update_var = pycamunda.processinst.VariablesUpdate(
+        engine.url, process_instance_id='anId', var_name='aVar', value=b'content', type_='Bytes'
+    )
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            return await update_var.acall(client)
+
+    run(main())
+    method, path, headers, body = engine.received[0]
+
+    assert method == 'POST'
+    assert headers['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert int(headers['Content-Length']) == len(body)
+    assert b'filename="data"\r\n\r\ncontent\r\n' in body
+
+
+def test_asyncclient_discards_cookies():
+
+    async def main():
+        async with pycamunda.aio.AsyncClient() as client:
+            discarding = client.session.cookie_jar
+        async with pycamunda.aio.AsyncClient(persist_cookies=True) as client:
+            persisting = client.session.cookie_jar
+        return discarding, persisting
+
+    discarding, persisting = run(main())
+
+    assert isinstance(discarding, aiohttp.DummyCookieJar)
+    assert not isinstance(persisting, aiohttp.DummyCookieJar)
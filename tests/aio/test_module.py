@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.aio
+
+    for name in pycamunda.aio.__all__:
+        getattr(pycamunda.aio, name)
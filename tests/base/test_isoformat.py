@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import datetime as dt
+import random
+
+import pytest
+
+import pycamunda.base
+
+TIMEZONES = [
+    None,
+    dt.timezone.utc,
+    dt.timezone(dt.timedelta(hours=2)),
+    dt.timezone(dt.timedelta(hours=5, minutes=30)),
+    dt.timezone(-dt.timedelta(hours=3, minutes=45)),
+    dt.timezone(dt.timedelta(hours=-12)),
+    dt.timezone(dt.timedelta(hours=14)),
+    dt.timezone(dt.timedelta(seconds=30)),
+]
+
+
+def reference_isoformat(datetime_):
+    if isinstance(datetime_, dt.datetime):
+        dt_str = datetime_.strftime('%Y-%m-%dT%H:%M:%S.{ms}%z')
+        ms = datetime_.microsecond // 1000
+        return dt_str.format(ms=str(ms).zfill(3))
+    return datetime_.strftime('%Y-%m-%d')
+
+
+def reference_from_isoformat(datetime_str):
+    return dt.datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+def random_datetimes(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield dt.datetime(
+            year=rng.randint(1, 9999),
+            month=rng.randint(1, 12),
+            day=rng.randint(1, 28),
+            hour=rng.randint(0, 23),
+            minute=rng.randint(0, 59),
+            second=rng.randint(0, 59),
+            microsecond=rng.randint(0, 999999),
+            tzinfo=rng.choice(TIMEZONES)
+        )
+
+
+def assert_same_datetime(result, expected):
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    assert result.tzinfo == expected.tzinfo
+
+
+def test_isoformat_matches_strftime():
+    for datetime_ in random_datetimes(5000):
+        assert pycamunda.base.isoformat(datetime_) == reference_isoformat(datetime_)
+        assert pycamunda.base.isoformat(datetime_.date()) == reference_isoformat(datetime_.date())
+
+
+def test_from_isoformat_matches_strptime():
+    for datetime_ in random_datetimes(5000, seed=1):
+        if datetime_.tzinfo is None or datetime_.year < 1000:
+            continue
+        datetime_str = reference_isoformat(datetime_)
+        assert_same_datetime(
+            pycamunda.base.from_isoformat(datetime_str), reference_from_isoformat(datetime_str)
+        )
+
+
+@pytest.mark.parametrize('datetime_str', [
+    '2020-01-01T01:01:01.000+0000',
+    '2020-01-01T01:01:01.000Z',
+    '2020-01-01T01:01:01.000+01:00',
+    '2020-01-01T01:01:01.123456-0530',
+    '2020-01-01T01:01:01.1+0200',
+    '2020-01-01T01:01:01.000+000030',
+])
+def test_from_isoformat_accepts_strptime_formats(datetime_str):
+    assert_same_datetime(
+        pycamunda.base.from_isoformat(datetime_str), reference_from_isoformat(datetime_str)
+    )
+
+
+@pytest.mark.parametrize('datetime_str', [
+    '2020-13-01T01:01:01.000+0000',
+    '2020-02-30T01:01:01.000+0000',
+    '2_20-01-01T01:01:01.000+0000',
+    '2020-01-01 01:01:01.000+0000',
+    '2020-01-01T01:01:01.000+2500',
+    '7204-06-07T19:09:17.302+1760',
+    '2020-01-01T01:01:01.000',
+])
+def test_from_isoformat_rejects_invalid_strings(datetime_str):
+    with pytest.raises(ValueError):
+        reference_from_isoformat(datetime_str)
+    with pytest.raises(ValueError):
+        pycamunda.base.from_isoformat(datetime_str)
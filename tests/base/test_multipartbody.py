@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+import email.parser
+import email.policy
+import http.server
+import io
+import mmap
+import threading
+
+import pytest
+import requests
+
+import pycamunda.base
+
+
+def parse(body, content_type=None):
+    """Parse a multipart body into a dict of field names to their filename, content type and
+    content."""
+    content_type = content_type or body.content_type
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f'Content-Type: {content_type}\r\n\r\n'.encode() + b''.join(body)
+    )
+    return {
+        part.get_param('name', header='content-disposition'): (
+            part.get_filename(), part.get('Content-Type'), part.get_payload(decode=True)
+        )
+        for part in message.iter_parts()
+    }
+
+
+def test_multipartbody_of_bytes():
+    body = pycamunda.base._MultipartBody({'valueType': 'Bytes'}, 'data', b'binary content')
+
+    assert body.len == len(b''.join(body))
+    assert parse(body) == {
+        'valueType': (None, None, b'Bytes'),
+        'data': ('data', None, b'binary content')
+    }
+
+
+def test_multipartbody_yields_chunks_of_buffers_without_copying():
+    with mmap.mmap(-1, 10) as buffer:
+        buffer.write(b'0123456789')
+        body = pycamunda.base._MultipartBody({}, 'data', buffer, chunk_size=4)
+        chunks = list(body)[1:-1]
+
+        assert [bytes(chunk) for chunk in chunks] == [b'0123', b'4567', b'89']
+        assert all(isinstance(chunk, memoryview) and chunk.obj is buffer for chunk in chunks)
+        assert body.len == len(b''.join(body))
+        for chunk in chunks:
+            chunk.release()
+
+
+def test_multipartbody_of_path(tmp_path):
+    path = tmp_path / 'aFile.pdf'
+    path.write_bytes(b'file content')
+    body = pycamunda.base._MultipartBody({}, 'data', path, chunk_size=5)
+
+    assert body.len == len(b''.join(body))
+    assert parse(body) == {'data': ('aFile.pdf', None, b'file content')}
+
+
+def test_multipartbody_of_file_object(tmp_path):
+    path = tmp_path / 'aFile.pdf'
+    path.write_bytes(b'skipped file content')
+    with open(path, 'rb') as file:
+        file.read(8)
+        body = pycamunda.base._MultipartBody({}, 'data', file, chunk_size=5)
+        content = b''.join(body)
+
+    assert body.len == len(content)
+    assert parse([content], body.content_type) == {'data': ('aFile.pdf', None, b'file content')}
+
+
+def test_multipartbody_of_seekable_stream():
+    body = pycamunda.base._MultipartBody({}, 'data', io.BytesIO(b'stream content'))
+
+    assert body.len == len(b''.join(body))
+
+
+def test_multipartbody_of_text_stream_has_unknown_length():
+    body = pycamunda.base._MultipartBody({}, 'data', io.StringIO('text content'))
+
+    assert body.len is None
+    assert parse(body) == {'data': ('data', None, b'text content')}
+
+
+def test_multipartbody_of_readable_buffer_sends_whole_buffer():
+    buffer = mmap.mmap(-1, 4)
+    buffer.write(b'1234')
+    body = pycamunda.base._MultipartBody({}, 'data', buffer)
+
+    assert parse(body) == {'data': ('data', None, b'1234')}
+
+
+def test_multipartbody_of_tuple():
+    body = pycamunda.base._MultipartBody(
+        {}, 'data', ('a "quoted" name.pdf', b'content', 'application/pdf')
+    )
+
+    assert b'filename="a %22quoted%22 name.pdf"' in b''.join(body)
+    assert parse(body) == {'data': ('a %22quoted%22 name.pdf', 'application/pdf', b'content')}
+
+
+def test_multipartbody_raises_for_unsupported_value():
+    with pytest.raises(TypeError):
+        pycamunda.base._MultipartBody({}, 'data', 1)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline(), 16)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                if not size:
+                    break
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append((dict(self.headers), body))
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('value, chunked', [(b'content', False), (io.StringIO('content'), True)])
+def test_multipartbody_is_sent_by_requests(server, value, chunked):
+    body = pycamunda.base._MultipartBody({'valueType': 'Bytes'}, 'data', value)
+    url = f'http://127.0.0.1:{server.server_port}/'
+    requests.post(url, data=body, headers={'Content-Type': body.content_type})
+    headers, received = server.received[0]
+
+    assert ('Transfer-Encoding' in headers) == chunked
+    assert headers['Content-Type'] == body.content_type
+    assert parse([received], body.content_type) == {
+        'valueType': (None, None, b'Bytes'),
+        'data': ('data', None, b'content')
+    }
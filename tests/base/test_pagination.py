@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda.processinst
+import pycamunda.variable
+
+
+def paged_response_mock(total):
+    calls = []
+
+    def request(*args, **kwargs):
+        first = kwargs['params']['firstResult']
+        size = kwargs['params']['maxResults']
+        calls.append((first, size))
+        response = unittest.mock.MagicMock()
+        response.json.return_value = [
+            {'id': str(i)} for i in range(first, min(first + size, total))
+        ]
+        return response
+
+    return request, calls
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_iterate_fetches_page_by_page(engine_url, prefetch):
+    request, calls = paged_response_mock(total=25)
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    with unittest.mock.patch('requests.Session.request', request), \
+            unittest.mock.patch('pycamunda.processinst.ProcessInstance.load', lambda data: data):
+        instances = list(get_instances.iterate(page_size=10, prefetch=prefetch))
+
+    assert [instance['id'] for instance in instances] == [str(i) for i in range(25)]
+    assert calls == [(0, 10), (10, 10), (20, 10)]
+    assert get_instances.first_result is None
+    assert get_instances.max_results is None
+
+
+def test_iterate_respects_first_and_max_results(engine_url):
+    request, calls = paged_response_mock(total=100)
+    get_variables = pycamunda.variable.GetList(engine_url, first_result=5, max_results=12)
+    with unittest.mock.patch('requests.Session.request', request), \
+            unittest.mock.patch('pycamunda.variable.VariableInstance.load', lambda data: data):
+        variables = list(get_variables.iterate(page_size=5))
+
+    assert [variable['id'] for variable in variables] == [str(i) for i in range(5, 17)]
+    assert calls == [(5, 5), (10, 5), (15, 2)]
+
+
+def test_iterate_is_lazy(engine_url):
+    request, calls = paged_response_mock(total=1000)
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    with unittest.mock.patch('requests.Session.request', request), \
+            unittest.mock.patch('pycamunda.processinst.ProcessInstance.load', lambda data: data):
+        iterator = get_instances.iterate(page_size=10, prefetch=False)
+        next(iterator)
+        iterator.close()
+
+    assert calls == [(0, 10)]
+
+
+def test_iterate_requires_positive_page_size(engine_url):
+    with pytest.raises(ValueError):
+        next(pycamunda.processinst.GetList(engine_url).iterate(page_size=0))
+
+
+def counted_response_mock(total):
+    calls = []
+
+    def request(*args, **kwargs):
+        response = unittest.mock.MagicMock()
+        if kwargs['url'].endswith('/count'):
+            calls.append(('count', kwargs['params']))
+            response.json.return_value = {'count': total}
+            return response
+        first = kwargs['params']['firstResult']
+        size = kwargs['params']['maxResults']
+        calls.append((first, size))
+        response.json.return_value = [
+            {'id': str(i)} for i in range(first, min(first + size, total))
+        ]
+        return response
+
+    return request, calls
+
+
+def test_count_ignores_pagination(engine_url):
+    request, calls = counted_response_mock(total=42)
+    get_instances = pycamunda.processinst.GetList(
+        engine_url, business_key='aKey', sort_by='instance_id', first_result=1, max_results=2
+    )
+    with unittest.mock.patch('requests.Session.request', request):
+        assert get_instances.count() == 42
+
+    assert calls == [('count', {'businessKey': 'aKey'})]
+
+
+def test_iterate_parallel_fetches_windows_in_order(engine_url):
+    request, calls = counted_response_mock(total=95)
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    with unittest.mock.patch('requests.Session.request', request), \
+            unittest.mock.patch('pycamunda.processinst.ProcessInstance.load', lambda data: data):
+        instances = list(get_instances.iterate(page_size=10, max_workers=4))
+
+    assert [instance['id'] for instance in instances] == [str(i) for i in range(95)]
+    assert calls[0][0] == 'count'
+    assert sorted(calls[1:]) == [(i, 10) for i in range(0, 90, 10)] + [(90, 5)]
+
+
+def test_iterate_parallel_respects_first_and_max_results(engine_url):
+    request, calls = counted_response_mock(total=95)
+    get_instances = pycamunda.processinst.GetList(engine_url, first_result=20, max_results=25)
+    with unittest.mock.patch('requests.Session.request', request), \
+            unittest.mock.patch('pycamunda.processinst.ProcessInstance.load', lambda data: data):
+        instances = list(get_instances.iterate(page_size=10, max_workers=2))
+
+    assert [instance['id'] for instance in instances] == [str(i) for i in range(20, 45)]
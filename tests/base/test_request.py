@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import pycamunda.request
+from pycamunda.request import QueryParameter, PathParameter, BodyParameter, BodyParameterContainer
+
+
+class _Request(pycamunda.request.Request):
+
+    id_ = PathParameter('id')
+    sort_by = QueryParameter('sortBy', mapping={'id_': 'id'})
+    ascending = QueryParameter(
+        'sortOrder',
+        mapping={True: 'asc', False: 'desc'},
+        provide=lambda self, obj, obj_type: vars(obj).get('sort_by', None) is not None
+    )
+    first = BodyParameter('first')
+    second = BodyParameter('second')
+    nested = BodyParameterContainer('nested', first, BodyParameterContainer('inner', second))
+    plain = BodyParameter('plain')
+
+    def __init__(self, url, id_=None, sort_by=None, ascending=True):
+        super().__init__(url=url + '/{id}')
+        self.id_ = id_
+        self.sort_by = sort_by
+        self.ascending = ascending
+
+    def __call__(self, *args, **kwargs):
+        pass
+
+
+def test_request_plans_are_compiled_per_class():
+    assert [slot[0] for slot in _Request._path_plan] == ['id']
+    assert [slot[0] for slot in _Request._query_plan] == ['sortBy', 'sortOrder']
+    assert [slot[0] for slot in _Request._body_plan] == ['plain']
+    assert [key for key, _ in _Request._container_plan] == ['nested']
+
+
+def test_request_url(engine_url):
+    assert _Request(engine_url, id_='anId').url == engine_url + '/anId'
+
+
+def test_request_query_parameters_apply_mapping_and_provide(engine_url):
+    assert _Request(engine_url).query_parameters() == {}
+    assert _Request(engine_url, sort_by='id_', ascending=False).query_parameters() == {
+        'sortBy': 'id', 'sortOrder': 'desc'
+    }
+    assert _Request(engine_url, sort_by='unknown').query_parameters() == {'sortOrder': 'asc'}
+
+
+def test_request_body_parameters_traverse_containers(engine_url):
+    request = _Request(engine_url)
+    assert request.body_parameters() == {'nested': {'inner': {}}}
+
+    request.first = 1
+    request.second = 2
+    request.plain = 3
+    assert request.body_parameters(apply=lambda value: value) == {
+        'nested': {'first': 1, 'inner': {'second': 2}}, 'plain': 3
+    }
+
+
+def test_request_overridden_parameter_uses_attribute(engine_url):
+    class _Overriding(_Request):
+        @property
+        def sort_by(self):
+            return 'id_'
+
+        @sort_by.setter
+        def sort_by(self, value):
+            pass
+
+    assert _Overriding(engine_url).query_parameters()['sortBy'] == 'id_'
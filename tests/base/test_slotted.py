@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+import pycamunda.base
+import pycamunda.variable
+
+
+@pycamunda.base.slotted
+@dataclasses.dataclass
+class MyResult:
+    name: str
+    value: int = 1
+    items: list = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def load(cls, data):
+        return cls(name=data['name'])
+
+
+@pytest.fixture
+def string_interning():
+    pycamunda.base.set_string_interning(True)
+    yield
+    pycamunda.base.set_string_interning(False)
+
+
+def test_slotted_instances_have_no_dict():
+    result = MyResult.load({'name': 'aName'})
+
+    assert MyResult.__slots__ == ('name', 'value', 'items')
+    assert not hasattr(result, '__dict__')
+    with pytest.raises(AttributeError):
+        result.other = 'anotherValue'
+
+
+def test_slotted_keeps_dataclass_behaviour():
+    result = MyResult(name='aName')
+
+    assert result.value == 1
+    assert result.items == []
+    assert result == MyResult(name='aName', value=1)
+    assert repr(result) == "MyResult(name='aName', value=1, items=[])"
+    assert dataclasses.asdict(result) == {'name': 'aName', 'value': 1, 'items': []}
+    assert dataclasses.replace(result, value=2).value == 2
+    assert copy.copy(result) == result
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_result_dataclasses_are_slotted():
+    variable = pycamunda.variable.Variable.load(
+        {'value': 'aValue', 'type': 'String', 'valueInfo': {}}
+    )
+
+    assert not hasattr(variable, '__dict__')
+
+
+def test_intern_string_disabled():
+    value = ''.join(['a', 'Topic'])
+
+    assert pycamunda.base.intern_string(value) is value
+    assert pycamunda.base.intern_string(None) is None
+
+
+def test_intern_string_enabled(string_interning):
+    first, second = ''.join(['a', 'Topic']), ''.join(['a', 'Topic'])
+
+    assert first is not second
+    assert pycamunda.base.intern_string(first) is pycamunda.base.intern_string(second)
+    assert pycamunda.base.intern_string(None) is None
+
+
+def test_load_interns_strings(string_interning):
+    first = pycamunda.variable.Variable.load(
+        {'value': 'aValue', 'type': ''.join(['Str', 'ing']), 'valueInfo': {}}
+    )
+    second = pycamunda.variable.Variable.load(
+        {'value': 'aValue', 'type': ''.join(['Str', 'ing']), 'valueInfo': {}}
+    )
+
+    assert first.type_ is second.type_
+
+
+def test_lazyfield_requires_slot():
+    with pytest.raises((TypeError, RuntimeError)):
+        class MyView(pycamunda.base.LazyRecord):
+            name = pycamunda.base.LazyField('name')
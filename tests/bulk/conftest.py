@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+import pycamunda.externaltask
+import pycamunda.processinst
+import pycamunda.task
+from tests.mock import response_mock, not_ok_response_mock
+
+
+@pytest.fixture
+def heterogeneous_requests(engine_url):
+    return [
+        pycamunda.processinst.Delete(engine_url, id_='anInstanceId'),
+        pycamunda.task.Claim(engine_url, id_='aTaskId', user_id='aUserId'),
+        pycamunda.externaltask.SetPriority(engine_url, id_='anExternalTaskId', priority=10),
+    ]
+
+
+def failing_response_mock(*args, **kwargs):
+    if 'fail' in kwargs['url']:
+        response = not_ok_response_mock()
+        response.status_code = 500
+        return response
+    return response_mock()
+
+
+def delayed_response_mock(*args, **kwargs):
+    if 'slow' in kwargs['url']:
+        time.sleep(0.05)
+    return response_mock()
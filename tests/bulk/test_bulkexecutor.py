@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest.mock
+
+import pytest
+
+import pycamunda.bulk
+import pycamunda.client
+import pycamunda.processinst
+from tests.bulk.conftest import failing_response_mock, delayed_response_mock
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_bulkexecutor_sends_heterogeneous_requests(mock, heterogeneous_requests):
+    results = pycamunda.bulk.BulkExecutor(max_workers=2)(heterogeneous_requests)
+
+    assert [result.request for result in results] == heterogeneous_requests
+    assert all(result.ok for result in results)
+    assert sorted(call[1]['method'] for call in mock.call_args_list) == ['DELETE', 'POST', 'PUT']
+
+
+@unittest.mock.patch('requests.Session.request', failing_response_mock)
+def test_bulkexecutor_captures_exceptions(engine_url):
+    requests = [
+        pycamunda.processinst.Delete(engine_url, id_='anId'),
+        pycamunda.processinst.Delete(engine_url, id_='fail'),
+        pycamunda.processinst.Delete(engine_url, id_='anotherId'),
+    ]
+    executor = pycamunda.bulk.BulkExecutor(max_workers=2)
+    results = executor(requests)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].exception, pycamunda.NoSuccess)
+    assert executor.stats.submitted == 3
+    assert executor.stats.succeeded == 2
+    assert executor.stats.failed == 1
+    assert executor.stats.errors == {'NoSuccess': 1}
+    assert executor.stats.throughput > 0
+
+
+@unittest.mock.patch('requests.Session.request', delayed_response_mock)
+def test_bulkexecutor_completion_order(engine_url):
+    requests = [
+        pycamunda.processinst.Delete(engine_url, id_='slow'),
+        pycamunda.processinst.Delete(engine_url, id_='fast'),
+    ]
+    results = list(pycamunda.bulk.BulkExecutor(max_workers=2, ordered=False).map(requests))
+
+    assert [result.index for result in results] == [1, 0]
+
+
+@unittest.mock.patch('requests.Session.request', delayed_response_mock)
+def test_bulkexecutor_submission_order(engine_url):
+    requests = [
+        pycamunda.processinst.Delete(engine_url, id_='slow'),
+        pycamunda.processinst.Delete(engine_url, id_='fast'),
+    ]
+    results = list(pycamunda.bulk.BulkExecutor(max_workers=2, ordered=True).map(requests))
+
+    assert [result.index for result in results] == [0, 1]
+
+
+def test_bulkexecutor_bounds_concurrency(engine_url):
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def request_mock(*args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        with lock:
+            in_flight[0] -= 1
+        return unittest.mock.MagicMock()
+
+    def generate():
+        for i in range(50):
+            assert executor.stats.submitted - executor.stats.completed <= 3
+            yield pycamunda.processinst.Delete(engine_url, id_=str(i))
+
+    executor = pycamunda.bulk.BulkExecutor(max_workers=3)
+    with unittest.mock.patch('requests.Session.request', request_mock):
+        results = executor(generate())
+
+    assert len(results) == 50
+    assert in_flight[1] <= 3
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_bulkexecutor_sets_client(mock, engine_url):
+    client = pycamunda.client.Client()
+    request = pycamunda.processinst.Delete(engine_url, id_='anId')
+    pycamunda.bulk.BulkExecutor(client=client)([request])
+
+    assert request.client is client
+
+
+def test_bulkexecutor_requires_workers():
+    with pytest.raises(ValueError):
+        pycamunda.bulk.BulkExecutor(max_workers=0)
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.bulk
+
+    for name in pycamunda.bulk.__all__:
+        getattr(pycamunda.bulk, name)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import http.server
+import threading
+
+import pytest
+
+import pycamunda.client
+
+
+class _CookieHandler(http.server.BaseHTTPRequestHandler):
+    """Sets a session cookie and records the cookies it receives."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.cookies.append(self.headers.get('Cookie'))
+        self.send_response(200)
+        self.send_header('Set-Cookie', 'JSESSIONID=aSessionId; Path=/')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'[]')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cookie_engine():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _CookieHandler)
+    server.daemon_threads = True
+    server.cookies = []
+    server.url = f'http://127.0.0.1:{server.server_port}/engine-rest'
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    return pycamunda.client.Client(pool_maxsize=20)
+
+
+@pytest.fixture
+def default_client():
+    client = pycamunda.client.Client()
+    pycamunda.client.set_default_client(client)
+    yield client
+    pycamunda.client.set_default_client(None)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+from requests.auth import HTTPBasicAuth
+
+import pycamunda.client
+import pycamunda.processinst
+from tests.mock import raise_requests_exception_mock
+
+
+def test_client_mounts_pooled_adapter(client):
+    for prefix in ('http://', 'https://'):
+        adapter = client.session.get_adapter(prefix + 'localhost')
+        assert adapter._pool_maxsize == 20
+
+
+def test_client_keep_alive(engine_url):
+    client = pycamunda.client.Client()
+    assert client.session.headers['Connection'] == 'keep-alive'
+    client = pycamunda.client.Client(keep_alive=False)
+    assert client.session.headers['Connection'] == 'close'
+
+
+def test_client_binds_auth(engine_url):
+    auth = HTTPBasicAuth(username='Jane', password='password')
+    client = pycamunda.client.Client(auth=auth)
+
+    assert client.session.auth is auth
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_client_request_passes_timeout(mock, engine_url):
+    client = pycamunda.client.Client(timeout=5)
+    client.request('GET', engine_url)
+
+    assert mock.call_args[1]['timeout'] == 5
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_request_uses_client(mock, engine_url, client):
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    get_instances.client = client
+    with unittest.mock.patch.object(client, 'request', wraps=client.request) as client_mock:
+        get_instances()
+
+    assert client_mock.called
+    assert mock.call_args[1]['method'] == 'GET'
+    assert mock.call_args[1]['url'] == engine_url + '/process-instance'
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_request_uses_default_client(mock, engine_url, default_client):
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    with unittest.mock.patch.object(
+        default_client, 'request', wraps=default_client.request
+    ) as client_mock:
+        get_instances()
+
+    assert client_mock.called
+
+
+def test_default_client_is_shared():
+    pycamunda.client.set_default_client(None)
+
+    assert pycamunda.client.get_default_client() is pycamunda.client.get_default_client()
+
+
+@unittest.mock.patch('requests.Session.request', raise_requests_exception_mock)
+def test_request_with_client_raises_pycamunda_exception(engine_url, client):
+    get_instances = pycamunda.processinst.GetList(engine_url)
+    get_instances.client = client
+    with pytest.raises(pycamunda.PyCamundaException):
+        get_instances()
+
+
+def test_client_context_manager_closes_session(engine_url):
+    client = pycamunda.client.Client()
+    with unittest.mock.patch.object(client.session, 'close') as mock:
+        with client:
+            pass
+
+    assert mock.called
+
+
+def test_client_discards_cookies(cookie_engine):
+    with pycamunda.client.Client() as client:
+        for _ in range(2):
+            get_instances = pycamunda.processinst.GetList(cookie_engine.url)
+            get_instances.client = client
+            get_instances()
+
+    assert cookie_engine.cookies == [None, None]
+    assert not client.session.cookies
+
+
+def test_client_persists_cookies(cookie_engine):
+    with pycamunda.client.Client(persist_cookies=True) as client:
+        for _ in range(2):
+            get_instances = pycamunda.processinst.GetList(cookie_engine.url)
+            get_instances.client = client
+            get_instances()
+
+    assert cookie_engine.cookies == [None, 'JSESSIONID=aSessionId']
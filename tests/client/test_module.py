@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.client
+
+    for name in pycamunda.client.__all__:
+        getattr(pycamunda.client, name)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture
+def my_tasks_json():
+    task_json = {
+        'assignee': 'anAssignee',
+        'caseDefinitionId': None,
+        'caseExecutionId': None,
+        'caseInstanceId': None,
+        'delegationState': None,
+        'description': None,
+        'executionId': 'anExecutionId',
+        'formKey': None,
+        'id': 'anId',
+        'name': 'aName',
+        'owner': None,
+        'parentTaskId': None,
+        'priority': 50,
+        'processDefinitionId': 'aDefinitionId',
+        'processInstanceId': 'anInstanceId',
+        'suspended': False,
+        'taskDefinitionKey': 'aDefinitionKey',
+        'created': '2000-01-01T01:01:01.000+0000',
+        'due': None,
+        'followUp': '2000-01-01T01:01:01.000+0100'
+    }
+    return [task_json, dict(task_json, id='anotherId', priority=10, due=task_json['created'])]
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import datetime as dt
+import random
+import unittest.mock
+
+import pytest
+
+import pycamunda.base
+import pycamunda.columnar
+import pycamunda.processinst
+import pycamunda.resource
+import pycamunda.task
+
+
+def test_load_columns_lists(my_tasks_json):
+    columns = pycamunda.columnar.load_columns(pycamunda.task._TaskView, my_tasks_json)
+    tasks = [pycamunda.task.Task.load(task_json) for task_json in my_tasks_json]
+
+    assert list(columns) == [field for field in pycamunda.task.Task.__dataclass_fields__]
+    for name, column in columns.items():
+        assert column == [getattr(task, name) for task in tasks]
+
+
+def test_load_columns_parses_datetimes(my_tasks_json):
+    columns = pycamunda.columnar.load_columns(pycamunda.task._TaskView, my_tasks_json)
+
+    assert columns['created'][0] == dt.datetime(2000, 1, 1, 1, 1, 1, tzinfo=dt.timezone.utc)
+    assert columns['due'] == [None, columns['created'][0]]
+
+
+def test_load_columns_applies_loaders():
+    data = [{
+        'id': 'anId',
+        'definitionId': 'aDefinitionId',
+        'businessKey': None,
+        'caseInstanceId': None,
+        'tenantId': None,
+        'suspended': False,
+        'links': [{'method': 'GET', 'href': 'aHref', 'rel': 'self'}]
+    }]
+    columns = pycamunda.columnar.load_columns(pycamunda.processinst._ProcessInstanceView, data)
+
+    assert columns['links'] == [(pycamunda.resource.Link('GET', 'aHref', 'self'), )]
+    assert columns['variables'] == [None]
+
+
+def test_load_columns_empty():
+    columns = pycamunda.columnar.load_columns(pycamunda.task._TaskView, [])
+
+    assert all(column == [] for column in columns.values())
+
+
+def test_load_columns_raises_for_unknown_output(my_tasks_json):
+    with pytest.raises(ValueError):
+        pycamunda.columnar.load_columns(pycamunda.task._TaskView, my_tasks_json, output='csv')
+
+
+def test_load_columns_numpy(my_tasks_json):
+    numpy = pytest.importorskip('numpy')
+    columns = pycamunda.columnar.load_columns(
+        pycamunda.task._TaskView, my_tasks_json, output='numpy'
+    )
+
+    assert columns['priority'].tolist() == [50, 10]
+    assert columns['created'].dtype == numpy.dtype('datetime64[ms]')
+    assert numpy.isnat(columns['due'][0])
+
+
+def test_load_columns_pandas(my_tasks_json):
+    pytest.importorskip('pandas')
+    frame = pycamunda.columnar.load_columns(
+        pycamunda.task._TaskView, my_tasks_json, output='pandas'
+    )
+
+    assert list(frame['id_']) == ['anId', 'anotherId']
+    assert str(frame['created'].dt.tz) == 'UTC'
+
+
+def test_from_isoformat_many():
+    values = ['2000-01-01T01:01:01.000+0000', None, '2000-01-01T01:01:01.000+0000']
+    datetimes = pycamunda.columnar.from_isoformat_many(values)
+
+    assert datetimes == [pycamunda.base.from_isoformat(values[0]), None, datetimes[0]]
+
+
+def random_datetime_strings(n, seed=0):
+    rng = random.Random(seed)
+    offsets = ['+0000', '+0100', '+0530', '-0345', '-1200', '+1400']
+    return [
+        '%04d-%02d-%02dT%02d:%02d:%02d.%03d%s' % (
+            rng.randint(1, 9999), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23),
+            rng.randint(0, 59), rng.randint(0, 59), rng.randint(0, 999), rng.choice(offsets)
+        )
+        for _ in range(n)
+    ]
+
+
+def test_from_isoformat_many_matches_from_isoformat():
+    values = random_datetime_strings(2000) + [None, '2020-01-01T01:01:01.123456+01:00']
+
+    datetimes = pycamunda.columnar.from_isoformat_many(values)
+
+    for value, datetime_ in zip(values, datetimes):
+        if value is None:
+            assert datetime_ is None
+        else:
+            expected = pycamunda.base.from_isoformat(value)
+            assert datetime_ == expected
+            assert datetime_.tzinfo == expected.tzinfo
+
+
+def test_from_isoformat_many_parses_in_bulk():
+    pytest.importorskip('numpy')
+    values = random_datetime_strings(100)
+
+    with unittest.mock.patch('pycamunda.base.from_isoformat') as from_isoformat_mock:
+        pycamunda.columnar.from_isoformat_many(values)
+
+    assert not from_isoformat_mock.called
+
+
+@pytest.mark.parametrize('value', [
+    '2020-02-30T01:01:01.000+0000',
+    '2020-01-01T24:01:01.000+0000',
+    '7204-06-07T19:09:17.302+1760',
+    '2020-01-01 01:01:01.000+0000',
+])
+def test_from_isoformat_many_rejects_invalid_strings(value):
+    with pytest.raises(ValueError):
+        pycamunda.columnar.from_isoformat_many(['2020-01-01T01:01:01.000+0000', value])
+
+
+def test_datetime64_many():
+    numpy = pytest.importorskip('numpy')
+    values = random_datetime_strings(500) + [None]
+
+    datetimes = pycamunda.columnar._datetime64_many(values)
+
+    expected = [
+        None if datetime_ is None
+        else datetime_.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        for datetime_ in map(
+            lambda value: value and pycamunda.base.from_isoformat(value), values
+        )
+    ]
+    assert datetimes.dtype == numpy.dtype('datetime64[ms]')
+    assert datetimes.tolist() == expected
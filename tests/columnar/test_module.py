@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.columnar
+
+    for name in pycamunda.columnar.__all__:
+        getattr(pycamunda.columnar, name)
@@ -5,6 +5,14 @@ import datetime as dt
 import pytest
 
 import pycamunda.base
+import pycamunda.externaltask
+
+
+@pytest.fixture(autouse=True)
+def clear_error_details_cache():
+    """The tests request error details of the same external tasks from the same url."""
+    yield
+    pycamunda.externaltask._error_details_cache.clear()
 
 
 @pytest.fixture
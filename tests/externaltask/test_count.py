@@ -48,3 +48,20 @@ def test_count_returns_int(engine_url):
     result = count_tasks()
 
     assert isinstance(result, int)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_count_count_sends_count_request(mock, engine_url):
+    mock.return_value.json.return_value = {'count': 3}
+    count_tasks = pycamunda.externaltask.Count(url=engine_url)
+
+    assert count_tasks.count() == 3
+    assert mock.call_count == 1
+    assert mock.call_args[1]['url'] == engine_url + '/external-task/count'
+
+
+def test_count_cannot_be_iterated(engine_url):
+    count_tasks = pycamunda.externaltask.Count(url=engine_url)
+
+    with pytest.raises(TypeError):
+        count_tasks.iterate()
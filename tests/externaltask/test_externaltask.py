@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
+
 import pytest
 
 import pycamunda.externaltask
@@ -53,3 +55,11 @@ def test_externaltask_load_raises_keyerror(my_externaltask_json):
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.externaltask.ExternalTask.load(data=json_)
+
+
+def test_externaltask_view_equals_load(my_externaltask_json):
+    externaltask = pycamunda.externaltask.ExternalTask.load(my_externaltask_json)
+    view = pycamunda.externaltask._ExternalTaskView(my_externaltask_json)
+
+    assert isinstance(view, pycamunda.externaltask.ExternalTask)
+    assert dataclasses.asdict(view) == dataclasses.asdict(externaltask)
@@ -50,3 +50,16 @@ def test_get_returns_none(engine_url):
     task = get_task()
 
     assert isinstance(task, pycamunda.externaltask.ExternalTask)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_get_does_not_request_error_details_of_tasks_that_never_failed(
+    mock, engine_url, my_externaltask_json
+):
+    mock.return_value.json.return_value = dict(my_externaltask_json, retries=None)
+    del mock.return_value.json.return_value['errorDetails']
+    get_task = pycamunda.externaltask.Get(url=engine_url, id_='anId')
+    task = get_task()
+
+    assert task.error_details is None
+    assert mock.call_count == 1
@@ -52,3 +52,115 @@ def test_getlist_returns_tuple(engine_url):
     tasks = get_tasks()
 
     assert isinstance(tasks, tuple)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_lazy_returns_views(mock, engine_url, my_externaltask_json):
+    mock.return_value.json.return_value = [my_externaltask_json]
+    get_external_tasks = pycamunda.externaltask.GetList(url=engine_url, lazy=True, request_error_details=False)
+    external_tasks = get_external_tasks()
+
+    assert len(external_tasks) == 1
+    assert isinstance(external_tasks[0], pycamunda.externaltask._ExternalTaskView)
+    assert external_tasks[0].id_ == my_externaltask_json['id']
+
+
+def error_details_engine(tasks_json):
+
+    def request(method, url, **kwargs):
+        response = unittest.mock.MagicMock()
+        if url.endswith('/errorDetails'):
+            response.text = 'details of ' + url.rsplit('/', 2)[-2]
+        else:
+            response.json.return_value = tasks_json
+        return response
+
+    return unittest.mock.MagicMock(side_effect=request)
+
+
+def test_getlist_requests_error_details_of_failed_tasks(engine_url, my_externaltask_json):
+    tasks_json = []
+    for i in range(4):
+        task_json = dict(my_externaltask_json, id=f'task{i}', retries=None if i == 0 else 1)
+        del task_json['errorDetails']
+        tasks_json.append(task_json)
+    mock = error_details_engine(tasks_json)
+    get_tasks = pycamunda.externaltask.GetList(url=engine_url, max_workers=2)
+
+    with unittest.mock.patch('requests.Session.request', mock):
+        tasks = get_tasks()
+
+    assert [task.error_details for task in tasks] == [
+        None, 'details of task1', 'details of task2', 'details of task3'
+    ]
+    assert sorted(call[1]['url'] for call in mock.call_args_list[1:]) == [
+        engine_url + f'/external-task/task{i}/errorDetails' for i in range(1, 4)
+    ]
+
+
+def test_getlist_caches_error_details(engine_url, my_externaltask_json):
+    task_json = dict(my_externaltask_json)
+    del task_json['errorDetails']
+    mock = error_details_engine([task_json])
+    get_tasks = pycamunda.externaltask.GetList(url=engine_url, error_details_ttl=60)
+
+    with unittest.mock.patch('requests.Session.request', mock):
+        get_tasks()
+        task, = get_tasks()
+    failed_again_mock = error_details_engine([dict(task_json, retries=9)])
+    with unittest.mock.patch('requests.Session.request', failed_again_mock):
+        failed_again, = get_tasks()
+
+    assert task.error_details == 'details of anId'
+    assert mock.call_count == 3
+    assert failed_again.error_details == 'details of anId'
+    assert failed_again_mock.call_count == 2
+
+
+def failing_engine(task_json, failures):
+
+    def request(method, url, **kwargs):
+        response = unittest.mock.MagicMock()
+        if url.endswith('/errorDetails'):
+            response.text = f'trace of failure #{failures[0]}'
+        else:
+            response.json.return_value = [task_json]
+        return response
+
+    return unittest.mock.MagicMock(side_effect=request)
+
+
+def test_getlist_requests_error_details_of_repeated_failure(engine_url, my_externaltask_json):
+    task_json = dict(my_externaltask_json, retries=2, errorMessage='Connection refused')
+    del task_json['errorDetails']
+    failures = [1]
+    get_tasks = pycamunda.externaltask.GetList(url=engine_url)
+
+    with unittest.mock.patch('requests.Session.request', failing_engine(task_json, failures)):
+        first, = get_tasks()
+        failures[0] = 2
+        second, = get_tasks()
+
+    assert first.error_details == 'trace of failure #1'
+    assert second.error_details == 'trace of failure #2'
+
+
+def test_getlist_cached_error_details_expire(engine_url, my_externaltask_json):
+    task_json = dict(my_externaltask_json, retries=2, errorMessage='Connection refused')
+    del task_json['errorDetails']
+    failures = [1]
+    get_tasks = pycamunda.externaltask.GetList(url=engine_url, error_details_ttl=60)
+
+    with unittest.mock.patch('requests.Session.request', failing_engine(task_json, failures)), \
+            unittest.mock.patch('time.monotonic') as monotonic:
+        monotonic.return_value = 1000.0
+        first, = get_tasks()
+        failures[0] = 2
+        monotonic.return_value = 1059.0
+        cached, = get_tasks()
+        monotonic.return_value = 1061.0
+        expired, = get_tasks()
+
+    assert first.error_details == 'trace of failure #1'
+    assert cached.error_details == 'trace of failure #1'
+    assert expired.error_details == 'trace of failure #2'
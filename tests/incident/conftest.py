@@ -39,7 +39,9 @@ def getlist_input():
         'tenant_id_in': [],
         'job_definition_id_in': [],
         'sort_by': 'incident_id',
-        'ascending': False
+        'ascending': False,
+        'first_result': 1,
+        'max_results': 10
     }
 
 
@@ -60,5 +62,7 @@ def getlist_output():
         'tenantIdIn': [],
         'jobDefinitionIdIn': [],
         'sortBy': 'incidentId',
-        'sortOrder': 'desc'
+        'sortOrder': 'desc',
+        'firstResult': 1,
+        'maxResults': 10
     }
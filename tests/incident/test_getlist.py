@@ -52,3 +52,14 @@ def test_getlist_returns_incidents_tuple(engine_url):
 
     assert isinstance(incidents, tuple)
     assert all(isinstance(incident, pycamunda.incident.IncidentType) for incident in incidents)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_lazy_returns_views(mock, engine_url, my_incident_json):
+    mock.return_value.json.return_value = [my_incident_json]
+    get_incidents = pycamunda.incident.GetList(url=engine_url, lazy=True)
+    incidents = get_incidents()
+
+    assert len(incidents) == 1
+    assert isinstance(incidents[0], pycamunda.incident._IncidentView)
+    assert incidents[0].id_ == my_incident_json['id']
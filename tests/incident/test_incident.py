@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
 import datetime as dt
 
 import pytest
@@ -35,3 +36,11 @@ def test_incident_load_raises_keyerror(my_incident_json):
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.incident.Incident.load(json_)
+
+
+def test_incident_view_equals_load(my_incident_json):
+    incident = pycamunda.incident.Incident.load(my_incident_json)
+    view = pycamunda.incident._IncidentView(my_incident_json)
+
+    assert isinstance(view, pycamunda.incident.Incident)
+    assert dataclasses.asdict(view) == dataclasses.asdict(incident)
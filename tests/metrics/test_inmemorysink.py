@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import pytest
+
+import pycamunda.metrics
+
+COUNTER = pycamunda.metrics.Metric('things_total', 'counter', 'Things.')
+HISTOGRAM = pycamunda.metrics.Metric('duration_seconds', 'histogram', 'Durations.', (0.1, 1.0))
+
+
+def test_increment_counts_by_labels():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.increment(COUNTER)
+    sink.increment(COUNTER, {'topic': 'a'}, value=2)
+    sink.increment(COUNTER, {'topic': 'a'})
+    sink.increment(COUNTER, {'topic': 'b'})
+    snapshot = sink.snapshot()
+
+    assert snapshot.counter('things_total') == 5
+    assert snapshot.counter('things_total', topic='a') == 3
+    assert snapshot.counter('things_total', topic='c') == 0
+    assert snapshot.counter('unknown_total') == 0
+
+
+def test_observe_counts_values_per_bucket():
+    sink = pycamunda.metrics.InMemorySink()
+    for value in (0.05, 0.1, 0.5, 2.0):
+        sink.observe(HISTOGRAM, value, {'topic': 'a'})
+    histogram = sink.snapshot().histogram('duration_seconds', topic='a')
+
+    assert histogram.buckets == (0.1, 1.0)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.mean == pytest.approx(0.6625)
+
+
+def test_histogram_merges_labels():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.observe(HISTOGRAM, 0.05, {'topic': 'a'})
+    sink.observe(HISTOGRAM, 0.5, {'topic': 'b'})
+    snapshot = sink.snapshot()
+
+    assert snapshot.histogram('duration_seconds').counts == [1, 1, 0]
+    assert snapshot.histogram('duration_seconds', topic='c') is None
+
+
+def test_snapshot_is_a_copy():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.increment(COUNTER)
+    sink.observe(HISTOGRAM, 0.5)
+    snapshot = sink.snapshot()
+    sink.increment(COUNTER)
+    sink.observe(HISTOGRAM, 0.5)
+
+    assert snapshot.counter('things_total') == 1
+    assert snapshot.histogram('duration_seconds').count == 1
+
+
+def test_reset_discards_values():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.increment(COUNTER)
+    sink.reset()
+
+    assert sink.snapshot().counters == {}
+
+
+def test_increment_is_thread_safe():
+    sink = pycamunda.metrics.InMemorySink()
+
+    def increment():
+        for _ in range(10000):
+            sink.increment(COUNTER, {'topic': 'a'})
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sink.snapshot().counter('things_total') == 40000
+
+
+def test_null_sink_discards_values():
+    sink = pycamunda.metrics.NullSink()
+    sink.increment(COUNTER)
+    sink.observe(HISTOGRAM, 1.0)
+
+
+def test_sink_is_abstract():
+    with pytest.raises(TypeError):
+        pycamunda.metrics.Sink()
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.metrics
+
+    for name in pycamunda.metrics.__all__:
+        getattr(pycamunda.metrics, name)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import pycamunda.metrics
+
+COUNTER = pycamunda.metrics.Metric('things_total', 'counter', 'Things.')
+HISTOGRAM = pycamunda.metrics.Metric('duration_seconds', 'histogram', 'Durations.', (0.1, 1.0))
+
+
+def test_to_prometheus():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.increment(COUNTER, {'topic': 'a'}, value=2)
+    sink.increment(COUNTER, {'topic': 'b'})
+    sink.observe(HISTOGRAM, 0.05)
+    sink.observe(HISTOGRAM, 0.5)
+    sink.observe(HISTOGRAM, 2.0)
+
+    assert pycamunda.metrics.to_prometheus(sink.snapshot()) == (
+        '# HELP pycamunda_worker_duration_seconds Durations.\n'
+        '# TYPE pycamunda_worker_duration_seconds histogram\n'
+        'pycamunda_worker_duration_seconds_bucket{le="0.1"} 1\n'
+        'pycamunda_worker_duration_seconds_bucket{le="1"} 2\n'
+        'pycamunda_worker_duration_seconds_bucket{le="+Inf"} 3\n'
+        'pycamunda_worker_duration_seconds_sum 2.55\n'
+        'pycamunda_worker_duration_seconds_count 3\n'
+        '# HELP pycamunda_worker_things_total Things.\n'
+        '# TYPE pycamunda_worker_things_total counter\n'
+        'pycamunda_worker_things_total{topic="a"} 2\n'
+        'pycamunda_worker_things_total{topic="b"} 1\n'
+    )
+
+
+def test_to_prometheus_escapes_label_values():
+    sink = pycamunda.metrics.InMemorySink()
+    sink.increment(COUNTER, {'topic': 'a"b\\c\nd'})
+
+    text = pycamunda.metrics.to_prometheus(sink.snapshot(), namespace='')
+
+    assert 'things_total{topic="a\\"b\\\\c\\nd"} 1\n' in text
+
+
+def test_to_prometheus_of_empty_snapshot():
+    snapshot = pycamunda.metrics.InMemorySink().snapshot()
+
+    assert pycamunda.metrics.to_prometheus(snapshot) == ''
@@ -84,3 +84,22 @@ def fetch_response_mock(*args, **kwargs):
             return {'enableTelemetry': True}
 
     return Response()
+
+
+def streamed_response_mock(*args, **kwargs):
+    class Response:
+        ok = True
+        closed = False
+
+        def __bool__(self):
+            return bool(self.ok)
+
+        def iter_content(self, chunk_size):
+            content = b'binary content'
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+
+        def close(self):
+            self.closed = True
+
+    return Response()
@@ -50,3 +50,14 @@ def test_getlist_returns_none(engine_url):
     instances = get_instances()
 
     assert isinstance(instances, tuple)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_lazy_returns_views(mock, engine_url, my_process_instance_json):
+    mock.return_value.json.return_value = [my_process_instance_json]
+    get_instances = pycamunda.processinst.GetList(url=engine_url, lazy=True)
+    instances = get_instances()
+
+    assert len(instances) == 1
+    assert isinstance(instances[0], pycamunda.processinst._ProcessInstanceView)
+    assert instances[0].id_ == my_process_instance_json['id']
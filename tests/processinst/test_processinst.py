@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
+
 import pytest
 
 import pycamunda.processinst
@@ -23,3 +25,11 @@ def test_processinstance_load_raises_keyerror(my_process_instance_json):
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.processinst.ProcessInstance.load(data=json_)
+
+
+def test_processinstance_view_equals_load(my_process_instance_json):
+    process_instance = pycamunda.processinst.ProcessInstance.load(my_process_instance_json)
+    view = pycamunda.processinst._ProcessInstanceView(my_process_instance_json)
+
+    assert isinstance(view, pycamunda.processinst.ProcessInstance)
+    assert dataclasses.asdict(view) == dataclasses.asdict(process_instance)
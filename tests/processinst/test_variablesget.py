@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import io
 import unittest.mock
 
 import pytest
 
 import pycamunda.processinst
 import pycamunda.variable
-from tests.mock import raise_requests_exception_mock, not_ok_response_mock
+from tests.mock import (
+    raise_requests_exception_mock, not_ok_response_mock, streamed_response_mock
+)
 
 
 def test_variablesget_params(engine_url):
@@ -71,3 +74,69 @@ def test_variablesget_returns_variable(engine_url):
     variable = get_var()
 
     assert isinstance(variable, pycamunda.variable.Variable)
+
+
+@unittest.mock.patch('requests.Session.request', side_effect=streamed_response_mock)
+def test_variablesget_iter_content_streams_data(mock, engine_url):
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar'
+    )
+    chunks = list(get_var.iter_content(chunk_size=4))
+
+    assert chunks == [b'bina', b'ry c', b'onte', b'nt']
+    assert mock.call_args[1]['url'] == engine_url + '/process-instance/anId/variables/aVar/data'
+    assert mock.call_args[1]['stream'] is True
+
+
+def test_variablesget_iter_content_closes_response(engine_url):
+    response = streamed_response_mock()
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar', binary=True
+    )
+    with unittest.mock.patch('requests.Session.request', return_value=response) as mock:
+        chunks = get_var.iter_content(chunk_size=4)
+        next(chunks)
+        chunks.close()
+
+    assert mock.call_args[1]['url'] == engine_url + '/process-instance/anId/variables/aVar/data'
+    assert response.closed
+
+
+def test_variablesget_iter_content_chunk_size_must_be_positive(engine_url):
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar'
+    )
+    with pytest.raises(ValueError):
+        next(get_var.iter_content(chunk_size=0))
+
+
+@unittest.mock.patch('requests.Session.request', streamed_response_mock)
+def test_variablesget_download_to_file_object(engine_url):
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar'
+    )
+    file = io.BytesIO()
+
+    assert get_var.download(file, chunk_size=4) == 14
+    assert file.getvalue() == b'binary content'
+
+
+@unittest.mock.patch('requests.Session.request', streamed_response_mock)
+def test_variablesget_download_to_path(engine_url, tmp_path):
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar'
+    )
+
+    assert get_var.download(tmp_path / 'aFile') == 14
+    assert (tmp_path / 'aFile').read_bytes() == b'binary content'
+
+
+@unittest.mock.patch('requests.Session.request', raise_requests_exception_mock)
+def test_variablesget_download_removes_partial_file(engine_url, tmp_path):
+    get_var = pycamunda.processinst.VariablesGet(
+        url=engine_url, process_instance_id='anId', var_name='aVar'
+    )
+    with pytest.raises(pycamunda.PyCamundaException):
+        get_var.download(tmp_path / 'aFile')
+
+    assert not (tmp_path / 'aFile').exists()
@@ -78,6 +78,25 @@ def test_variablesupdate_binary_calls_requests(mock, engine_url):
     assert mock.called
 
 
+@unittest.mock.patch('requests.Session.request')
+def test_variablesupdate_binary_streams_multipart_form(mock, engine_url, tmp_path):
+    path = tmp_path / 'aFile.pdf'
+    path.write_bytes(b'file content')
+    update_var = pycamunda.processinst.VariablesUpdate(
+        url=engine_url, process_instance_id='anId', var_name='aVar', value=path, type_='File'
+    )
+    update_var()
+    kwargs = mock.call_args[1]
+    body = kwargs['data']
+
+    assert kwargs['method'] == 'POST'
+    assert kwargs['url'] == engine_url + '/process-instance/anId/variables/aVar/data'
+    assert kwargs['headers'] == {'Content-Type': body.content_type}
+    assert body.len == len(b''.join(body))
+    assert b'name="valueType"\r\n\r\nFile\r\n' in b''.join(body)
+    assert b'filename="aFile.pdf"\r\n\r\nfile content\r\n' in b''.join(body)
+
+
 @unittest.mock.patch('requests.Session.request', raise_requests_exception_mock)
 def test_variablesupdate_raises_pycamunda_exception(engine_url):
     update_var = pycamunda.processinst.VariablesUpdate(
@@ -4,6 +4,7 @@ import unittest.mock
 
 import pytest
 
+import pycamunda.base
 import pycamunda.task
 from tests.mock import raise_requests_exception_mock, not_ok_response_mock
 
@@ -51,3 +52,25 @@ def test_getlist_returns_group(engine_url):
 
     assert isinstance(tasks, tuple)
     assert all(isinstance(task, pycamunda.task.Task) for task in tasks)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_lazy_returns_views(mock, engine_url, my_task_json):
+    mock.return_value.json.return_value = [my_task_json]
+    get_tasks = pycamunda.task.GetList(url=engine_url, lazy=True)
+    tasks = get_tasks()
+
+    assert len(tasks) == 1
+    assert isinstance(tasks[0], pycamunda.task._TaskView)
+    assert tasks[0].id_ == my_task_json['id']
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_columns(mock, engine_url, my_task_json):
+    mock.return_value.json.return_value = [my_task_json]
+    get_tasks = pycamunda.task.GetList(url=engine_url, assignee='anAssignee')
+    columns = get_tasks.columns()
+
+    assert mock.call_args[1]['params']['assignee'] == 'anAssignee'
+    assert columns['id_'] == [my_task_json['id']]
+    assert columns['created'] == [pycamunda.base.from_isoformat(my_task_json['created'])]
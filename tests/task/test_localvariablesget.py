@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import io
 import unittest.mock
 
 import pytest
 
 import pycamunda.task
 import pycamunda.variable
-from tests.mock import raise_requests_exception_mock, not_ok_response_mock
+from tests.mock import (
+    raise_requests_exception_mock, not_ok_response_mock, streamed_response_mock
+)
 
 
 def test_localvariablesget_params(engine_url):
@@ -59,3 +62,22 @@ def test_localvariablesget_returns_variable(engine_url):
     variable = get_var()
 
     assert isinstance(variable, pycamunda.variable.Variable)
+
+
+@unittest.mock.patch('requests.Session.request', side_effect=streamed_response_mock)
+def test_localvariablesget_iter_content_streams_data(mock, engine_url):
+    get_var = pycamunda.task.LocalVariablesGet(url=engine_url, task_id='anId', var_name='aVar')
+    chunks = list(get_var.iter_content(chunk_size=8))
+
+    assert chunks == [b'binary c', b'ontent']
+    assert mock.call_args[1]['url'] == engine_url + '/task/anId/localVariables/aVar/data'
+    assert mock.call_args[1]['stream'] is True
+
+
+@unittest.mock.patch('requests.Session.request', streamed_response_mock)
+def test_localvariablesget_download(engine_url):
+    get_var = pycamunda.task.LocalVariablesGet(url=engine_url, task_id='anId', var_name='aVar')
+    file = io.BytesIO()
+
+    assert get_var.download(file) == 14
+    assert file.getvalue() == b'binary content'
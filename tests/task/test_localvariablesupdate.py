@@ -56,6 +56,19 @@ def test_localvariablesupdate_binary_calls_requests(mock, engine_url):
     assert mock.called
 
 
+@unittest.mock.patch('requests.Session.request')
+def test_localvariablesupdate_binary_streams_multipart_form(mock, engine_url):
+    update_var = pycamunda.task.LocalVariablesUpdate(
+        url=engine_url, task_id='anId', var_name='aVar', value=b'content', type_='Bytes'
+    )
+    update_var()
+    kwargs = mock.call_args[1]
+
+    assert kwargs['method'] == 'POST'
+    assert kwargs['url'] == engine_url + '/task/anId/localVariables/aVar/data'
+    assert b'filename="data"\r\n\r\ncontent\r\n' in b''.join(kwargs['data'])
+
+
 @unittest.mock.patch('requests.Session.request', raise_requests_exception_mock)
 def test_localvariablesupdate_raises_pycamunda_exception(engine_url):
     update_var = pycamunda.task.LocalVariablesUpdate(
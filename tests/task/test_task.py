@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
+import pickle
+
 import pytest
 
 import pycamunda.base
@@ -18,3 +21,29 @@ def test_task_load_raises_key_error(my_task_json):
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.task.Task.load(data=json_)
+
+
+def test_task_view_equals_load(my_task_json):
+    task = pycamunda.task.Task.load(data=my_task_json)
+    view = pycamunda.task._TaskView(my_task_json)
+
+    assert isinstance(view, pycamunda.task.Task)
+    assert dataclasses.asdict(view) == dataclasses.asdict(task)
+
+
+def test_task_view_converts_on_first_access(my_task_json):
+    view = pycamunda.task._TaskView(my_task_json)
+
+    with pytest.raises(AttributeError):
+        pycamunda.task.Task.created.__get__(view)
+    assert view.created == pycamunda.base.from_isoformat(my_task_json['created'])
+    assert view.created is view.created
+
+
+def test_task_view_is_slotted(my_task_json):
+    view = pycamunda.task._TaskView(my_task_json)
+    view.assignee = 'anotherAssignee'
+
+    assert not hasattr(view, '__dict__')
+    assert view.assignee == 'anotherAssignee'
+    assert pickle.loads(pickle.dumps(view)) == view
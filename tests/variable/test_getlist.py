@@ -84,3 +84,14 @@ def test_getlist_returns_variableinstances(engine_url):
 
     assert isinstance(variables, tuple)
     assert all(isinstance(variable, pycamunda.variable.VariableInstance) for variable in variables)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_getlist_lazy_returns_views(mock, engine_url, my_variableinstance_json):
+    mock.return_value.json.return_value = [my_variableinstance_json]
+    get_variables = pycamunda.variable.GetList(url=engine_url, lazy=True)
+    variables = get_variables()
+
+    assert len(variables) == 1
+    assert isinstance(variables[0], pycamunda.variable._VariableInstanceView)
+    assert variables[0].id_ == my_variableinstance_json['id']
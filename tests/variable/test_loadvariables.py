@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.variable
+from tests.mock import raise_requests_exception_mock
+
+
+def variable_json(name, process_instance_id, execution_id=None, task_id=None, value='aVal'):
+    return {
+        'id': f'{name}Id',
+        'name': name,
+        'type': 'String',
+        'value': value,
+        'valueInfo': {},
+        'processInstanceId': process_instance_id,
+        'executionId': execution_id or process_instance_id,
+        'caseInstanceId': None,
+        'caseExecutionId': None,
+        'taskId': task_id,
+        'activityInstanceId': process_instance_id,
+        'tenantId': None,
+        'errorMessage': None
+    }
+
+
+class FakeEngine:
+    """Answers variable instance queries from a list of variable instances."""
+
+    def __init__(self, variables):
+        self.variables = variables
+        self.queries = []
+
+    def __call__(self, method, url, params=None, **kwargs):
+        self.queries.append((url, params))
+        response = unittest.mock.MagicMock()
+        response.ok = True
+        response.__bool__.return_value = True
+        for key, attribute in (
+            ('processInstanceIdIn', 'processInstanceId'),
+            ('executionIdIn', 'executionId'),
+            ('taskIdIn', 'taskId')
+        ):
+            if key in params:
+                ids = params[key].split(',')
+                variables = [
+                    variable for variable in self.variables if variable[attribute] in ids
+                ]
+        first = int(params.get('firstResult', 0))
+        response.json.return_value = variables[first:first + int(params['maxResults'])]
+        return response
+
+
+def test_load_variables_of_process_instances(engine_url):
+    engine = FakeEngine([
+        variable_json('a', 'instance1', value=1),
+        variable_json('b', 'instance1', value=2),
+        variable_json('a', 'instance2', value=3),
+        variable_json('local', 'instance2', execution_id='anExecutionId'),
+        variable_json('taskLocal', 'instance2', task_id='aTaskId'),
+    ])
+    with unittest.mock.patch('requests.Session.request', side_effect=engine):
+        variables = pycamunda.variable.load_variables(
+            engine_url, ['instance1', 'instance2', 'instance3']
+        )
+
+    assert variables == {
+        'instance1': {
+            'a': pycamunda.variable.Variable(value=1, type_='String', value_info={}),
+            'b': pycamunda.variable.Variable(value=2, type_='String', value_info={})
+        },
+        'instance2': {
+            'a': pycamunda.variable.Variable(value=3, type_='String', value_info={})
+        },
+        'instance3': {}
+    }
+    url, params = engine.queries[0]
+    assert url == engine_url + '/variable-instance'
+    assert params == {
+        'executionIdIn': 'instance1,instance2,instance3', 'deserializeValues': 'false',
+        'firstResult': 0, 'maxResults': 1000
+    }
+
+
+@pytest.mark.parametrize('scope, key', [('execution', 'executionIdIn'), ('task', 'taskIdIn')])
+def test_load_variables_of_executions_and_tasks(engine_url, scope, key):
+    engine = FakeEngine([
+        variable_json('a', 'instance1', execution_id='execution1'),
+        variable_json('b', 'instance1', execution_id='execution1', task_id='task1'),
+    ])
+    with unittest.mock.patch('requests.Session.request', side_effect=engine):
+        variables = pycamunda.variable.load_variables(
+            engine_url, ['execution1', 'task1'], scope=scope, deserialize_values=True
+        )
+
+    names = {id_: sorted(scope_variables) for id_, scope_variables in variables.items()}
+    if scope == 'execution':
+        assert names == {'execution1': ['a'], 'task1': []}
+    else:
+        assert names == {'execution1': [], 'task1': ['b']}
+    assert engine.queries[0][1][key] == 'execution1,task1'
+    assert engine.queries[0][1]['deserializeValues'] == 'true'
+
+
+def test_load_variables_chunks_ids_by_url_length(engine_url):
+    ids = [f'instance{i:04}' for i in range(1000)]
+    engine = FakeEngine([variable_json('a', id_) for id_ in ids])
+    with unittest.mock.patch('requests.Session.request', side_effect=engine):
+        variables = pycamunda.variable.load_variables(
+            engine_url, ids + ids[:10], max_url_length=500
+        )
+
+    assert list(variables) == ids
+    assert all(list(scope_variables) == ['a'] for scope_variables in variables.values())
+    assert len(engine.queries) > 1
+    queried = [params['executionIdIn'].split(',') for _, params in engine.queries]
+    assert sorted(id_ for chunk in queried for id_ in chunk) == ids
+    for url, params in engine.queries:
+        prepared = pycamunda.variable.requests.Request('GET', url, params=params).prepare()
+        assert len(prepared.url) <= 500
+
+
+def test_load_variables_pages_queries(engine_url):
+    engine = FakeEngine([
+        variable_json(f'var{i}', id_) for id_ in ('instance1', 'instance2') for i in range(25)
+    ])
+    with unittest.mock.patch('requests.Session.request', side_effect=engine):
+        variables = pycamunda.variable.load_variables(
+            engine_url, ['instance1', 'instance2'], page_size=10
+        )
+
+    assert [len(scope_variables) for scope_variables in variables.values()] == [25, 25]
+    assert [(params['firstResult'], params['maxResults']) for _, params in engine.queries] == [
+        (first_result, 10) for first_result in range(0, 60, 10)
+    ]
+
+
+def test_load_variables_raises_for_invalid_page_size(engine_url):
+    with pytest.raises(ValueError):
+        pycamunda.variable.load_variables(engine_url, ['anId'], page_size=0)
+
+
+def test_load_variables_without_ids_sends_no_query(engine_url):
+    with unittest.mock.patch('requests.Session.request') as mock:
+        assert pycamunda.variable.load_variables(engine_url, []) == {}
+
+    assert not mock.called
+
+
+def test_load_variables_raises_for_unknown_scope(engine_url):
+    with pytest.raises(ValueError):
+        pycamunda.variable.load_variables(engine_url, ['anId'], scope='case_instance')
+
+
+@unittest.mock.patch('requests.Session.request', raise_requests_exception_mock)
+def test_load_variables_raises_exception_of_failed_query(engine_url):
+    with pytest.raises(pycamunda.PyCamundaException):
+        pycamunda.variable.load_variables(engine_url, ['anId'])
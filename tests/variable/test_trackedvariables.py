@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import pycamunda.externaltask
+import pycamunda.processinst
+import pycamunda.task
+import pycamunda.variable
+from pycamunda.variable import Variable, TrackedVariables
+
+
+@pytest.fixture
+def tracked():
+    return TrackedVariables({
+        'aJson': Variable(value='{"aKey": 1}', type_='Json', value_info={}),
+        'aString': Variable(value='aVal', type_='String', value_info={}),
+        'anObject': Variable(
+            value={'aKey': [1]}, type_='Object',
+            value_info={'serializationDataFormat': 'application/json'}
+        )
+    })
+
+
+def test_trackedvariables_behaves_like_a_mapping(tracked):
+    assert len(tracked) == 3
+    assert list(tracked) == ['aJson', 'aString', 'anObject']
+    assert tracked['aString'].value == 'aVal'
+
+
+def test_trackedvariables_nothing_changed(tracked):
+    tracked['aJson'].typed_value
+    tracked['aString'].value = ''.join(['a', 'Val'])
+
+    assert tracked.changed() == {}
+    assert tracked.deleted() == []
+
+
+def test_trackedvariables_changed(tracked):
+    tracked['aString'].value = 'anotherVal'
+    tracked['aNewVar'] = 1
+    tracked.set('anotherNewVar', '2021-01-01T00:00:00.000+0000', type_='Date')
+
+    assert tracked.changed() == {
+        'aString': Variable(value='anotherVal', type_='String', value_info={}),
+        'aNewVar': Variable(value=1, type_=None, value_info=None),
+        'anotherNewVar': Variable(
+            value='2021-01-01T00:00:00.000+0000', type_='Date', value_info=None
+        )
+    }
+
+
+def test_trackedvariables_type_and_value_info_changed(tracked):
+    tracked['aString'].type_ = 'Json'
+    tracked['aJson'].value_info = {'aKey': 'aVal'}
+
+    assert set(tracked.changed()) == {'aString', 'aJson'}
+
+
+def test_trackedvariables_value_modified_in_place(tracked):
+    tracked['anObject'].value['aKey'].append(2)
+
+    assert tracked.changed() == {
+        'anObject': Variable(
+            value={'aKey': [1, 2]}, type_='Object',
+            value_info={'serializationDataFormat': 'application/json'}
+        )
+    }
+
+
+def test_trackedvariables_typed_value_modified_in_place(tracked):
+    tracked['aJson'].typed_value['aKey'] = 2
+
+    assert tracked.changed() == {
+        'aJson': Variable(value='{"aKey": 2}', type_='Json', value_info={})
+    }
+
+
+def test_trackedvariables_deleted(tracked):
+    del tracked['aString']
+    tracked['aNewVar'] = 1
+    del tracked['aNewVar']
+
+    assert tracked.deleted() == ['aString']
+    assert tracked.changed() == {}
+
+
+def test_trackedvariables_deleted_and_set_again(tracked):
+    del tracked['aString']
+    tracked['aString'] = 'aVal'
+
+    assert tracked.deleted() == []
+    assert set(tracked.changed()) == {'aString'}
+
+
+def test_trackedvariables_apply_to_variablesmodify(engine_url, tracked):
+    tracked['aString'].value = 'anotherVal'
+    del tracked['aJson']
+    modify = pycamunda.processinst.VariablesModify(
+        engine_url, 'anId', deletions=['anotherVar']
+    )
+
+    assert tracked.apply_to(modify) is modify
+    assert modify.body_parameters() == {
+        'modifications': {'aString': {'value': 'anotherVal', 'type': 'String', 'valueInfo': {}}},
+        'deletions': ['anotherVar', 'aJson']
+    }
+
+
+def test_trackedvariables_apply_to_keeps_single_deletion(engine_url, tracked):
+    del tracked['aJson']
+    modify = pycamunda.processinst.VariablesModify(engine_url, 'anId', deletions='anotherVar')
+
+    tracked.apply_to(modify)
+
+    assert modify.body_parameters()['deletions'] == ['anotherVar', 'aJson']
+
+
+def test_trackedvariables_apply_to_localvariablesmodify(engine_url, tracked):
+    del tracked['aJson']
+    modify = tracked.apply_to(pycamunda.task.LocalVariablesModify(engine_url, 'anId'))
+
+    assert modify.body_parameters() == {'modifications': {}, 'deletions': ['aJson']}
+
+
+def test_trackedvariables_apply_to_complete(engine_url, tracked):
+    tracked['aString'].value = 'anotherVal'
+    complete = pycamunda.externaltask.Complete(engine_url, 'anId', 'aWorkerId')
+
+    tracked.apply_to(complete)
+
+    assert complete.variables == {
+        'aString': {'value': 'anotherVal', 'type': 'String', 'valueInfo': {}}
+    }
+
+
+def test_trackedvariables_apply_to_complete_raises_for_deletions(engine_url, tracked):
+    del tracked['aString']
+    complete = pycamunda.externaltask.Complete(engine_url, 'anId', 'aWorkerId')
+
+    with pytest.raises(ValueError):
+        tracked.apply_to(complete)
+    assert complete.variables == {}
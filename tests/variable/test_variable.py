@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import datetime as dt
+import pickle
+import unittest.mock
+
 import pytest
 
 import pycamunda.variable
@@ -23,3 +27,62 @@ def test_variable_load_raises_keyerror():
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.variable.Variable.load(data=json_)
+
+
+@pytest.mark.parametrize('type_, value, value_info, expected', [
+    ('Json', '{"aKey": [1, 2]}', {}, {'aKey': [1, 2]}),
+    ('Object', '{"aKey": 1}', {'serializationDataFormat': 'application/json'}, {'aKey': 1}),
+    ('Object', '<aKey/>', {'serializationDataFormat': 'application/xml'}, '<aKey/>'),
+    ('Object', {'aKey': 1}, {'serializationDataFormat': 'application/json'}, {'aKey': 1}),
+    (
+        'Date', '2021-01-01T10:00:00.000+0100', {},
+        dt.datetime(2021, 1, 1, 10, tzinfo=dt.timezone(dt.timedelta(hours=1)))
+    ),
+    ('String', '{"aKey": 1}', {}, '{"aKey": 1}'),
+    ('Json', None, {}, None),
+])
+def test_variable_typed_value(type_, value, value_info, expected):
+    variable = pycamunda.variable.Variable(value=value, type_=type_, value_info=value_info)
+
+    assert variable.typed_value == expected
+    assert variable.value == value
+
+
+def test_variable_typed_value_is_cached():
+    variable = pycamunda.variable.Variable(value='{"aKey": 1}', type_='Json', value_info={})
+
+    with unittest.mock.patch('pycamunda.variable.loads_json', return_value={}) as loads_mock:
+        assert variable.typed_value is variable.typed_value
+
+    assert loads_mock.call_count == 1
+
+
+def test_variable_typed_value_follows_value():
+    variable = pycamunda.variable.Variable(value='{"aKey": 1}', type_='Json', value_info={})
+    assert variable.typed_value == {'aKey': 1}
+
+    variable.value = '[1, 2]'
+
+    assert variable.typed_value == [1, 2]
+
+
+def test_variable_typed_value_cache_is_no_field():
+    variable = pycamunda.variable.Variable(value='{"aKey": 1}', type_='Json', value_info={})
+    other = pycamunda.variable.Variable(value='{"aKey": 1}', type_='Json', value_info={})
+    variable.typed_value
+
+    assert variable == other
+    assert repr(variable) == repr(other)
+    assert pickle.loads(pickle.dumps(variable)).typed_value == {'aKey': 1}
+    assert not hasattr(variable, '__dict__')
+
+
+@pytest.mark.parametrize('orjson', [pycamunda.variable.orjson, None])
+def test_loads_json(orjson):
+    with unittest.mock.patch('pycamunda.variable.orjson', orjson):
+        assert pycamunda.variable.loads_json('{"aKey": [1, 2.5, null]}') == {
+            'aKey': [1, 2.5, None]
+        }
+        assert pycamunda.variable.loads_json(str(2 ** 70)) == 2 ** 70
+        with pytest.raises(ValueError):
+            pycamunda.variable.loads_json('{')
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
+
 import pytest
 
 import pycamunda.variable
@@ -29,3 +31,23 @@ def test_variableinstance_load_raises_keyerror(my_variableinstance_json):
         del json_[key]
         with pytest.raises(KeyError):
             pycamunda.variable.VariableInstance.load(data=json_)
+
+
+def test_variableinstance_view_equals_load(my_variableinstance_json):
+    variableinstance = pycamunda.variable.VariableInstance.load(my_variableinstance_json)
+    view = pycamunda.variable._VariableInstanceView(my_variableinstance_json)
+
+    assert isinstance(view, pycamunda.variable.VariableInstance)
+    assert dataclasses.asdict(view) == dataclasses.asdict(variableinstance)
+
+
+def test_variableinstance_typed_value(my_variableinstance_json):
+    my_variableinstance_json['type'] = 'Json'
+    my_variableinstance_json['value'] = '{"aKey": 1}'
+
+    variable_instance = pycamunda.variable.VariableInstance.load(my_variableinstance_json)
+    view = pycamunda.variable._VariableInstanceView(my_variableinstance_json)
+
+    assert variable_instance.typed_value == {'aKey': 1}
+    assert view.typed_value == {'aKey': 1}
+    assert view.value == '{"aKey": 1}'
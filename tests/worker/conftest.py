@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import contextlib
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+import pycamunda.worker
+
+
+def external_task_json(id_, topic='aTopic', retries=None, priority=0, lock_expiration=None):
+    return {
+        'activityId': 'anActivityId',
+        'activityInstanceId': 'anActivityInstanceId',
+        'errorMessage': None,
+        'executionId': 'anExecutionId',
+        'id': id_,
+        'processDefinitionId': 'aProcessDefinitionId',
+        'processDefinitionKey': 'aProcessDefinitionKey',
+        'processInstanceId': 'aProcessInstanceId',
+        'tenantId': None,
+        'retries': retries,
+        'workerId': 'aWorkerId',
+        'priority': priority,
+        'topicName': topic,
+        'lockExpirationTime': lock_expiration,
+        'suspended': False,
+        'businessKey': None,
+        'variables': {'aVar': {'value': 'aVal', 'type': 'String', 'valueInfo': {}}}
+    }
+
+
+class FakeEngine:
+    """Replacement of `requests.Session.request` that serves external tasks from a queue and
+    records all other requests. A hook registered for an action is called before the request is
+    recorded. It may block, raise or return a response to use instead."""
+
+    def __init__(self, tasks=(), poll_delay=0.005):
+        self.tasks = collections.deque(tasks)
+        self.poll_delay = poll_delay
+        self.fetches = []
+        self.requests = collections.defaultdict(list)
+        self.fail_fetches = 0
+        self.hooks = {}
+        self.lock = threading.Lock()
+
+    def add_tasks(self, tasks):
+        with self.lock:
+            self.tasks.extend(tasks)
+
+    def response(self, json_=None, status_code=200):
+        response = unittest.mock.MagicMock()
+        response.ok = status_code < 400
+        response.__bool__.return_value = response.ok
+        response.status_code = status_code
+        response.json.return_value = json_
+        response.text = ''
+        return response
+
+    def __call__(self, method, url, json=None, **kwargs):
+        action = url.rsplit('/', 1)[-1]
+        if action == 'fetchAndLock':
+            with self.lock:
+                self.fetches.append(json)
+                if self.fail_fetches:
+                    self.fail_fetches -= 1
+                    return self.response({'message': 'an error'}, status_code=500)
+                topics = {topic['topicName'] for topic in json['topics']}
+                tasks = [task for task in self.tasks if task['topicName'] in topics]
+                tasks = tasks[:json['maxTasks']]
+                for task in tasks:
+                    self.tasks.remove(task)
+            if not tasks:
+                time.sleep(self.poll_delay)
+            return self.response(tasks)
+        id_ = url.rsplit('/', 2)[-2]
+        if action in self.hooks:
+            response = self.hooks[action](id_, json)
+            if response is not None:
+                return response
+        with self.lock:
+            self.requests[action].append((id_, json))
+        return self.response()
+
+    def wait_for(self, action, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if len(self.requests[action]) >= count:
+                    return self.requests[action]
+            time.sleep(0.001)
+        raise AssertionError(f'{count} {action} requests expected, got {self.requests[action]}')
+
+
+@pytest.fixture
+def engine():
+    engine = FakeEngine()
+    with unittest.mock.patch('requests.Session.request', side_effect=engine):
+        yield engine
+
+
+@pytest.fixture
+def running():
+
+    @contextlib.contextmanager
+    def running(worker):
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        try:
+            yield worker
+        finally:
+            worker.stop()
+            thread.join(timeout=5.0)
+            assert not thread.is_alive()
+
+    return running
+
+
+@pytest.fixture
+def worker(engine_url):
+    return pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=4, async_response_timeout=100
+    )
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+pytest.importorskip('aiohttp')
+
+
+@pytest.fixture
+def async_engine(engine):
+
+    async def request(self, method, url, auth=None, **kwargs):
+        return engine(method=method, url=url, **kwargs)
+
+    with unittest.mock.patch('pycamunda.aio.AsyncClient.request', request):
+        yield engine
+
+
+@pytest.fixture
+def async_worker(engine_url):
+    return pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', async_response_timeout=100
+    )
+
+
+async def run_until(worker, engine, action, count):
+    run = asyncio.ensure_future(worker.run())
+    try:
+        for _ in range(5000):
+            if len(engine.requests[action]) >= count:
+                break
+            await asyncio.sleep(0.001)
+    finally:
+        worker.stop()
+        await asyncio.wait_for(run, timeout=5.0)
+    return engine.requests[action]
+
+
+def test_max_concurrency_must_be_positive(engine_url):
+    with pytest.raises(ValueError):
+        pycamunda.worker.AsyncWorker(url=engine_url, worker_id='aWorkerId', max_concurrency=0)
+
+
+def test_subscribe_sets_concurrency(async_worker):
+    async_worker.subscribe('aTopic', lambda task: None)
+    async_worker.subscribe('anotherTopic', lambda task: None, max_concurrency=5)
+
+    assert async_worker.concurrency == {'aTopic': 100, 'anotherTopic': 5}
+
+
+def test_run_raises_without_subscription(async_worker):
+    with pytest.raises(ValueError):
+        asyncio.run(async_worker.run())
+
+
+def test_asyncworker_completes_tasks(async_engine, async_worker):
+    async_engine.add_tasks(external_task_json(f'task{i}') for i in range(10))
+
+    async def handler(task):
+        await asyncio.sleep(0)
+        return {'result': task.id_}
+
+    async_worker.subscribe('aTopic', handler)
+    completed = asyncio.run(run_until(async_worker, async_engine, 'complete', 10))
+
+    assert sorted(id_ for id_, _ in completed) == sorted(f'task{i}' for i in range(10))
+    for id_, body in completed:
+        assert body['variables'] == {'result': {'value': id_, 'type': None, 'valueInfo': None}}
+    assert all(fetch['asyncResponseTimeout'] == 100 for fetch in async_engine.fetches)
+
+
+def test_asyncworker_reports_errors(async_engine, async_worker):
+    async_engine.add_tasks([external_task_json('task1', 'a'), external_task_json('task2', 'b')])
+
+    async def bpmn_error(task):
+        raise pycamunda.worker.BPMNError('anErrorCode')
+
+    async def failure(task):
+        raise RuntimeError('anErrorMessage')
+
+    async_worker.subscribe('a', bpmn_error)
+    async_worker.subscribe('b', failure)
+    asyncio.run(run_until(async_worker, async_engine, 'failure', 1))
+
+    assert async_engine.requests['bpmnError'][0][0] == 'task1'
+    assert async_engine.requests['failure'][0][0] == 'task2'
+    assert async_engine.requests['failure'][0][1]['retries'] == 3
+
+
+def test_asyncworker_handles_tasks_concurrently(async_engine, async_worker):
+    async_engine.add_tasks(external_task_json(f'task{i}') for i in range(50))
+    running, peak = 0, 0
+
+    async def handler(task):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    async_worker.subscribe('aTopic', handler, max_concurrency=20)
+    asyncio.run(run_until(async_worker, async_engine, 'complete', 50))
+
+    assert peak == 20
+    assert all(fetch['maxTasks'] <= 20 for fetch in async_engine.fetches)
+
+
+def test_asyncworker_fetches_only_topics_with_capacity(async_engine, async_worker):
+    async_engine.add_tasks(external_task_json(f'task{i}', 'slow') for i in range(2))
+    release = None
+
+    async def slow(task):
+        await release.wait()
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        run = asyncio.ensure_future(async_worker.run())
+        while async_worker._running['slow'] < 2:
+            await asyncio.sleep(0.001)
+        fetches = len(async_engine.fetches)
+        while len(async_engine.fetches) < fetches + 2:
+            await asyncio.sleep(0.001)
+        release.set()
+        async_worker.stop()
+        await asyncio.wait_for(run, timeout=5.0)
+
+    async_worker.subscribe('slow', slow, max_concurrency=2)
+    async_worker.subscribe('fast', lambda task: None)
+    asyncio.run(run())
+
+    topics = [[topic['topicName'] for topic in fetch['topics']] for fetch in async_engine.fetches]
+    assert topics[0] == ['slow', 'fast']
+    assert topics[-1] == ['fast']
+    assert len(async_engine.requests['complete']) == 2
+
+
+def test_asyncworker_stop_cancels_long_poll(engine_url):
+    worker = pycamunda.worker.AsyncWorker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe('aTopic', lambda task: None)
+    polling = None
+
+    async def request(self, method, url, auth=None, **kwargs):
+        polling.set()
+        await asyncio.sleep(60)
+
+    async def run():
+        nonlocal polling
+        polling = asyncio.Event()
+        run = asyncio.ensure_future(worker.run())
+        await polling.wait()
+        worker.stop()
+        await asyncio.wait_for(run, timeout=1.0)
+
+    with unittest.mock.patch('pycamunda.aio.AsyncClient.request', request):
+        asyncio.run(run())
+
+
+def test_asyncworker_extends_locks_of_long_running_handlers(async_engine, async_worker):
+    async_engine.add_tasks([external_task_json('task1')])
+
+    async def handler(task):
+        await asyncio.sleep(0.3)
+
+    async_worker.subscribe('aTopic', handler, lock_duration=150)
+    asyncio.run(run_until(async_worker, async_engine, 'complete', 1))
+
+    extensions = async_engine.requests['extendLock']
+    assert extensions
+    assert all(
+        (id_, body) == ('task1', {'newDuration': 150, 'workerId': 'aWorkerId'})
+        for id_, body in extensions
+    )
+
+
+def test_asyncworker_retries_reports_without_response(async_engine, async_worker, monkeypatch):
+    monkeypatch.setattr(pycamunda.worker, '_REPORT_BACKOFF', 0.0)
+    async_engine.add_tasks([external_task_json('task1')])
+    failures = [pycamunda.PyCamundaException('Connection reset by peer')]
+
+    def complete(id_, body):
+        if failures:
+            raise failures.pop()
+
+    async_engine.hooks['complete'] = complete
+    async_worker.subscribe('aTopic', lambda task: None)
+    completed = asyncio.run(run_until(async_worker, async_engine, 'complete', 1))
+
+    assert [id_ for id_, _ in completed] == ['task1']
+    assert not failures
+
+
+def test_asyncworker_retries_reports_with_server_error(async_engine, async_worker, monkeypatch):
+    monkeypatch.setattr(pycamunda.worker, '_REPORT_BACKOFF', 0.0)
+    async_engine.add_tasks([external_task_json('task1')])
+    statuses = [503]
+
+    def complete(id_, body):
+        if statuses:
+            return async_engine.response({'message': 'an error'}, status_code=statuses.pop())
+
+    async_engine.hooks['complete'] = complete
+    async_worker.subscribe('aTopic', lambda task: None)
+    completed = asyncio.run(run_until(async_worker, async_engine, 'complete', 1))
+
+    assert [id_ for id_, _ in completed] == ['task1']
+    assert not statuses
+
+
+def test_asyncworker_cancels_and_unlocks_handlers_running_after_timeout(
+    async_engine, async_worker
+):
+    async_engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+    cancelled = []
+
+    async def handler(task):
+        if task.id_ == 'task1':
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append(task.id_)
+                raise
+
+    async def main():
+        run = asyncio.ensure_future(async_worker.run())
+        for _ in range(5000):
+            if async_engine.requests['complete']:
+                break
+            await asyncio.sleep(0.001)
+        async_worker.stop(timeout=0.05)
+        await asyncio.wait_for(run, timeout=5.0)
+
+    async_worker.subscribe('aTopic', handler)
+    asyncio.run(main())
+
+    assert cancelled == ['task1']
+    assert [id_ for id_, _ in async_engine.requests['complete']] == ['task2']
+    assert [id_ for id_, _ in async_engine.requests['unlock']] == ['task1']
+
+
+def test_asyncworker_records_metrics(async_engine, async_worker):
+    async_engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+
+    async def handler(task):
+        await asyncio.sleep(0)
+
+    async_worker.subscribe('aTopic', handler)
+    asyncio.run(run_until(async_worker, async_engine, 'complete', 2))
+    snapshot = async_worker.metrics.snapshot()
+
+    assert snapshot.histogram('fetched_tasks').sum == 2
+    assert snapshot.histogram('queue_wait_seconds', topic='aTopic').count == 2
+    assert snapshot.histogram('handler_seconds', topic='aTopic').count == 2
+    assert snapshot.counter('handled_tasks_total', outcome='completed') == 2
+    assert snapshot.histogram('completion_seconds', topic='aTopic').count == 2
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+
+def test_all_contains_only_valid_names():
+    import pycamunda.worker
+
+    for name in pycamunda.worker.__all__:
+        getattr(pycamunda.worker, name)
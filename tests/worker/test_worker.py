@@ -0,0 +1,559 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import threading
+
+import pytest
+import requests
+
+import pycamunda.externaltask
+import pycamunda.variable
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def process_handler(task):
+    if task.id_ == 'bpmnError':
+        raise pycamunda.worker.BPMNError('anErrorCode', variables={'aVar': task.topic_name})
+    if task.id_ == 'failure':
+        raise RuntimeError('anErrorMessage')
+    return {'pid': os.getpid(), 'var': task.variables['aVar'].value}
+
+
+def test_subscribe(worker):
+    handler = lambda task: None
+    subscription = worker.subscribe('aTopic', handler, lock_duration=1000, variables=['aVar'])
+
+    assert subscription == pycamunda.worker.Subscription(
+        topic='aTopic', handler=handler, lock_duration=1000, variables=['aVar']
+    )
+    assert worker.subscriptions == {'aTopic': subscription}
+
+
+def test_fetch_request(worker):
+    worker.subscribe('aTopic', lambda task: None, lock_duration=1000, variables=['aVar'])
+    worker.subscribe('anotherTopic', lambda task: None, deserialize_values=True)
+    fetch_and_lock = worker._fetch_request(max_tasks=3)
+
+    assert fetch_and_lock.body_parameters() == {
+        'workerId': 'aWorkerId',
+        'maxTasks': 3,
+        'usePriority': False,
+        'asyncResponseTimeout': 100,
+        'topics': [
+            {
+                'topicName': 'aTopic',
+                'lockDuration': 1000,
+                'deserializeValues': False,
+                'variables': ['aVar']
+            },
+            {'topicName': 'anotherTopic', 'lockDuration': 30000, 'deserializeValues': True}
+        ]
+    }
+
+
+def test_run_raises_without_subscription(worker):
+    with pytest.raises(ValueError):
+        worker.run()
+
+
+def test_max_workers_must_be_positive(engine_url):
+    with pytest.raises(ValueError):
+        pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_workers=0)
+
+
+def test_worker_completes_tasks(engine, worker, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(10))
+    worker.subscribe('aTopic', lambda task: {
+        'result': task.id_,
+        'typed': pycamunda.variable.Variable(value=1, type_='Integer', value_info={})
+    })
+
+    with running(worker):
+        completed = engine.wait_for('complete', 10)
+
+    assert sorted(id_ for id_, _ in completed) == sorted(f'task{i}' for i in range(10))
+    for id_, body in completed:
+        assert body['workerId'] == 'aWorkerId'
+        assert body['variables'] == {
+            'result': {'value': id_, 'type': None, 'valueInfo': None},
+            'typed': {'value': 1, 'type': 'Integer', 'valueInfo': {}}
+        }
+
+
+def test_worker_dispatches_by_topic(engine, worker, running):
+    engine.add_tasks([external_task_json('task1', topic='a'), external_task_json('task2', 'b')])
+    worker.subscribe('a', lambda task: {'handler': 'a'})
+    worker.subscribe('b', lambda task: {'handler': 'b'})
+
+    with running(worker):
+        completed = dict(engine.wait_for('complete', 2))
+
+    assert completed['task1']['variables']['handler']['value'] == 'a'
+    assert completed['task2']['variables']['handler']['value'] == 'b'
+
+
+def test_worker_reports_bpmn_error(engine, worker, running):
+    engine.add_tasks([external_task_json('task1')])
+
+    def handler(task):
+        raise pycamunda.worker.BPMNError('anErrorCode', 'anErrorMessage', {'aVar': 'aVal'})
+
+    worker.subscribe('aTopic', handler)
+    with running(worker):
+        (id_, body), = engine.wait_for('bpmnError', 1)
+
+    assert id_ == 'task1'
+    assert body['errorCode'] == 'anErrorCode'
+    assert body['errorMessage'] == 'anErrorMessage'
+    assert body['variables'] == {'aVar': {'value': 'aVal', 'type': None, 'valueInfo': None}}
+    assert not engine.requests['complete']
+
+
+@pytest.mark.parametrize('task_retries, retries', [(None, 3), (2, 1), (0, 0)])
+def test_worker_reports_failure(engine, worker, running, task_retries, retries):
+    engine.add_tasks([external_task_json('task1', retries=task_retries)])
+
+    def handler(task):
+        raise RuntimeError('anErrorMessage')
+
+    worker.subscribe('aTopic', handler)
+    with running(worker):
+        (id_, body), = engine.wait_for('failure', 1)
+
+    assert id_ == 'task1'
+    assert body['errorMessage'] == 'anErrorMessage'
+    assert 'RuntimeError' in body['errorDetails']
+    assert body['retries'] == retries
+    assert body['retryTimeout'] == 10000
+
+
+def test_worker_runs_handlers_concurrently(engine, worker, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(4))
+    barrier = threading.Barrier(4, timeout=5.0)
+    worker.subscribe('aTopic', lambda task: barrier.wait() and None)
+
+    with running(worker):
+        engine.wait_for('complete', 4)
+
+    assert not engine.requests['failure']
+
+
+def test_worker_fetches_only_free_capacity(engine, worker, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(6))
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def handler(task):
+        started.release()
+        release.wait(timeout=5.0)
+
+    worker.subscribe('aTopic', handler)
+    with running(worker):
+        for _ in range(4):
+            assert started.acquire(timeout=5.0)
+        fetches = len(engine.fetches)
+        assert not started.acquire(timeout=0.05)
+        assert len(engine.fetches) == fetches
+        release.set()
+        engine.wait_for('complete', 6)
+
+    assert engine.fetches[0]['maxTasks'] == 4
+    assert all(fetch['maxTasks'] <= 4 for fetch in engine.fetches[:fetches])
+    assert all(fetch['asyncResponseTimeout'] == 100 for fetch in engine.fetches)
+
+
+def test_worker_polls_again_after_failed_fetch(engine, engine_url, running):
+    engine.fail_fetches = 1
+    engine.add_tasks([external_task_json('task1')])
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', poll_interval=0.01)
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+
+    assert len(engine.fetches) >= 2
+
+
+def test_bpmnerror_is_picklable():
+    error = pycamunda.worker.BPMNError('anErrorCode', 'anErrorMessage', {'aVar': 'aVal'})
+    unpickled = pickle.loads(pickle.dumps(error))
+
+    assert unpickled.error_code == 'anErrorCode'
+    assert unpickled.error_message == 'anErrorMessage'
+    assert unpickled.variables == {'aVar': 'aVal'}
+
+
+def test_worker_runs_handlers_in_processes(engine, engine_url, running):
+    engine.add_tasks([
+        external_task_json('task1', 'cpu'),
+        external_task_json('bpmnError', 'cpu'),
+        external_task_json('failure', 'cpu'),
+        external_task_json('task2', 'io')
+    ])
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_processes=1)
+    subscription = worker.subscribe('cpu', process_handler, use_processes=True)
+    worker.subscribe('io', process_handler)
+
+    with running(worker):
+        completed = dict(engine.wait_for('complete', 2))
+        (_, bpmn_error), = engine.wait_for('bpmnError', 1)
+        (_, failure), = engine.wait_for('failure', 1)
+
+    assert subscription.use_processes
+    assert completed['task1']['variables']['pid']['value'] != os.getpid()
+    assert completed['task1']['variables']['var']['value'] == 'aVal'
+    assert completed['task2']['variables']['pid']['value'] == os.getpid()
+    assert bpmn_error['variables'] == {'aVar': {'value': 'cpu', 'type': None, 'valueInfo': None}}
+    assert 'RuntimeError: anErrorMessage' in failure['errorDetails']
+
+
+def test_lock_tracker_groups_locks_that_expire_soon():
+    locks = pycamunda.worker._LockTracker()
+    locks.track('task1', 3000, locked_at=0.0)
+    locks.track('task2', 3000, locked_at=0.5)
+    locks.track('task3', 3000, locked_at=1.5)
+
+    assert locks.next_due() == 2.0
+    assert locks.due(1.9) == []
+    assert [lock.task_id for lock in locks.due(2.0)] == ['task1', 'task2']
+
+    locks.extended('task1', sent_at=2.0)
+    locks.extended('task2', sent_at=2.0)
+    assert locks.next_due() == 3.5
+
+
+def test_lock_tracker_retries_failed_extensions():
+    locks = pycamunda.worker._LockTracker()
+    locks.track('task1', 3000, locked_at=0.0)
+
+    assert locks.failed('task1', now=2.0)
+    assert locks.next_due() == 2.5
+    assert locks.failed('task1', now=3.0)
+    assert len(locks) == 0
+    assert not locks.failed('task1', now=3.0)
+
+    locks.track('task2', 3000, locked_at=0.0)
+    locks.untrack('task2')
+    assert locks.next_due() is None
+
+
+def test_worker_extends_locks_of_long_running_handlers(engine, worker, running):
+    engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+    release = threading.Event()
+    worker.subscribe('aTopic', lambda task: release.wait(timeout=5.0) and None, lock_duration=150)
+
+    with running(worker):
+        extensions = engine.wait_for('extendLock', 4)
+        release.set()
+        engine.wait_for('complete', 2)
+
+    assert {id_ for id_, _ in extensions} == {'task1', 'task2'}
+    assert all(body == {'newDuration': 150, 'workerId': 'aWorkerId'} for _, body in extensions)
+
+
+def test_worker_does_not_extend_locks_if_disabled(engine, engine_url, running):
+    engine.add_tasks([external_task_json('task1')])
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', extend_locks=False)
+    worker.subscribe('aTopic', lambda task: threading.Event().wait(0.2) and None, lock_duration=60)
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+
+    assert not engine.requests['extendLock']
+
+
+@pytest.mark.parametrize('latency, max_queued', [(None, 0), (0.1, 4), (1.0, 2), (2.5, 0)])
+def test_max_queued_follows_handler_latency(worker, latency, max_queued):
+    worker.subscribe('aTopic', lambda task: None, lock_duration=1000)
+    worker.subscribe('anotherTopic', lambda task: None, lock_duration=30000)
+    worker.handler_latency = latency
+
+    assert worker._max_queued() == max_queued
+
+
+def test_observe_latency_averages(worker):
+    worker._observe_latency(1.0)
+    assert worker.handler_latency == 1.0
+    worker._observe_latency(2.0)
+    assert worker.handler_latency == pytest.approx(1.2)
+
+
+def test_worker_fetches_ahead_for_fast_handlers(engine, engine_url, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(20))
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=2, async_response_timeout=100
+    )
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        engine.wait_for('complete', 20)
+
+    assert worker.handler_latency is not None
+    assert engine.fetches[0]['maxTasks'] == 2
+    assert max(fetch['maxTasks'] for fetch in engine.fetches) > 2
+
+
+def test_worker_fetches_at_most_max_tasks(engine, engine_url, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(10))
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=4, max_tasks=3
+    )
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        engine.wait_for('complete', 10)
+
+    assert all(fetch['maxTasks'] <= 3 for fetch in engine.fetches)
+
+
+def test_worker_handles_tasks_while_reports_are_pending(engine, engine_url, running):
+    engine.add_tasks(external_task_json(f'task{i}') for i in range(5))
+    release = threading.Event()
+    engine.hooks['complete'] = lambda id_, body: release.wait(timeout=5.0) and None
+    handled = []
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=1, report_threads=1,
+        max_pending_reports=1
+    )
+    worker.subscribe('aTopic', lambda task: handled.append(task.id_))
+
+    with running(worker):
+        for _ in range(500):
+            if len(handled) == 3:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        assert len(handled) == 3
+        assert not engine.requests['complete']
+        release.set()
+        engine.wait_for('complete', 5)
+
+
+def test_worker_retries_reports_without_response(engine, worker, running, monkeypatch):
+    monkeypatch.setattr(pycamunda.worker, '_REPORT_BACKOFF', 0.0)
+    engine.add_tasks([external_task_json('task1')])
+    failures = [requests.exceptions.ConnectionError(), requests.exceptions.Timeout()]
+
+    def complete(id_, body):
+        if failures:
+            raise failures.pop()
+
+    engine.hooks['complete'] = complete
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        (id_, _), = engine.wait_for('complete', 1)
+
+    assert id_ == 'task1'
+    assert not failures
+
+
+def test_worker_does_not_retry_rejected_reports(engine, worker, running, monkeypatch):
+    monkeypatch.setattr(pycamunda.worker, '_REPORT_BACKOFF', 0.0)
+    engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+    attempts = []
+
+    def complete(id_, body):
+        attempts.append(id_)
+        if id_ == 'task1':
+            return engine.response({'message': 'an error'}, status_code=404)
+
+    engine.hooks['complete'] = complete
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+
+    assert sorted(attempts) == ['task1', 'task2']
+
+
+def test_worker_retries_reports_with_server_error(engine, worker, running, monkeypatch):
+    monkeypatch.setattr(pycamunda.worker, '_REPORT_BACKOFF', 0.0)
+    engine.add_tasks([external_task_json('task1')])
+    statuses = [503, 204]
+    completed = threading.Event()
+
+    def complete(id_, body):
+        status = statuses.pop(0)
+        if status == 204:
+            completed.set()
+        return engine.response({'message': 'Service Unavailable'}, status_code=status)
+
+    engine.hooks['complete'] = complete
+    worker.subscribe('aTopic', lambda task: None)
+
+    with running(worker):
+        assert completed.wait(timeout=5.0)
+
+    assert not statuses
+    assert worker.metrics.snapshot().counter('failed_reports_total') == 0
+
+
+def test_report_threads_must_be_positive(engine_url):
+    with pytest.raises(ValueError):
+        pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', report_threads=0)
+
+
+def test_worker_unlocks_tasks_fetched_ahead_on_stop(engine, engine_url, running):
+    engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+    started, release = threading.Event(), threading.Event()
+
+    def handler(task):
+        started.set()
+        release.wait(timeout=5.0)
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_workers=1)
+    worker.subscribe('aTopic', handler)
+    worker.handler_latency = 0.001
+
+    with running(worker):
+        assert started.wait(timeout=5.0)
+        worker.stop()
+        release.set()
+
+    assert engine.fetches[0]['maxTasks'] == 2
+    assert [id_ for id_, _ in engine.requests['complete']] == ['task1']
+    assert [id_ for id_, _ in engine.requests['unlock']] == ['task2']
+
+
+def test_worker_unlocks_tasks_of_handlers_running_after_timeout(engine, worker, running):
+    engine.add_tasks([external_task_json('task1'), external_task_json('task2')])
+    release = threading.Event()
+    worker.subscribe(
+        'aTopic', lambda task: task.id_ == 'task1' and release.wait(timeout=5.0) and None
+    )
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+        worker.stop(timeout=0.05)
+    release.set()
+    threading.Event().wait(0.05)
+
+    assert [id_ for id_, _ in engine.requests['complete']] == ['task2']
+    assert [id_ for id_, _ in engine.requests['unlock']] == ['task1']
+
+
+def fair_queue(**subscriptions):
+    return pycamunda.worker._FairQueue({
+        topic: pycamunda.worker.Subscription(topic, lambda task: None, **kwargs)
+        for topic, kwargs in subscriptions.items()
+    })
+
+
+def queued_task(id_, topic, priority=0):
+    return pycamunda.externaltask.ExternalTask.load(
+        external_task_json(id_, topic, priority=priority)
+    )
+
+
+def test_fair_queue_shares_by_weight():
+    queue = fair_queue(busy={}, light={'weight': 2.0})
+    for i in range(6):
+        queue.push(queued_task(f'busy{i}', 'busy'))
+    for i in range(4):
+        queue.push(queued_task(f'light{i}', 'light'))
+
+    topics = [queue.pop().topic_name for _ in range(6)]
+
+    assert topics.count('light') == 4
+    assert topics.count('busy') == 2
+    assert len(queue) == 4
+
+
+def test_fair_queue_serves_higher_priority_topics_first():
+    queue = fair_queue(bulk={'weight': 10.0}, urgent={'priority': 1})
+    queue.push(queued_task('bulk1', 'bulk'))
+    queue.push(queued_task('bulk2', 'bulk'))
+    queue.push(queued_task('urgent1', 'urgent'))
+
+    assert [queue.pop().id_ for _ in range(3)] == ['urgent1', 'bulk1', 'bulk2']
+
+
+def test_fair_queue_orders_tasks_of_a_topic_by_priority():
+    queue = fair_queue(aTopic={})
+    queue.push(queued_task('low', 'aTopic', priority=1))
+    queue.push(queued_task('high', 'aTopic', priority=5))
+    queue.push(queued_task('alsoLow', 'aTopic', priority=1))
+
+    assert [queue.pop().id_ for _ in range(3)] == ['high', 'low', 'alsoLow']
+
+
+def test_fair_queue_does_not_save_up_share_of_idle_topics():
+    queue = fair_queue(a={}, b={})
+    queue.push(queued_task('a0', 'a'))
+    queue.pop()
+    for i in range(5):
+        queue.push(queued_task(f'b{i}', 'b'))
+    for _ in range(5):
+        queue.pop()
+    for i in range(5):
+        queue.push(queued_task(f'a{i + 1}', 'a'))
+        queue.push(queued_task(f'b{i + 5}', 'b'))
+
+    topics = [queue.pop().topic_name for _ in range(6)]
+
+    assert topics.count('a') == 4
+
+
+def test_subscribe_weight_must_be_positive(worker):
+    with pytest.raises(ValueError):
+        worker.subscribe('aTopic', lambda task: None, weight=0)
+
+
+
+def test_subscribe_sets_weight_and_priority(worker):
+    subscription = worker.subscribe('aTopic', lambda task: None, weight=2.0, priority=1)
+
+    assert subscription.weight == 2.0
+    assert subscription.priority == 1
+    assert worker._queue.subscriptions['aTopic'] is subscription
+
+
+def test_worker_records_metrics(engine, worker, running):
+    engine.add_tasks([external_task_json('task1', 'a'), external_task_json('task2', 'b')])
+    worker.subscribe('a', lambda task: None)
+    worker.subscribe('b', lambda task: 1 / 0)
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+        engine.wait_for('failure', 1)
+    snapshot = worker.metrics.snapshot()
+
+    assert snapshot.histogram('fetched_tasks').sum == 2
+    assert snapshot.counter('empty_polls_total') > 0
+    assert snapshot.histogram('fetch_seconds').count == len(engine.fetches)
+    assert snapshot.histogram('queue_wait_seconds').count == 2
+    assert snapshot.histogram('handler_seconds', topic='a').count == 1
+    assert snapshot.counter('handled_tasks_total', topic='a', outcome='completed') == 1
+    assert snapshot.counter('handled_tasks_total', topic='b', outcome='failure') == 1
+    assert snapshot.histogram('completion_seconds').count == 2
+    assert snapshot.counter('lock_expiry_misses_total') == 0
+
+
+def test_worker_records_lock_extensions_and_expiry_misses(engine, engine_url, running):
+    engine.add_tasks([external_task_json('task1', 'a'), external_task_json('task2', 'b')])
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', extend_locks=False)
+    worker.subscribe('a', lambda task: threading.Event().wait(0.1) and None, lock_duration=50)
+    worker.subscribe('b', lambda task: None)
+
+    with running(worker):
+        engine.wait_for('complete', 2)
+    snapshot = worker.metrics.snapshot()
+
+    assert snapshot.counter('lock_expiry_misses_total', topic='a') == 1
+    assert snapshot.counter('lock_expiry_misses_total', topic='b') == 0
+    assert snapshot.counter('lock_extensions_total') == 0
+
+
+def test_worker_counts_lock_extensions(engine, worker, running):
+    engine.add_tasks([external_task_json('task1')])
+    worker.subscribe('aTopic', lambda task: threading.Event().wait(0.3) and None, lock_duration=150)
+
+    with running(worker):
+        engine.wait_for('complete', 1)
+
+    assert worker.metrics.snapshot().counter('lock_extensions_total') == len(
+        engine.requests['extendLock']
+    ) > 0